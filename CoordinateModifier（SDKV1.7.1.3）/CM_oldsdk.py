@@ -17,6 +17,7 @@
 9. Strp - 拆解字符串数据到PR寄存器
 10. TFShift - 工具坐标系补正（基于视觉反馈）
 11. DecToHex - 从十进制转换为十六进制
+12. WarmUpStatus - 查询连接预热状态
 
 """
 
@@ -33,10 +34,25 @@ from Agilebot.IR.A.status_code import StatusCodeEnum
 from Agilebot.IR.A.sdk_types import CoordinateSystemType
 import copy
 import math
+import os
+import threading
+import time
 
 # 全局Arm对象，用于长连接
 _global_arm = None
 
+# 建立连接的锁：预热线程与首条指令可能同时进入__get_arm_connection，避免重复创建Arm连接
+_global_arm_lock = threading.Lock()
+
+# 当前连接缓存的PR寄存器模板（所有分量已清零）：{id(Arm对象): 模板}，重新连接时清空
+_pr_templates = {}
+
+# 是否在插件加载时预热连接（设置环境变量CM_WARMUP=1开启）
+_WARMUP_ENABLED = os.environ.get("CM_WARMUP", "0") == "1"
+
+# 连接预热状态：disabled/running/ready/failed
+_warmup_state = {"status": "disabled", "error": None, "elapsed": 0.0}
+
 # 明确指定导出的公开指令函数，隐藏私有辅助函数
 __all__ = [
     'SetTF',
@@ -49,7 +65,8 @@ __all__ = [
     'Decr',
     'Strp',
     'TFShift',
-    'DecToHex'
+    'DecToHex',
+    'WarmUpStatus'
 ]
 
 
@@ -194,6 +211,138 @@ class PrecisionTransform:
         return inv
 
 
+# PR寄存器编号属性名（id、registerIndex或index），首次设置编号时从SDK返回的PR寄存器对象上探测一次
+_pr_index_attr = None
+
+
+def __probe_pr_index_attr(pr_register):
+    """
+    获取PR寄存器对象的编号属性名
+
+    不同SDK版本中PR寄存器编号可能为id、registerIndex或index属性，
+    首次调用时在SDK返回的PR寄存器对象上探测一次，之后直接返回探测结果。
+
+    返回：
+    - str: 编号属性名，对象上三者都没有时返回None
+    """
+    global _pr_index_attr
+    if _pr_index_attr is None:
+        for attr in ('id', 'registerIndex', 'index'):
+            if hasattr(pr_register, attr):
+                _pr_index_attr = attr
+                break
+    return _pr_index_attr
+
+
+def __pr_position(pr_register):
+    """
+    获取PR寄存器的笛卡尔位姿对象（x/y/z/a/b/c）
+
+    返回：
+    - position对象，PR寄存器不包含位姿数据时返回None
+    """
+    try:
+        return pr_register.poseRegisterData.cartData.position
+    except AttributeError:
+        return None
+
+
+def __set_pr_index(pr_register, pr_id: int):
+    """
+    设置PR寄存器对象的编号（对象没有编号属性时不设置）
+    """
+    attr = _pr_index_attr
+    if attr is None:
+        attr = __probe_pr_index_attr(pr_register)
+        if attr is None:
+            return
+    setattr(pr_register, attr, pr_id)
+
+
+# 坐标系姿态（绕X/Y/Z轴旋转角度）的存储位置，首次读取坐标系时探测一次
+# 格式：(姿态所在对象的属性名, (绕X轴属性名, 绕Y轴属性名, 绕Z轴属性名))
+_frame_layout = None
+
+
+def __get_frame_layout(coordinate):
+    """
+    获取坐标系姿态的存储位置（首次调用时探测并缓存）
+
+    有orientation属性时姿态存储在orientation.r/p/y，
+    否则存储在position上（绕Z轴依次尝试yaw、rotation_z、c属性）。
+
+    返回：
+    - tuple: (姿态所在对象的属性名, (绕X轴属性名, 绕Y轴属性名, 绕Z轴属性名))
+    """
+    global _frame_layout
+    if _frame_layout is None:
+        if hasattr(coordinate, 'orientation'):
+            _frame_layout = ('orientation', ('r', 'p', 'y'))
+        else:
+            # 注意：position.y是Y坐标，不能用于旋转角度
+            position = coordinate.position
+            if hasattr(position, 'yaw'):
+                yaw_attr = 'yaw'
+            elif hasattr(position, 'rotation_z'):
+                yaw_attr = 'rotation_z'
+            else:
+                yaw_attr = 'c'
+            _frame_layout = ('position', ('r', 'p', yaw_attr))
+        logger.info(f"坐标系姿态存储位置：{_frame_layout[0]}.{'/'.join(_frame_layout[1])}")
+    return _frame_layout
+
+
+def __get_frame_pose(coordinate):
+    """
+    读取坐标系位姿
+
+    返回：
+    - list: [X, Y, Z, W(绕X轴), P(绕Y轴), R(绕Z轴)]
+    """
+    holder_attr, rotation_attrs = _frame_layout or __get_frame_layout(coordinate)
+    position = coordinate.position
+    if holder_attr == 'orientation':
+        orientation = coordinate.orientation
+        return [position.x, position.y, position.z, orientation.r, orientation.p, orientation.y]
+    holder = getattr(coordinate, holder_attr)
+    return [
+        position.x,
+        position.y,
+        position.z,
+        getattr(holder, rotation_attrs[0]),
+        getattr(holder, rotation_attrs[1]),
+        getattr(holder, rotation_attrs[2])
+    ]
+
+
+def __set_frame_value(coordinate, param_index: int, value: float):
+    """
+    设置坐标系的单个参数
+
+    参数：
+    - coordinate: 坐标系对象
+    - param_index: 1-6 (1=X, 2=Y, 3=Z, 4=A/r, 5=B/p, 6=C/y)
+    - value: 参数值
+    """
+    if param_index <= 3:
+        setattr(coordinate.position, ('x', 'y', 'z')[param_index - 1], value)
+    else:
+        holder_attr, rotation_attrs = _frame_layout or __get_frame_layout(coordinate)
+        setattr(getattr(coordinate, holder_attr), rotation_attrs[param_index - 4], value)
+
+
+def __set_frame_pose(coordinate, pose_list):
+    """
+    设置坐标系位姿
+
+    参数：
+    - coordinate: 坐标系对象
+    - pose_list: [X, Y, Z, W(绕X轴), P(绕Y轴), R(绕Z轴)]
+    """
+    for param_index, value in enumerate(pose_list, start=1):
+        __set_frame_value(coordinate, param_index, value)
+
+
 def __get_robot_ip():
     """
     获取机器人IP地址
@@ -221,33 +370,68 @@ def __get_arm_connection():
     """
     global _global_arm
 
-    try:
-        # 如果已有连接且连接状态正常，直接返回
-        if _global_arm is not None:
-            try:
-                if _global_arm.is_connect():
-                    return _global_arm, None
-            except:
-                # 连接状态检查失败，重置连接
+    with _global_arm_lock:
+        try:
+            # 如果已有连接且连接状态正常，直接返回
+            if _global_arm is not None:
+                try:
+                    if _global_arm.is_connect():
+                        return _global_arm, None
+                except:
+                    # 连接状态检查失败，重置连接
+                    _global_arm = None
+
+            # 创建新连接，旧连接的PR寄存器模板不再使用
+            _pr_templates.clear()
+            robot_ip = __get_robot_ip()
+            if robot_ip is None:
+                return None, "无法获取机器人IP地址"
+
+            _global_arm = Arm()
+            ret = _global_arm.connect(robot_ip)
+            if ret != StatusCodeEnum.OK:
                 _global_arm = None
+                return None, f"连接机器人失败，错误代码：{ret}"
 
-        # 创建新连接
-        robot_ip = __get_robot_ip()
-        if robot_ip is None:
-            return None, "无法获取机器人IP地址"
+            return _global_arm, None
 
-        _global_arm = Arm()
-        ret = _global_arm.connect(robot_ip)
-        if ret != StatusCodeEnum.OK:
+        except Exception as ex:
+            logger.error(f"获取Arm连接失败: {ex}")
             _global_arm = None
-            return None, f"连接机器人失败，错误代码：{ret}"
+            return None, f"获取连接失败：{str(ex)}"
+
+
+def __warmup():
+    """
+    连接预热：建立连接（在后台线程中执行）
+    """
+    start = time.monotonic()
+    try:
+        arm, error = __get_arm_connection()
+        if arm is None:
+            _warmup_state["error"] = error
+            _warmup_state["status"] = "failed"
+            logger.warning(f"连接预热失败：{error}")
+            return
 
-        return _global_arm, None
+        _warmup_state["status"] = "ready"
+        logger.info(f"连接预热完成，耗时{time.monotonic() - start:.3f}秒")
 
     except Exception as ex:
-        logger.error(f"获取Arm连接失败: {ex}")
-        _global_arm = None
-        return None, f"获取连接失败：{str(ex)}"
+        logger.error(f"连接预热异常: {ex}")
+        _warmup_state["error"] = str(ex)
+        _warmup_state["status"] = "failed"
+    finally:
+        _warmup_state["elapsed"] = time.monotonic() - start
+
+
+def __start_warmup():
+    """
+    在后台线程中启动连接预热，不阻塞插件注册
+    """
+    _warmup_state["status"] = "running"
+    thread = threading.Thread(target=__warmup, name="CM-warmup", daemon=True)
+    thread.start()
 
 
 def __get_param_name(param_index: int):
@@ -314,13 +498,52 @@ def __create_r_register(arm, r_id: int, initial_value: float = 0.0):
         return StatusCodeEnum.CONTROLLER_ERROR, False
 
 
-def __create_pr_register(arm, pr_id: int):
+def __get_pr_template(arm):
+    """
+    获取当前连接缓存的PR寄存器模板（所有分量已清零），首次调用时依次尝试读取PR[1]到PR[10]生成
+
+    参数：
+    - arm: Arm对象
+
+    返回：
+    - PR寄存器模板对象（调用方需复制后使用），没有可用模板时返回None
+    """
+    template_pr = _pr_templates.get(id(arm))
+    if template_pr is not None:
+        return template_pr
+
+    for template_id in range(1, 11):
+        template_pr, template_ret = arm.register.read_PR(template_id)
+        if template_ret != StatusCodeEnum.OK:
+            continue
+        pr_position = __pr_position(template_pr)
+        if pr_position is None:
+            logger.warning(f"PR[{template_id}]结构不正确，不能作为模板")
+            continue
+
+        # 复制模板结构，但将所有值设为0
+        pr_position.x = 0.0
+        pr_position.y = 0.0
+        pr_position.z = 0.0
+        pr_position.a = 0.0
+        pr_position.b = 0.0
+        pr_position.c = 0.0
+        logger.debug(f"使用PR[{template_id}]生成PR寄存器模板")
+        _pr_templates[id(arm)] = template_pr
+        return template_pr
+    return None
+
+
+def __create_pr_register(arm, pr_id: int, verify: bool = True):
     """
     创建并初始化PR寄存器（如果不存在）
 
+    使用当前连接缓存的PR寄存器模板创建，模板已缓存时创建只需一次写入（及一次可选的验证读取）。
+
     参数：
     - arm: Arm对象
     - pr_id: PR寄存器编号
+    - verify: 创建后是否读取验证，默认True
 
     返回：
     - tuple: (pr_register对象, StatusCodeEnum) 或 (None, 错误代码)
@@ -335,70 +558,37 @@ def __create_pr_register(arm, pr_id: int):
         # PR寄存器不存在，需要创建
         logger.info(f"PR寄存器[{pr_id}]不存在，开始创建...")
 
-        # 尝试通过写入一个初始化的PR寄存器对象来创建
-        # 需要根据SDK的实际结构创建PR寄存器对象
-        # 这里先尝试读取一个已存在的PR寄存器作为模板（如果可能）
-        # 或者创建一个新的PR寄存器对象
-
-        # 方法1：尝试读取任意已存在的PR寄存器作为模板
-        # 从PR[1]开始尝试，如果不存在则尝试PR[2]、PR[3]等，最多尝试10个
-        template_pr = None
-        template_ret = None
-        for template_id in range(1, 11):
-            template_pr, template_ret = arm.register.read_PR(template_id)
-            if template_ret == StatusCodeEnum.OK:
-                logger.debug(f"使用PR[{template_id}]作为模板创建PR[{pr_id}]")
-                break
-
-        if template_ret == StatusCodeEnum.OK and template_pr is not None:
-            # 使用模板创建新的PR寄存器
-            # 复制模板结构，但将所有值设为0
-            pr_register = copy.deepcopy(template_pr)
-
-            # 初始化所有分量为0
-            if hasattr(pr_register, 'poseRegisterData') and \
-               hasattr(pr_register.poseRegisterData, 'cartData') and \
-               hasattr(pr_register.poseRegisterData.cartData, 'position'):
-                pr_position = pr_register.poseRegisterData.cartData.position
-                pr_position.x = 0.0
-                pr_position.y = 0.0
-                pr_position.z = 0.0
-                pr_position.a = 0.0
-                pr_position.b = 0.0
-                pr_position.c = 0.0
-
-                # 设置PR寄存器索引
-                if hasattr(pr_register, 'id'):
-                    pr_register.id = pr_id
-                elif hasattr(pr_register, 'registerIndex'):
-                    pr_register.registerIndex = pr_id
-                elif hasattr(pr_register, 'index'):
-                    pr_register.index = pr_id
-
-                # 尝试写入PR寄存器（如果SDK支持通过写入来创建）
-                ret = arm.register.write_PR(pr_register)
-                if ret == StatusCodeEnum.OK:
-                    logger.info(f"成功创建PR寄存器[{pr_id}]（使用模板）")
-                    # 验证创建是否成功
-                    verify_pr, verify_ret = arm.register.read_PR(pr_id)
-                    if verify_ret == StatusCodeEnum.OK:
-                        logger.info(f"PR寄存器[{pr_id}]创建并验证成功")
-                        return verify_pr, StatusCodeEnum.OK
-                    else:
-                        logger.warning(f"PR寄存器[{pr_id}]写入成功但验证失败，错误代码：{verify_ret}")
-                        return pr_register, StatusCodeEnum.OK  # 仍然返回成功，因为write_PR成功了
-                else:
-                    logger.error(f"写入PR寄存器[{pr_id}]失败，错误代码：{ret}")
-                    return None, ret
-            else:
-                logger.error(f"PR寄存器模板结构不正确")
-                return None, StatusCodeEnum.INVALID_PARAMETER
-        else:
-            # 方法2：如果没有任何PR寄存器存在，无法创建模板
+        # 通过写入一个由模板复制的PR寄存器对象来创建
+        template_pr = __get_pr_template(arm)
+        if template_pr is None:
+            # 没有任何PR寄存器存在，无法创建模板
             logger.error(f"无法创建PR寄存器[{pr_id}]：系统中没有任何PR寄存器可以作为模板")
             logger.error(f"请先在示教器中至少创建一个PR寄存器（如PR[1]），然后再使用此功能")
             return None, StatusCodeEnum.NOT_FOUND
 
+        pr_register = copy.deepcopy(template_pr)
+
+        # 设置PR寄存器索引
+        __set_pr_index(pr_register, pr_id)
+
+        # 尝试写入PR寄存器（如果SDK支持通过写入来创建）
+        ret = arm.register.write_PR(pr_register)
+        if ret != StatusCodeEnum.OK:
+            logger.error(f"写入PR寄存器[{pr_id}]失败，错误代码：{ret}")
+            return None, ret
+        logger.info(f"成功创建PR寄存器[{pr_id}]（使用模板）")
+
+        if not verify:
+            return pr_register, StatusCodeEnum.OK
+
+        # 验证创建是否成功
+        verify_pr, verify_ret = arm.register.read_PR(pr_id)
+        if verify_ret == StatusCodeEnum.OK:
+            logger.info(f"PR寄存器[{pr_id}]创建并验证成功")
+            return verify_pr, StatusCodeEnum.OK
+        logger.warning(f"PR寄存器[{pr_id}]写入成功但验证失败，错误代码：{verify_ret}")
+        return pr_register, StatusCodeEnum.OK  # 仍然返回成功，因为write_PR成功了
+
     except Exception as ex:
         logger.error(f"创建PR寄存器[{pr_id}]时发生异常：{ex}")
         return None, StatusCodeEnum.CONTROLLER_ERROR
@@ -464,14 +654,9 @@ def SetTF(ID: int, Pos: int, Value: float) -> dict:
         Value = round(float(Value), 3)
 
         # 位置参数(1-3)更新到position，姿态参数(4-6)更新到orientation
-        if Pos <= 3:
-            # X, Y, Z 更新到 position
-            setattr(coordinate.position, param_attr, Value)
-        else:
-            # R, P, Y 更新到 orientation
-            if not hasattr(coordinate, 'orientation'):
-                return {"success": False, "error": "坐标系对象没有orientation属性"}
-            setattr(coordinate.orientation, param_attr, Value)
+        if Pos >= 4 and not hasattr(coordinate, 'orientation'):
+            return {"success": False, "error": "坐标系对象没有orientation属性"}
+        __set_frame_value(coordinate, Pos, Value)
 
         # 更新坐标系
         ret = arm.coordinate_system.update(CoordinateSystemType.ToolFrame, coordinate)
@@ -550,14 +735,9 @@ def SetUF(ID: int, Pos: int, Value: float) -> dict:
         Value = round(float(Value), 3)
 
         # 位置参数(1-3)更新到position，姿态参数(4-6)更新到orientation
-        if Pos <= 3:
-            # X, Y, Z 更新到 position
-            setattr(coordinate.position, param_attr, Value)
-        else:
-            # R, P, Y 更新到 orientation
-            if not hasattr(coordinate, 'orientation'):
-                return {"success": False, "error": "坐标系对象没有orientation属性"}
-            setattr(coordinate.orientation, param_attr, Value)
+        if Pos >= 4 and not hasattr(coordinate, 'orientation'):
+            return {"success": False, "error": "坐标系对象没有orientation属性"}
+        __set_frame_value(coordinate, Pos, Value)
 
         # 更新坐标系
         ret = arm.coordinate_system.update(CoordinateSystemType.UserFrame, coordinate)
@@ -641,14 +821,9 @@ def SetTF_R(ID: int, Pos: int, R_ID: int) -> dict:
         Value = round(float(r_value), 3)
 
         # 位置参数(1-3)更新到position，姿态参数(4-6)更新到orientation
-        if Pos <= 3:
-            # X, Y, Z 更新到 position
-            setattr(coordinate.position, param_attr, Value)
-        else:
-            # R, P, Y 更新到 orientation
-            if not hasattr(coordinate, 'orientation'):
-                return {"success": False, "error": "坐标系对象没有orientation属性"}
-            setattr(coordinate.orientation, param_attr, Value)
+        if Pos >= 4 and not hasattr(coordinate, 'orientation'):
+            return {"success": False, "error": "坐标系对象没有orientation属性"}
+        __set_frame_value(coordinate, Pos, Value)
 
         # 更新坐标系
         ret = arm.coordinate_system.update(CoordinateSystemType.ToolFrame, coordinate)
@@ -732,14 +907,9 @@ def SetUF_R(ID: int, Pos: int, R_ID: int) -> dict:
         Value = round(float(r_value), 3)
 
         # 位置参数(1-3)更新到position，姿态参数(4-6)更新到orientation
-        if Pos <= 3:
-            # X, Y, Z 更新到 position
-            setattr(coordinate.position, param_attr, Value)
-        else:
-            # R, P, Y 更新到 orientation
-            if not hasattr(coordinate, 'orientation'):
-                return {"success": False, "error": "坐标系对象没有orientation属性"}
-            setattr(coordinate.orientation, param_attr, Value)
+        if Pos >= 4 and not hasattr(coordinate, 'orientation'):
+            return {"success": False, "error": "坐标系对象没有orientation属性"}
+        __set_frame_value(coordinate, Pos, Value)
 
         # 更新坐标系
         ret = arm.coordinate_system.update(CoordinateSystemType.UserFrame, coordinate)
@@ -796,9 +966,8 @@ def SetTF_PR(ID: int, PR_ID: int) -> dict:
             return {"success": False, "error": f"读取PR寄存器[{PR_ID}]失败，错误代码：{ret}"}
 
         # 检查PR寄存器数据类型
-        if not hasattr(pr_register, 'poseRegisterData') or \
-           not hasattr(pr_register.poseRegisterData, 'cartData') or \
-           not hasattr(pr_register.poseRegisterData.cartData, 'position'):
+        pr_position = __pr_position(pr_register)
+        if pr_position is None:
             return {"success": False, "error": f"PR寄存器[{PR_ID}]数据格式不正确，必须包含位姿数据"}
 
         # 获取现有坐标系
@@ -808,56 +977,22 @@ def SetTF_PR(ID: int, PR_ID: int) -> dict:
 
         # 从PR寄存器读取XYZABC值并更新到坐标系（保留三位小数）
         # PR寄存器中的a/b/c对应坐标系中的r/p/y（绕X/Y/Z轴旋转角度）
-        pr_position = pr_register.poseRegisterData.cartData.position
-        # 更新位置信息
-        coordinate.position.x = round(pr_position.x, 3)
-        coordinate.position.y = round(pr_position.y, 3)
-        coordinate.position.z = round(pr_position.z, 3)
-        # 更新姿态信息：使用r/p/y（绕X/Y/Z轴旋转角度）
-        # 检查是否有orientation属性（Rotation对象）
-        if hasattr(coordinate, 'orientation'):
-            coordinate.orientation.r = round(pr_position.a, 3)  # A -> r (绕X轴)
-            coordinate.orientation.p = round(pr_position.b, 3)  # B -> p (绕Y轴)
-            coordinate.orientation.y = round(pr_position.c, 3)  # C -> y (绕Z轴)
-        else:
-            # 如果没有orientation，尝试在position对象上设置r/p/y
-            coordinate.position.r = round(pr_position.a, 3)  # A -> r (绕X轴)
-            coordinate.position.p = round(pr_position.b, 3)  # B -> p (绕Y轴)
-            # 注意：position.y是Y坐标，不能用于旋转角度
-            # 如果position对象有yaw或其他属性用于绕Z轴旋转，使用它
-            if hasattr(coordinate.position, 'yaw'):
-                coordinate.position.yaw = round(pr_position.c, 3)
-            elif hasattr(coordinate.position, 'rotation_z'):
-                coordinate.position.rotation_z = round(pr_position.c, 3)
-            else:
-                # 如果都不存在，尝试设置c属性（可能SDK内部会映射）
-                try:
-                    setattr(coordinate.position, 'c', round(pr_position.c, 3))
-                except:
-                    logger.warning(f"无法设置绕Z轴旋转角度，请检查坐标系结构")
+        __set_frame_pose(coordinate, [
+            round(pr_position.x, 3),
+            round(pr_position.y, 3),
+            round(pr_position.z, 3),
+            round(pr_position.a, 3),
+            round(pr_position.b, 3),
+            round(pr_position.c, 3)
+        ])
 
         # 更新坐标系
         ret = arm.coordinate_system.update(CoordinateSystemType.ToolFrame, coordinate)
         if ret != StatusCodeEnum.OK:
             return {"success": False, "error": f"更新坐标系失败，错误代码：{ret}"}
 
-        # 获取r/p/y值用于返回消息（根据实际存储位置）
-        if hasattr(coordinate, 'orientation'):
-            r_val = coordinate.orientation.r
-            p_val = coordinate.orientation.p
-            y_val = coordinate.orientation.y
-        else:
-            r_val = getattr(coordinate.position, 'r', pr_position.a)
-            p_val = getattr(coordinate.position, 'p', pr_position.b)
-            # y值可能存储在不同的属性中
-            if hasattr(coordinate.position, 'yaw'):
-                y_val = coordinate.position.yaw
-            elif hasattr(coordinate.position, 'rotation_z'):
-                y_val = coordinate.position.rotation_z
-            elif hasattr(coordinate.position, 'c'):
-                y_val = coordinate.position.c
-            else:
-                y_val = pr_position.c
+        # 获取r/p/y值用于返回消息
+        _, _, _, r_val, p_val, y_val = __get_frame_pose(coordinate)
 
         return {
             "success": True,
@@ -907,9 +1042,8 @@ def SetUF_PR(ID: int, PR_ID: int) -> dict:
             return {"success": False, "error": f"读取PR寄存器[{PR_ID}]失败，错误代码：{ret}"}
 
         # 检查PR寄存器数据类型
-        if not hasattr(pr_register, 'poseRegisterData') or \
-           not hasattr(pr_register.poseRegisterData, 'cartData') or \
-           not hasattr(pr_register.poseRegisterData.cartData, 'position'):
+        pr_position = __pr_position(pr_register)
+        if pr_position is None:
             return {"success": False, "error": f"PR寄存器[{PR_ID}]数据格式不正确，必须包含位姿数据"}
 
         # 获取现有坐标系
@@ -919,56 +1053,22 @@ def SetUF_PR(ID: int, PR_ID: int) -> dict:
 
         # 从PR寄存器读取XYZABC值并更新到坐标系（保留三位小数）
         # PR寄存器中的a/b/c对应坐标系中的r/p/y（绕X/Y/Z轴旋转角度）
-        pr_position = pr_register.poseRegisterData.cartData.position
-        # 更新位置信息
-        coordinate.position.x = round(pr_position.x, 3)
-        coordinate.position.y = round(pr_position.y, 3)
-        coordinate.position.z = round(pr_position.z, 3)
-        # 更新姿态信息：使用r/p/y（绕X/Y/Z轴旋转角度）
-        # 检查是否有orientation属性（Rotation对象）
-        if hasattr(coordinate, 'orientation'):
-            coordinate.orientation.r = round(pr_position.a, 3)  # A -> r (绕X轴)
-            coordinate.orientation.p = round(pr_position.b, 3)  # B -> p (绕Y轴)
-            coordinate.orientation.y = round(pr_position.c, 3)  # C -> y (绕Z轴)
-        else:
-            # 如果没有orientation，尝试在position对象上设置r/p/y
-            coordinate.position.r = round(pr_position.a, 3)  # A -> r (绕X轴)
-            coordinate.position.p = round(pr_position.b, 3)  # B -> p (绕Y轴)
-            # 注意：position.y是Y坐标，不能用于旋转角度
-            # 如果position对象有yaw或其他属性用于绕Z轴旋转，使用它
-            if hasattr(coordinate.position, 'yaw'):
-                coordinate.position.yaw = round(pr_position.c, 3)
-            elif hasattr(coordinate.position, 'rotation_z'):
-                coordinate.position.rotation_z = round(pr_position.c, 3)
-            else:
-                # 如果都不存在，尝试设置c属性（可能SDK内部会映射）
-                try:
-                    setattr(coordinate.position, 'c', round(pr_position.c, 3))
-                except:
-                    logger.warning(f"无法设置绕Z轴旋转角度，请检查坐标系结构")
+        __set_frame_pose(coordinate, [
+            round(pr_position.x, 3),
+            round(pr_position.y, 3),
+            round(pr_position.z, 3),
+            round(pr_position.a, 3),
+            round(pr_position.b, 3),
+            round(pr_position.c, 3)
+        ])
 
         # 更新坐标系
         ret = arm.coordinate_system.update(CoordinateSystemType.UserFrame, coordinate)
         if ret != StatusCodeEnum.OK:
             return {"success": False, "error": f"更新坐标系失败，错误代码：{ret}"}
 
-        # 获取r/p/y值用于返回消息（根据实际存储位置）
-        if hasattr(coordinate, 'orientation'):
-            r_val = coordinate.orientation.r
-            p_val = coordinate.orientation.p
-            y_val = coordinate.orientation.y
-        else:
-            r_val = getattr(coordinate.position, 'r', pr_position.a)
-            p_val = getattr(coordinate.position, 'p', pr_position.b)
-            # y值可能存储在不同的属性中
-            if hasattr(coordinate.position, 'yaw'):
-                y_val = coordinate.position.yaw
-            elif hasattr(coordinate.position, 'rotation_z'):
-                y_val = coordinate.position.rotation_z
-            elif hasattr(coordinate.position, 'c'):
-                y_val = coordinate.position.c
-            else:
-                y_val = pr_position.c
+        # 获取r/p/y值用于返回消息
+        _, _, _, r_val, p_val, y_val = __get_frame_pose(coordinate)
 
         return {
             "success": True,
@@ -1365,17 +1465,14 @@ def Strp(SR_ID: int, R_ID_Status: int, PR_ID: int, R_ID_Error: int) -> dict:
                 }
 
             # 检查PR寄存器数据类型
-            if not hasattr(pr_register, 'poseRegisterData') or \
-               not hasattr(pr_register.poseRegisterData, 'cartData') or \
-               not hasattr(pr_register.poseRegisterData.cartData, 'position'):
+            pr_position = __pr_position(pr_register)
+            if pr_position is None:
                 logger.error(f"PR寄存器[{current_pr_id}]数据格式不正确，必须包含位姿数据")
                 __create_r_register(arm, R_ID_Error, 1)
                 arm.register.write_R(R_ID_Error, 1)
                 return {"success": False, "error": f"PR寄存器[{current_pr_id}]数据格式不正确，必须包含位姿数据"}
 
             # 更新当前PR寄存器的X、Y、C分量，保留Z、A、B的原有值
-            pr_position = pr_register.poseRegisterData.cartData.position
-
             # 保存原有的Z、A、B值
             original_z = pr_position.z
             original_a = pr_position.a
@@ -1399,12 +1496,7 @@ def Strp(SR_ID: int, R_ID_Status: int, PR_ID: int, R_ID_Error: int) -> dict:
             logger.info(f"准备写入PR寄存器[{current_pr_id}]")
 
             # 确保PR寄存器对象包含正确的索引信息（如果需要）
-            if hasattr(pr_register, 'id'):
-                pr_register.id = current_pr_id
-            elif hasattr(pr_register, 'registerIndex'):
-                pr_register.registerIndex = current_pr_id
-            elif hasattr(pr_register, 'index'):
-                pr_register.index = current_pr_id
+            __set_pr_index(pr_register, current_pr_id)
 
             # 写入PR寄存器
             ret = arm.register.write_PR(pr_register)
@@ -1508,14 +1600,7 @@ def TFShift(InputTF_ID: int = 1, ResultTF_ID: int = 3, CamPose_ID: int = 60, Ref
         tool, ret = arm.coordinate_system.get(CoordinateSystemType.ToolFrame, InputTF_ID)
         if ret != StatusCodeEnum.OK:
             return {"success": False, "error": f"读取基准工具坐标系[{InputTF_ID}]失败，错误代码：{ret}"}
-        tool_data = [
-            tool.position.x,
-            tool.position.y,
-            tool.position.z,
-            tool.orientation.r,
-            tool.orientation.p,
-            tool.orientation.y
-        ]
+        tool_data = __get_frame_pose(tool)
         ut1_ut0 = PrecisionPose(tool_data)
 
         # 读取拍照点位姿（UT1在UF1中的位姿）
@@ -1523,11 +1608,9 @@ def TFShift(InputTF_ID: int = 1, ResultTF_ID: int = 3, CamPose_ID: int = 60, Ref
         pr_register, ret = arm.register.read_PR(CamPose_ID)
         if ret != StatusCodeEnum.OK:
             return {"success": False, "error": f"读取拍照点PR寄存器[{CamPose_ID}]失败，错误代码：{ret}"}
-        if not hasattr(pr_register, 'poseRegisterData') or \
-           not hasattr(pr_register.poseRegisterData, 'cartData') or \
-           not hasattr(pr_register.poseRegisterData.cartData, 'position'):
+        pr_position = __pr_position(pr_register)
+        if pr_position is None:
             return {"success": False, "error": f"PR寄存器[{CamPose_ID}]数据格式不正确，必须包含位姿数据"}
-        pr_position = pr_register.poseRegisterData.cartData.position
         pr_data = [
             pr_position.x,
             pr_position.y,
@@ -1543,11 +1626,9 @@ def TFShift(InputTF_ID: int = 1, ResultTF_ID: int = 3, CamPose_ID: int = 60, Ref
         pr_register, ret = arm.register.read_PR(RefVis_ID)
         if ret != StatusCodeEnum.OK:
             return {"success": False, "error": f"读取基准视觉模板PR寄存器[{RefVis_ID}]失败，错误代码：{ret}"}
-        if not hasattr(pr_register, 'poseRegisterData') or \
-           not hasattr(pr_register.poseRegisterData, 'cartData') or \
-           not hasattr(pr_register.poseRegisterData.cartData, 'position'):
+        pr_position = __pr_position(pr_register)
+        if pr_position is None:
             return {"success": False, "error": f"PR寄存器[{RefVis_ID}]数据格式不正确，必须包含位姿数据"}
-        pr_position = pr_register.poseRegisterData.cartData.position
         pr_data = [
             pr_position.x,
             pr_position.y,
@@ -1563,11 +1644,9 @@ def TFShift(InputTF_ID: int = 1, ResultTF_ID: int = 3, CamPose_ID: int = 60, Ref
         pr_register, ret = arm.register.read_PR(ActVis_ID)
         if ret != StatusCodeEnum.OK:
             return {"success": False, "error": f"读取实际视觉坐标PR寄存器[{ActVis_ID}]失败，错误代码：{ret}"}
-        if not hasattr(pr_register, 'poseRegisterData') or \
-           not hasattr(pr_register.poseRegisterData, 'cartData') or \
-           not hasattr(pr_register.poseRegisterData.cartData, 'position'):
+        pr_position = __pr_position(pr_register)
+        if pr_position is None:
             return {"success": False, "error": f"PR寄存器[{ActVis_ID}]数据格式不正确，必须包含位姿数据"}
-        pr_position = pr_register.poseRegisterData.cartData.position
         pr_data = [
             pr_position.x,
             pr_position.y,
@@ -1623,12 +1702,7 @@ def TFShift(InputTF_ID: int = 1, ResultTF_ID: int = 3, CamPose_ID: int = 60, Ref
         if ret != StatusCodeEnum.OK:
             return {"success": False, "error": f"获取工具坐标系[{ResultTF_ID}]失败，错误代码：{ret}"}
 
-        coordinate.position.x = ut2_pose_list[0]
-        coordinate.position.y = ut2_pose_list[1]
-        coordinate.position.z = ut2_pose_list[2]
-        coordinate.orientation.r = ut2_pose_list[3]
-        coordinate.orientation.p = ut2_pose_list[4]
-        coordinate.orientation.y = ut2_pose_list[5]
+        __set_frame_pose(coordinate, ut2_pose_list)
 
         ret = arm.coordinate_system.update(CoordinateSystemType.ToolFrame, coordinate)
         if ret != StatusCodeEnum.OK:
@@ -1750,3 +1824,27 @@ def DecToHex(R_ID: int, SR_ID: int) -> dict:
     except Exception as ex:
         logger.error(f"DecToHex执行失败: {ex}", exc_info=True)
         return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+
+def WarmUpStatus() -> dict:
+    """
+    查询连接预热状态
+
+    预热需设置环境变量CM_WARMUP=1开启，插件加载时在后台建立连接。
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}，预热完成时success为True
+    """
+    status = _warmup_state["status"]
+    if status == "ready":
+        return {"success": True, "message": f"连接预热已完成，耗时{_warmup_state['elapsed']:.3f}秒"}
+    if status == "running":
+        return {"success": False, "error": "连接预热进行中"}
+    if status == "failed":
+        return {"success": False, "error": f"连接预热失败：{_warmup_state['error']}"}
+    return {"success": False, "error": "连接预热未启用（设置环境变量CM_WARMUP=1开启）"}
+
+
+# 插件加载时按需启动连接预热
+if _WARMUP_ENABLED:
+    __start_warmup()
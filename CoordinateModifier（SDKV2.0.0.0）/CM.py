@@ -17,6 +17,25 @@
 9. Strp - 拆解字符串数据到PR寄存器
 10. TFShift - 工具坐标系补正（基于视觉反馈）
 11. DecToHex - 从十进制转换为十六进制
+12. WarmUpStatus - 查询连接预热状态
+13. PerfStats - 性能诊断（指令及SDK调用耗时统计）
+14. IncrBatch - 批量R寄存器自增（连续编号）
+15. SaveSnapshot - 保存寄存器及坐标系快照到本地文件
+16. RestoreSnapshot - 从本地快照文件恢复寄存器及坐标系（只写入有差异的项）
+17. SetTFMulti - 工具坐标系（多个分量一次更新）
+18. SetUFMulti - 用户坐标系（多个分量一次更新）
+19. ExportFrames - 导出全部TF/UF坐标系到本地坐标系表文件
+20. ApplyFrames - 将本地坐标系表下发到控制器（只写入有差异的坐标系）
+21. TxnBegin - 开始坐标系及R寄存器修改事务
+22. TxnSetFrame - 在事务中暂存坐标系修改
+23. TxnSetR - 在事务中暂存R寄存器修改
+24. TxnCommit - 提交事务（一批写入，失败时自动恢复）
+25. TxnRollback - 回滚事务（写回提交前的值）
+26. TFShiftArm - 准备工具坐标系补正的基准上下文
+27. TFShiftRun - 按基准上下文执行工具坐标系补正（只读取实际视觉坐标）
+
+第1-11、14-20及24-27号指令另提供异步版本（指令名加_async后缀，如SetTF_async），
+供asyncio宿主程序await调用，不注册为示教器指令。
 
 """
 
@@ -27,12 +46,234 @@ if logger is None:
     import logging
     logger = logging.getLogger(__name__)
 
-from Agilebot import Arm, Extension, StatusCodeEnum
+from Agilebot import Arm, Coordinate, Extension, Position, RegTopicType, StatusCodeEnum
+import asyncio
+import bisect
+import collections
+import concurrent.futures
 import copy
+import enum
+import functools
+import itertools
+import json
 import math
+import os
+import queue
+import random
+import threading
+import time
 
-# 全局Arm对象，用于长连接
-_global_arm = None
+# Arm连接池大小（同时执行指令的最大并发数）
+_ARM_POOL_SIZE = 4
+
+# 从连接池借出连接的最长等待时间（秒）
+_ARM_POOL_CHECKOUT_TIMEOUT = 10.0
+
+# 批量并发调用SDK（读写寄存器、读取坐标系）时的最大并发连接数（含当前指令的连接，其余从连接池空闲连接中借出）
+_SDK_BATCH_PARALLEL = 4
+
+# 机器人IP缓存有效期（秒），过期后重新通过Extension获取
+_ROBOT_IP_CACHE_TTL = 300.0
+
+# 机器人IP缓存，重连时优先使用，连接失败时主动失效
+_robot_ip_cache = {"ip": None, "expire_at": 0.0}
+
+# 机器人IP缓存命中统计
+_robot_ip_cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+# 保护机器人IP缓存及其统计（多个指令线程、心跳线程可能同时重连）
+_robot_ip_cache_lock = threading.Lock()
+
+# 后台心跳检测间隔（秒）
+_HEARTBEAT_INTERVAL = 1.0
+
+# 心跳结果的最大可信时长（秒），超过后指令调用时同步检查连接状态
+_HEARTBEAT_STALENESS = 3.0
+
+# 连续连接失败多少次后熔断（熔断期间指令直接失败，不再尝试连接）
+_BREAKER_FAILURE_THRESHOLD = 3
+
+# 熔断时长的指数退避参数（秒）：首次熔断基础时长、最大时长
+_BREAKER_BASE_DELAY = 1.0
+_BREAKER_MAX_DELAY = 30.0
+
+# 后台心跳线程及其启动锁
+_heartbeat_thread = None
+_heartbeat_lock = threading.Lock()
+
+# 连接池后台补充连接的线程是否正在运行，及其保护锁
+_pool_fill_running = False
+_pool_fill_lock = threading.Lock()
+
+# 当前线程借出的连接会话（指令执行期间有效）
+_session_local = threading.local()
+
+# 是否在插件加载时预热连接（设置环境变量CM_WARMUP=1开启）
+_WARMUP_ENABLED = os.environ.get("CM_WARMUP", "0") == "1"
+
+# 连接预热状态：disabled/running/ready/failed
+_warmup_state = {"status": "disabled", "error": None, "elapsed": 0.0}
+
+# 延迟直方图桶上限（毫秒），超过最后一个上限的计入溢出桶
+_LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+# 延迟直方图：键为"指令名"或"rpc:SDK方法名"
+_latency_histograms = {}
+_latency_lock = threading.Lock()
+
+# 每条指令单次调用发起的SDK调用次数统计：{指令名: {"calls", "total", "max"}}（与延迟直方图共用锁）
+_rpc_counts = {}
+
+# 需要统计耗时的SDK调用：(Arm上的对象路径, 方法名列表)
+_TIMED_SDK_METHODS = (
+    ("", ("is_connected",)),
+    ("register", ("read_R", "write_R", "read_PR", "write_PR", "read_SR", "write_SR")),
+    ("coordinate_system.TF", ("get", "update", "get_coordinate_list")),
+    ("coordinate_system.UF", ("get", "update", "get_coordinate_list")),
+)
+
+# 性能统计导出文件（与插件文件同目录）
+_PERF_STATS_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(globals()['__file__'])) if globals().get('__file__') else os.getcwd(),
+    "CM_perf_stats.json"
+)
+
+# 寄存器及坐标系快照文件（与插件文件同目录，{}为快照编号）
+_SNAPSHOT_FILE_FORMAT = os.path.join(os.path.dirname(_PERF_STATS_FILE), "CM_snapshot_{}.json")
+
+# 坐标系表文件（与插件文件同目录，{}为坐标系表编号）
+_FRAME_TABLE_FILE_FORMAT = os.path.join(os.path.dirname(_PERF_STATS_FILE), "CM_frames_{}.json")
+
+# 快照中每种寄存器的最大数量
+_SNAPSHOT_MAX_REGISTERS = 1000
+
+# 位姿→变换转换LRU缓存的最大条目数
+_TRANSFORM_CACHE_SIZE = 256
+
+# TFShift是否计算并记录验证误差（只反映浮点舍入误差，调试时开启）
+_TFSHIFT_VERIFY = False
+
+# 已就绪的TFShift基准上下文（上下文编号 -> TFShiftContext），及其保护锁
+_tfshift_contexts = {}
+_tfshift_contexts_lock = threading.Lock()
+
+# 每个事务最多暂存的修改数
+_TXN_MAX_EDITS = 200
+
+# 进行中及已提交的事务（事务编号 -> FrameTransaction），及其保护锁
+_transactions = {}
+_transactions_lock = threading.Lock()
+
+def __parse_register_ranges(spec):
+    """
+    解析寄存器镜像范围配置，如"R:1-200,PR:1-50,SR:1-10"，无法解析的项忽略
+
+    参数：
+    - spec: 范围配置字符串
+
+    返回：
+    - tuple: ((寄存器类型, 起始编号, 结束编号), ...)
+    """
+    ranges = []
+    for item in spec.split(','):
+        kind, _, bounds = item.strip().partition(':')
+        kind = kind.strip().upper()
+        start, _, end = bounds.partition('-')
+        try:
+            start = int(start)
+            end = int(end) if end.strip() else start
+        except ValueError:
+            continue
+        if kind in ("R", "PR", "SR") and 1 <= start <= end:
+            ranges.append((kind, start, end))
+    return tuple(ranges)
+
+
+# 寄存器镜像预读范围（设置环境变量CM_REG_MIRROR，如"R:1-200,PR:1-50,SR:1-10"）
+# 订阅通道建立后批量读取并订阅范围内的寄存器，之后由订阅消息保持同步，配置后自动启用寄存器读缓存
+_REG_MIRROR_RANGES = __parse_register_ranges(os.environ.get("CM_REG_MIRROR", ""))
+
+# 是否启用寄存器读缓存（设置环境变量CM_REG_CACHE=1开启）
+# 启用后通过sub_pub订阅读过的R/PR/SR寄存器，寄存器变化时更新缓存，指令读寄存器时优先命中缓存
+_REG_CACHE_ENABLED = os.environ.get("CM_REG_CACHE", "0") == "1" or bool(_REG_MIRROR_RANGES)
+
+# 寄存器订阅推送频率（Hz）
+# SDK手册4.14.4：subscribe_register(reg_type, reg_ids, frequency)按frequency周期推送已订阅寄存器的当前值，
+# 不只在变化时推送，因此通道正常时每秒都会收到消息
+_REG_CACHE_FREQUENCY = 50
+
+# 订阅通道的最大可信时长（秒），超过后视为订阅失效，读寄存器回退为RPC（远大于推送周期1/_REG_CACHE_FREQUENCY）
+_REG_CACHE_STALENESS = 1.0
+
+# 寄存器订阅消息（start_receiving回调收到的Dict[str, Any]）的键名：
+# {"type": RegTopicType或其值"R"/"PR"/"SR", "id": 寄存器编号, "value": 寄存器值}
+# 键名只在此处定义，RegisterCache._parse_message只接受这一种格式
+_REG_MESSAGE_TYPE_KEY = "type"
+_REG_MESSAGE_ID_KEY = "id"
+_REG_MESSAGE_VALUE_KEY = "value"
+
+# 订阅线程及其启动锁
+_reg_cache_thread = None
+_reg_cache_lock = threading.Lock()
+
+# 是否启用TF/UF坐标系缓存（设置环境变量CM_FRAME_CACHE=1开启）
+# 启用后读取坐标系优先命中缓存，缓存由get_coordinate_list整表填充，本插件写入成功后同步更新；
+# 示教器修改坐标系后最多_FRAME_CACHE_TTL秒内仍可能读到旧值，建议只在坐标系仅由本插件修改时开启
+_FRAME_CACHE_ENABLED = os.environ.get("CM_FRAME_CACHE", "0") == "1"
+
+# 坐标系缓存有效期（秒），超过后重新读取
+_FRAME_CACHE_TTL = 5.0
+
+# R寄存器读改写锁：按R寄存器编号分别加锁，保证插件内对同一R寄存器的自增自减不丢失更新
+_r_locks = {}
+_r_locks_guard = threading.Lock()
+
+# 已确认存在的R/PR寄存器：{("R", 编号), ("PR", 编号)}，进程生命周期内有效
+# 读写成功时加入，读写失败时移除，已确认存在的寄存器跳过存在性检查
+_known_registers = set()
+
+# 每个连接缓存的PR寄存器模板（所有分量已清零）：{id(Arm对象): 模板}，连接断开时移除
+_pr_templates = {}
+
+def __parse_tolerance(spec, default):
+    """
+    解析数值容差配置，无法解析或为负数时使用默认值
+
+    参数：
+    - spec: 容差配置字符串
+    - default: 默认容差
+
+    返回：
+    - float: 容差
+    """
+    try:
+        tolerance = float(spec)
+    except (TypeError, ValueError):
+        return default
+    return tolerance if tolerance >= 0.0 else default
+
+
+# 是否跳过未变化的写入（设置环境变量CM_SKIP_UNCHANGED=1开启）
+# 写坐标系或寄存器前与同一次指令调用中从控制器读取到的值比较，差值在容差内时不再写入控制器
+_SKIP_UNCHANGED_WRITES = os.environ.get("CM_SKIP_UNCHANGED", "0") == "1"
+
+# 判断数值未变化的容差（设置环境变量CM_WRITE_TOLERANCE修改）
+# 默认值：坐标系及寄存器数值保留三位小数，取末位的一半
+_WRITE_TOLERANCE = __parse_tolerance(os.environ.get("CM_WRITE_TOLERANCE"), 0.0005)
+
+# 最近读取到的值：{(类型, 编号): (比较值, 读取时的指令调用编号)}，类型为TF/UF/R/PR/SR
+_read_snapshots = {}
+
+# 指令调用编号生成器，读取值只在同一次指令调用内用于比较
+_instruction_call_ids = itertools.count(1)
+
+# 异步版本指令使用的线程池（首次调用时创建，线程数与连接池大小相同）
+_async_executor = None
+_async_executor_lock = threading.Lock()
+
+# 写入统计：{类型: {"writes": 写入调用次数, "elided": 因未变化跳过的次数}}
+_elided_write_stats = {kind: {"writes": 0, "elided": 0} for kind in ("TF", "UF", "R", "PR", "SR")}
+_elided_write_stats_lock = threading.Lock()
 
 # 明确指定导出的公开指令函数，隐藏私有辅助函数
 __all__ = [
@@ -46,7 +287,23 @@ __all__ = [
     'Decr',
     'Strp',
     'TFShift',
-    'DecToHex'
+    'TFShiftArm',
+    'TFShiftRun',
+    'DecToHex',
+    'IncrBatch',
+    'SaveSnapshot',
+    'RestoreSnapshot',
+    'SetTFMulti',
+    'SetUFMulti',
+    'ExportFrames',
+    'ApplyFrames',
+    'TxnBegin',
+    'TxnSetFrame',
+    'TxnSetR',
+    'TxnCommit',
+    'TxnRollback',
+    'WarmUpStatus',
+    'PerfStats'
 ]
 
 
@@ -191,1244 +448,4933 @@ class PrecisionTransform:
         return inv
 
 
+class RigidTransform:
+    """
+    刚体变换类（3x3旋转 + 平移），用于坐标变换计算
+
+    与PrecisionTransform计算结果逐位一致（运算顺序相同），但只保存12个元素的扁平列表
+    [r00, r01, r02, tx, r10, r11, r12, ty, r20, r21, r22, tz]，
+    组合只需36次乘加、求逆直接转置旋转部分，并提供原地组合和原地求逆，减少临时对象。
+    """
+    __slots__ = ("m",)
+
+    def __init__(self, m=None):
+        self.m = list(m) if m is not None else [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+
+    @classmethod
+    def from_pose_zyx(cls, pose):
+        """从Z-Y-X欧拉角创建变换（与PrecisionTransform.from_pose_zyx相同）"""
+        w_rad = math.radians(pose.W)
+        p_rad = math.radians(pose.P)
+        r_rad = math.radians(pose.R)
+
+        cosR = math.cos(r_rad)
+        sinR = math.sin(r_rad)
+        cosP = math.cos(p_rad)
+        sinP = math.sin(p_rad)
+        cosW = math.cos(w_rad)
+        sinW = math.sin(w_rad)
+
+        # Z-Y-X旋转矩阵 Rz(R) * Ry(P) * Rx(W)
+        return cls([
+            cosR * cosP, cosR * sinP * sinW - sinR * cosW, cosR * sinP * cosW + sinR * sinW, pose.X,
+            sinR * cosP, sinR * sinP * sinW + cosR * cosW, sinR * sinP * cosW - cosR * sinW, pose.Y,
+            -sinP, cosP * sinW, cosP * cosW, pose.Z,
+        ])
+
+    @classmethod
+    def from_matrix(cls, M):
+        """从4x4矩阵（如PrecisionTransform.M）创建变换，最后一行忽略"""
+        return cls(M[0][:4] + M[1][:4] + M[2][:4])
+
+    def to_matrix(self):
+        """转换为4x4矩阵（列表的列表）"""
+        m = self.m
+        return [m[0:4], m[4:8], m[8:12], [0.0, 0.0, 0.0, 1.0]]
+
+    def get_pose_zyx(self):
+        """提取Z-Y-X欧拉角（与PrecisionTransform.get_pose_zyx相同）"""
+        m = self.m
+        pose = PrecisionPose()
+        pose.X = m[3]
+        pose.Y = m[7]
+        pose.Z = m[11]
+
+        sy = math.sqrt(m[0] ** 2 + m[4] ** 2)
+        if sy >= 1e-12:
+            pose.R = math.atan2(m[4], m[0])    # 绕Z轴
+            pose.P = math.atan2(-m[8], sy)     # 绕Y轴
+            pose.W = math.atan2(m[9], m[10])   # 绕X轴
+        else:
+            pose.R = math.atan2(-m[1], m[5])
+            pose.P = math.atan2(-m[8], sy)
+            pose.W = 0.0
+
+        pose.W = math.degrees(pose.W)
+        pose.P = math.degrees(pose.P)
+        pose.R = math.degrees(pose.R)
+        return pose
+
+    @staticmethod
+    def _compose(a, b):
+        """组合两个扁平变换 a * b，返回新的扁平列表"""
+        a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11 = a
+        b0, b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11 = b
+        return [
+            a0 * b0 + a1 * b4 + a2 * b8, a0 * b1 + a1 * b5 + a2 * b9,
+            a0 * b2 + a1 * b6 + a2 * b10, a0 * b3 + a1 * b7 + a2 * b11 + a3,
+            a4 * b0 + a5 * b4 + a6 * b8, a4 * b1 + a5 * b5 + a6 * b9,
+            a4 * b2 + a5 * b6 + a6 * b10, a4 * b3 + a5 * b7 + a6 * b11 + a7,
+            a8 * b0 + a9 * b4 + a10 * b8, a8 * b1 + a9 * b5 + a10 * b9,
+            a8 * b2 + a9 * b6 + a10 * b10, a8 * b3 + a9 * b7 + a10 * b11 + a11,
+        ]
+
+    @staticmethod
+    def _invert(m):
+        """刚体变换求逆：旋转部分转置，平移部分为 -R^T * t，返回新的扁平列表"""
+        r00, r01, r02, tx, r10, r11, r12, ty, r20, r21, r22, tz = m
+        return [
+            r00, r10, r20, -(r00 * tx + r10 * ty + r20 * tz),
+            r01, r11, r21, -(r01 * tx + r11 * ty + r21 * tz),
+            r02, r12, r22, -(r02 * tx + r12 * ty + r22 * tz),
+        ]
+
+    def __mul__(self, other):
+        """组合变换 self * other"""
+        return RigidTransform(self._compose(self.m, other.m))
+
+    def __imul__(self, other):
+        """原地组合 self = self * other"""
+        self.m[:] = self._compose(self.m, other.m)
+        return self
+
+    def premultiply(self, other):
+        """原地左乘 self = other * self"""
+        self.m[:] = self._compose(other.m, self.m)
+        return self
+
+    def inverse(self):
+        """求逆，返回新的变换"""
+        return RigidTransform(self._invert(self.m))
+
+    def invert(self):
+        """原地求逆"""
+        self.m[:] = self._invert(self.m)
+        return self
+
+
+class TransformCache:
+    """
+    位姿→变换转换的LRU缓存
+
+    按位姿的精确数值缓存from_pose_zyx的结果、其逆以及由这些变换派生的组合结果，
+    超过max_size条时淘汰最久未使用的条目。缓存的变换对象在调用方之间共享，不能原地修改（invert、*=等）。
+    """
+
+    def __init__(self, max_size):
+        self.max_size = int(max_size)
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def pose_key(pose):
+        """位姿的缓存键（精确数值）"""
+        return (pose.X, pose.Y, pose.Z, pose.W, pose.P, pose.R)
+
+    def get(self, key, factory):
+        """
+        读取缓存，未命中时调用factory()计算并缓存
+
+        参数：
+        - key: 可哈希的缓存键
+        - factory: 无参数的计算函数
+
+        返回：
+        - 缓存的值（共享对象，不能原地修改）
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return value
+            self._stats["misses"] += 1
+        value = factory()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+        return value
+
+    def from_pose_zyx(self, pose):
+        """缓存的RigidTransform.from_pose_zyx"""
+        return self.get(("pose", self.pose_key(pose)), lambda: RigidTransform.from_pose_zyx(pose))
+
+    def inverse_of_pose(self, pose):
+        """缓存的RigidTransform.from_pose_zyx(pose).inverse()"""
+        return self.get(("inverse", self.pose_key(pose)), lambda: self.from_pose_zyx(pose).inverse())
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        缓存统计
+
+        返回：
+        - dict: 条目数、容量及命中统计
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+            stats["max_size"] = self.max_size
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+            return stats
+
+
+class ArmSession:
+    """Arm连接会话，连接池中的单个长连接"""
+    def __init__(self, index):
+        self.index = index
+        self.arm = None
+        # 会话锁：借出期间持有，心跳只检查未被占用的会话
+        self.lock = threading.Lock()
+        # 心跳维护的连接存活状态，指令调用时直接读取
+        self.alive = False
+        self.alive_at = 0.0
+        self.checked_out_at = 0.0
+        # 心跳后台重连连续失败的次数，只在断开和恢复时记录日志
+        self.reconnect_failures = 0
+
+    def set_alive(self, alive):
+        """更新连接存活状态"""
+        self.alive = alive
+        self.alive_at = time.monotonic()
+
+    def is_fresh(self, staleness):
+        """连接存活且心跳结果未过期"""
+        return self.arm is not None and self.alive and time.monotonic() - self.alive_at <= staleness
+
+
+class ArmSessionPool:
+    """Arm连接池，并发调用指令时每个调用借出独立的连接，用完归还"""
+    def __init__(self, size):
+        self.size = max(1, int(size))
+        self.sessions = [ArmSession(i) for i in range(self.size)]
+        # 后进先出：优先复用最近使用过（已连接）的会话
+        self._idle = queue.LifoQueue()
+        for session in reversed(self.sessions):
+            self._idle.put(session)
+        self._stats_lock = threading.Lock()
+        self._created_at = time.monotonic()
+        self._in_use = 0
+        self._peak_in_use = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._busy_total = 0.0
+
+    def checkout(self, timeout):
+        """
+        借出一个会话
+
+        参数：
+        - timeout: 最长等待时间（秒）
+
+        返回：
+        - ArmSession: 会话对象，超时返回None
+        """
+        start = time.monotonic()
+        try:
+            session = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            session = None
+        # 心跳正在检查或重连该会话时，等待剩余的超时时间
+        if session is not None and not session.lock.acquire(timeout=max(0.0, timeout - (time.monotonic() - start))):
+            self._idle.put(session)
+            session = None
+        if session is None:
+            with self._stats_lock:
+                self._timeouts += 1
+            return None
+        return self._acquire(session, start)
+
+    def try_checkout(self):
+        """
+        借出一个空闲会话，不等待
+
+        心跳正在检查或重连的会话（会话锁被占用）跳过，放回空闲队列。
+
+        返回：
+        - ArmSession: 会话对象，没有可立即借出的会话时返回None
+        """
+        start = time.monotonic()
+        skipped = []
+        try:
+            while True:
+                try:
+                    session = self._idle.get_nowait()
+                except queue.Empty:
+                    return None
+                if session.lock.acquire(blocking=False):
+                    return self._acquire(session, start)
+                skipped.append(session)
+        finally:
+            for session in reversed(skipped):
+                self._idle.put(session)
+
+    def _acquire(self, session, start):
+        """记录借出统计（调用方已锁定会话）"""
+        now = time.monotonic()
+        session.checked_out_at = now
+        wait = now - start
+        with self._stats_lock:
+            self._checkouts += 1
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+        return session
+
+    def release(self, session):
+        """归还会话"""
+        busy = time.monotonic() - session.checked_out_at
+        with self._stats_lock:
+            self._in_use -= 1
+            self._busy_total += busy
+        session.lock.release()
+        self._idle.put(session)
+
+    def stats(self):
+        """
+        连接池统计
+
+        返回：
+        - dict: 排队等待时间、利用率等统计信息
+        """
+        with self._stats_lock:
+            elapsed = max(time.monotonic() - self._created_at, 1e-9)
+            checkouts = self._checkouts
+            return {
+                "size": self.size,
+                "connected": sum(1 for session in self.sessions if session.arm is not None),
+                "in_use": self._in_use,
+                "peak_in_use": self._peak_in_use,
+                "checkouts": checkouts,
+                "timeouts": self._timeouts,
+                "avg_wait_ms": (self._wait_total / checkouts * 1000.0) if checkouts else 0.0,
+                "max_wait_ms": self._wait_max * 1000.0,
+                "utilization": self._busy_total / (elapsed * self.size),
+            }
+
+
+class CircuitBreaker:
+    """
+    连接熔断器
+
+    状态说明：
+    - closed: 正常，允许连接
+    - open: 熔断，直接失败，熔断时长按指数退避并加随机抖动
+    - half_open: 熔断时长结束，只放行一次探测连接，成功则恢复，失败则再次熔断
+    """
+    def __init__(self, failure_threshold, base_delay, max_delay):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.base_delay = float(base_delay)
+        self.max_delay = float(max_delay)
+        self.state = "closed"
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._open_count = 0
+        self._open_until = 0.0
+        self._probing = False
+        self._rejected = 0
+        self._transitions = {}
+
+    def _transition(self, state):
+        """切换状态并记录状态转换次数"""
+        if state == self.state:
+            return
+        key = f"{self.state}->{state}"
+        self._transitions[key] = self._transitions.get(key, 0) + 1
+        logger.warning(f"连接熔断器状态变化：{key}")
+        self.state = state
+
+    def _open(self):
+        """进入熔断状态，熔断时长 = min(基础时长 * 2^连续熔断次数, 最大时长) * 随机抖动(0.5~1.0)"""
+        delay = min(self.base_delay * (2 ** self._open_count), self.max_delay)
+        delay *= random.uniform(0.5, 1.0)
+        self._open_count += 1
+        self._open_until = time.monotonic() + delay
+        self._probing = False
+        self._transition("open")
+
+    def allow(self):
+        """
+        是否允许发起连接
+
+        返回：
+        - bool: True=允许连接，False=熔断中
+        """
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() >= self._open_until:
+                self._transition("half_open")
+            if self.state == "half_open" and not self._probing:
+                self._probing = True
+                return True
+            self._rejected += 1
+            return False
+
+    def retry_after(self):
+        """距离下次允许探测连接的剩余时间（秒）"""
+        return max(0.0, self._open_until - time.monotonic())
+
+    def record_success(self):
+        """连接成功，恢复正常状态"""
+        with self._lock:
+            self._failures = 0
+            self._open_count = 0
+            self._probing = False
+            self._transition("closed")
+
+    def record_failure(self):
+        """连接失败，达到阈值或探测失败时熔断"""
+        with self._lock:
+            self._failures += 1
+            if self.state == "half_open" or self._failures >= self.failure_threshold:
+                self._open()
+
+    def stats(self):
+        """
+        熔断器统计
+
+        返回：
+        - dict: 当前状态、拒绝次数及各状态转换次数
+        """
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self._failures,
+                "retry_after": self.retry_after() if self.state == "open" else 0.0,
+                "rejected": self._rejected,
+                "transitions": dict(self._transitions),
+            }
+
+
+class LatencyHistogram:
+    """固定分桶的延迟直方图，按桶估算p50/p95/p99"""
+    def __init__(self, bounds_ms):
+        self.bounds_ms = tuple(bounds_ms)
+        self.counts = [0] * (len(self.bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms):
+        """记录一次耗时（毫秒）"""
+        self.counts[bisect.bisect_left(self.bounds_ms, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+
+    def percentile(self, q):
+        """
+        估算百分位耗时（取所在桶的上限，溢出桶取最大值）
+
+        参数：
+        - q: 百分位（0-100）
+
+        返回：
+        - float: 耗时（毫秒）
+        """
+        if self.count == 0:
+            return 0.0
+        target = self.count * q / 100.0
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target and bucket_count:
+                if index < len(self.bounds_ms):
+                    return min(float(self.bounds_ms[index]), self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    def summary(self):
+        """
+        直方图摘要
+
+        返回：
+        - dict: 调用次数、平均/最大耗时、p50/p95/p99及各桶计数
+        """
+        buckets = {f"<={bound}ms": count for bound, count in zip(self.bounds_ms, self.counts)}
+        buckets[f">{self.bounds_ms[-1]}ms"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "avg_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "buckets": buckets,
+        }
+
+
+class RegisterCache:
+    """
+    寄存器读缓存（寄存器镜像）
+
+    只缓存已成功订阅的寄存器，订阅消息到达时更新或失效对应缓存；
+    超过staleness秒没有收到可解析的寄存器订阅消息时缓存整体视为失效，读寄存器回退为RPC。
+    配置镜像范围时，订阅线程在通道建立后批量预读范围内的寄存器（seed），稳态下读寄存器不再需要RPC。
+    每个寄存器维护版本号，值每变化（更新、失效）一次加1，通道重建后继续递增，调用方可据此判断是否需要重新计算。
+    """
+    _MISSING = object()
+
+    def __init__(self, staleness):
+        self.staleness = float(staleness)
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._versions = {}
+        # 已订阅的寄存器，以及读取时发现、等待订阅线程订阅的寄存器
+        self._watched = set()
+        self._pending = set()
+        self._active_at = 0.0
+        # 预读期间通道尚未确认，此时的读取不计入统计
+        self._seeding = False
+        # 预读开始时各寄存器的版本号，预读期间版本变化（收到订阅消息）的寄存器不写入预读结果
+        self._seed_versions = {}
+        self._stats = {
+            "hits": 0, "misses": 0, "stale": 0, "updates": 0, "invalidations": 0,
+            "messages": 0, "ignored": 0, "seeded": 0,
+        }
+
+    def is_live(self):
+        """staleness秒内收到过寄存器订阅消息"""
+        return self._active_at > 0.0 and time.monotonic() - self._active_at <= self.staleness
+
+    def touch(self):
+        """收到寄存器订阅消息时调用，刷新活动时间"""
+        self._active_at = time.monotonic()
+
+    def watermark(self):
+        """
+        镜像的陈旧水位：距最后一条寄存器订阅消息的秒数
+
+        返回：
+        - float: 秒数，通道未建立时返回None
+        """
+        active_at = self._active_at
+        return time.monotonic() - active_at if active_at > 0.0 else None
+
+    def _set(self, key, value):
+        """更新缓存值并递增版本号（调用方持有锁）"""
+        self._entries[key] = copy.deepcopy(value) if key[0] == "PR" else value
+        self._versions[key] = self._versions.get(key, 0) + 1
+
+    def _drop(self, key):
+        """删除缓存值并递增版本号（调用方持有锁），返回是否删除"""
+        # 未缓存时也递增版本号，正在进行的RPC读取结果不再回填
+        self._versions[key] = self._versions.get(key, 0) + 1
+        return self._entries.pop(key, self._MISSING) is not self._MISSING
+
+    def lookup(self, kind, reg_id):
+        """
+        直接查询镜像（不计入统计，也不登记订阅）
+
+        参数：
+        - kind: 寄存器类型（R/PR/SR）
+        - reg_id: 寄存器编号
+
+        返回：
+        - 寄存器值（PR返回副本），未缓存或订阅失效时返回None
+        - int: 版本号，从未缓存过时为0
+        """
+        key = (kind, reg_id)
+        with self._lock:
+            version = self._versions.get(key, 0)
+            value = self._entries.get(key) if self.is_live() else None
+        return copy.deepcopy(value) if kind == "PR" else value, version
+
+    def version(self, kind, reg_id):
+        """寄存器版本号，从未缓存过时为0"""
+        with self._lock:
+            return self._versions.get((kind, reg_id), 0)
+
+    def get(self, kind, reg_id):
+        """
+        读取缓存
+
+        参数：
+        - kind: 寄存器类型（R/PR/SR）
+        - reg_id: 寄存器编号
+
+        返回：
+        - bool: 是否命中
+        - 寄存器值（PR返回副本，调用方可直接修改），未命中返回None
+        """
+        key = (kind, reg_id)
+        with self._lock:
+            if key not in self._watched:
+                self._pending.add(key)
+            if not self.is_live():
+                if not self._seeding:
+                    self._stats["stale"] += 1
+                return False, None
+            value = self._entries.get(key, self._MISSING)
+            if value is self._MISSING:
+                self._stats["misses"] += 1
+                return False, None
+            self._stats["hits"] += 1
+        return True, copy.deepcopy(value) if kind == "PR" else value
+
+    def fill(self, kind, reg_id, value, version):
+        """
+        RPC读取成功后回填缓存
+
+        参数：
+        - kind: 寄存器类型（R/PR/SR）
+        - reg_id: 寄存器编号
+        - value: 读取到的值
+        - version: RPC读取前的版本号，读取期间收到订阅消息（版本号变化）时不回填
+        """
+        key = (kind, reg_id)
+        with self._lock:
+            if key in self._watched and key not in self._entries and self._versions.get(key, 0) == version:
+                self._set(key, value)
+
+    def seed(self, results):
+        """
+        批量预读完成后写入镜像（预读期间收到订阅消息的寄存器不写入）
+
+        参数：
+        - results: [((寄存器类型, 编号), 值)]
+        """
+        with self._lock:
+            for key, value in results:
+                # 预读借用的连接池连接可能已通过读缓存回填
+                if (
+                    key in self._watched and key not in self._entries
+                    and self._versions.get(key, 0) == self._seed_versions.get(key, 0)
+                ):
+                    self._set(key, value)
+                self._stats["seeded"] += 1
+
+    def begin_seed(self, keys):
+        """
+        开始预读：登记预读寄存器已订阅，预读结束前的读取不计入统计
+
+        参数：
+        - keys: [(寄存器类型, 编号)]
+        """
+        with self._lock:
+            self._seeding = True
+            self._seed_versions = {key: self._versions.get(key, 0) for key in keys}
+            self._watched.update(keys)
+            self._pending.difference_update(keys)
+
+    def end_seed(self):
+        """预读结束"""
+        with self._lock:
+            self._seeding = False
+            self._seed_versions = {}
+
+    def store(self, kind, reg_id, value):
+        """写寄存器成功后同步更新缓存"""
+        key = (kind, reg_id)
+        with self._lock:
+            if key in self._watched:
+                self._set(key, value)
+
+    def invalidate(self, kind=None, reg_id=None):
+        """使缓存失效：指定编号时只失效单个寄存器，只指定类型时失效该类型全部寄存器，都不指定时全部失效"""
+        with self._lock:
+            if kind is not None and reg_id is not None:
+                removed = 1 if self._drop((kind, reg_id)) else 0
+            else:
+                keys = [key for key in self._entries if kind is None or key[0] == kind]
+                for key in keys:
+                    self._drop(key)
+                removed = len(keys)
+            self._stats["invalidations"] += removed
+
+    def take_pending(self):
+        """取出等待订阅的寄存器"""
+        with self._lock:
+            pending, self._pending = self._pending, set()
+            return pending
+
+    def mark_watched(self, keys):
+        """寄存器订阅成功"""
+        with self._lock:
+            self._watched.update(keys)
+
+    def reset(self):
+        """订阅通道断开：清空缓存，已订阅的寄存器在通道恢复后重新订阅"""
+        with self._lock:
+            self._active_at = 0.0
+            self._seeding = False
+            self._pending.update(self._watched)
+            self._watched.clear()
+            for key in list(self._entries):
+                self._drop(key)
+
+    def apply_message(self, message):
+        """
+        处理一条寄存器订阅消息
+
+        R/SR消息直接更新缓存值，PR消息使对应缓存失效（下次读取时重新RPC读取完整结构）。
+        无法识别寄存器类型或编号的消息记录日志后忽略，不刷新通道活动时间：
+        消息格式与预期不符时镜像始终视为失效，读寄存器回退为RPC，不会返回过期的值。
+
+        返回：
+        - bool: 消息是否为可识别的寄存器消息
+        """
+        kind, reg_id, value = self._parse_message(message)
+        if kind is None or reg_id is None:
+            with self._lock:
+                self._stats["ignored"] += 1
+                first = self._stats["ignored"] == 1
+            # 只有第一条以warning记录，避免高频订阅消息刷屏
+            (logger.warning if first else logger.debug)(f"忽略无法识别的寄存器订阅消息：{str(message)[:200]}")
+            return False
+        if kind == "PR" or value is self._MISSING:
+            self.invalidate(kind, reg_id)
+        else:
+            with self._lock:
+                if (kind, reg_id) in self._watched:
+                    self._set((kind, reg_id), value)
+                    self._stats["updates"] += 1
+        with self._lock:
+            self._stats["messages"] += 1
+        self.touch()
+        return True
+
+    @classmethod
+    def _parse_message(cls, message):
+        """
+        解析寄存器订阅消息
+
+        消息格式为{_REG_MESSAGE_TYPE_KEY: 寄存器类型, _REG_MESSAGE_ID_KEY: 编号, _REG_MESSAGE_VALUE_KEY: 值}：
+        寄存器类型为RegTopicType或其值（SDK手册3.31.2："R"/"MR"/"SR"/"PR"，只处理R/PR/SR），编号为整数。
+        不符合该格式的消息不做猜测，一律视为无法识别。
+
+        返回：
+        - (寄存器类型, 编号, 值)，无法识别时类型或编号为None，消息不含值时值为_MISSING
+        """
+        if not isinstance(message, dict):
+            return None, None, cls._MISSING
+        kind = message.get(_REG_MESSAGE_TYPE_KEY)
+        if isinstance(kind, RegTopicType):
+            kind = kind.value
+        if kind not in ("R", "PR", "SR"):
+            return None, None, cls._MISSING
+        reg_id = message.get(_REG_MESSAGE_ID_KEY)
+        if isinstance(reg_id, bool) or not isinstance(reg_id, int):
+            return None, None, cls._MISSING
+        return kind, reg_id, message.get(_REG_MESSAGE_VALUE_KEY, cls._MISSING)
+
+    def stats(self):
+        """
+        缓存统计
+
+        返回：
+        - dict: 订阅状态、陈旧水位、已订阅/已缓存寄存器数量及命中统计
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["live"] = self.is_live()
+            stats["watermark"] = self.watermark()
+            stats["watched"] = len(self._watched)
+            stats["cached"] = len(self._entries)
+            lookups = stats["hits"] + stats["misses"] + stats["stale"]
+            stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+            return stats
+
+
+def __object_signature(obj, skip=None, depth=0):
+    """
+    对象的结构签名：递归展开属性为可比较的元组，用于比较位姿以外的字段（名称、注释、形态等）及坐标系缓存判断值是否变化
+
+    参数：
+    - obj: 对象
+    - skip: 不展开的子对象（已按容差单独比较的位姿对象）
+    - depth: 当前递归深度
+
+    返回：
+    - 可用==比较的签名；无法展开的对象返回一个新的object()，与任何签名都不相等（视为已变化，不跳过写入）
+    """
+    if obj is skip:
+        return None
+    if obj is None or isinstance(obj, (str, bytes, int, float, enum.Enum)):
+        return obj
+    if depth >= 8:
+        return object()
+    if isinstance(obj, (list, tuple)):
+        return tuple(__object_signature(item, skip, depth + 1) for item in obj)
+    if isinstance(obj, dict):
+        return tuple(sorted((str(key), __object_signature(value, skip, depth + 1)) for key, value in obj.items()))
+    attrs = getattr(obj, '__dict__', None)
+    if attrs is None:
+        return object()
+    return (type(obj).__name__,) + tuple(
+        (name, __object_signature(value, skip, depth + 1)) for name, value in sorted(attrs.items())
+    )
+
+
+class FrameCache:
+    """
+    TF/UF坐标系缓存
+
+    按(坐标系类型, 编号)缓存坐标系对象：由get_coordinate_list整表填充或get回填，
+    本插件写入成功后同步更新，读写失败时失效，缓存超过ttl秒后重新读取。
+    每个坐标系维护版本号，值变化或失效时加1；整表刷新及回填的值与缓存相同时版本号不变。
+    """
+
+    def __init__(self, ttl, signature):
+        self.ttl = float(ttl)
+        # 坐标系对象的结构签名函数（__object_signature），用于判断值是否变化
+        self._signature = signature
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._versions = {}
+        # 每种坐标系最近一次整表读取的时间
+        self._listed_at = {}
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "list_fills": 0, "stores": 0, "invalidations": 0}
+
+    def _set(self, key, coordinate, now):
+        """更新缓存，值与已缓存的不同时递增版本号（调用方持有锁）"""
+        signature = self._signature(coordinate)
+        entry = self._entries.get(key)
+        self._entries[key] = (copy.deepcopy(coordinate), now, signature)
+        if entry is None or entry[2] != signature:
+            self._versions[key] = self._versions.get(key, 0) + 1
+
+    def get(self, kind, frame_id, count=True):
+        """
+        读取缓存
+
+        参数：
+        - kind: 坐标系类型（TF/UF）
+        - frame_id: 坐标系编号
+        - count: 是否计入命中统计
+
+        返回：
+        - bool: 是否命中
+        - 坐标系对象副本（调用方可直接修改），未命中返回None
+        """
+        with self._lock:
+            entry = self._entries.get((kind, frame_id))
+            if entry is None:
+                if count:
+                    self._stats["misses"] += 1
+                return False, None
+            if time.monotonic() - entry[1] > self.ttl:
+                if count:
+                    self._stats["expired"] += 1
+                return False, None
+            if count:
+                self._stats["hits"] += 1
+            coordinate = entry[0]
+        return True, copy.deepcopy(coordinate)
+
+    def list_due(self, kind):
+        """距上次整表读取已超过ttl秒（坐标系不存在时避免每次都整表读取）"""
+        with self._lock:
+            listed_at = self._listed_at.get(kind)
+            return listed_at is None or time.monotonic() - listed_at > self.ttl
+
+    def store(self, kind, coordinate):
+        """读取或写入成功后更新单个坐标系"""
+        frame_id = getattr(coordinate, 'id', None)
+        if frame_id is None:
+            return
+        with self._lock:
+            self._set((kind, frame_id), coordinate, time.monotonic())
+            self._stats["stores"] += 1
+
+    def store_all(self, kind, coordinates):
+        """整表读取成功后更新该类型全部坐标系"""
+        now = time.monotonic()
+        with self._lock:
+            for coordinate in coordinates:
+                frame_id = getattr(coordinate, 'id', None)
+                if frame_id is not None:
+                    self._set((kind, frame_id), coordinate, now)
+            self._listed_at[kind] = now
+            self._stats["list_fills"] += 1
+
+    def invalidate(self, kind=None, frame_id=None):
+        """使缓存失效：指定编号时只失效单个坐标系，只指定类型时失效该类型全部坐标系，都不指定时全部失效"""
+        with self._lock:
+            keys = [
+                key for key in self._entries
+                if (kind is None or key[0] == kind) and (frame_id is None or key[1] == frame_id)
+            ]
+            for key in keys:
+                del self._entries[key]
+                self._versions[key] = self._versions.get(key, 0) + 1
+            self._stats["invalidations"] += len(keys)
+
+    def version(self, kind, frame_id):
+        """坐标系版本号，从未缓存过时为0"""
+        with self._lock:
+            return self._versions.get((kind, frame_id), 0)
+
+    def stats(self):
+        """
+        缓存统计
+
+        返回：
+        - dict: 已缓存坐标系数量及命中统计
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["cached"] = len(self._entries)
+            lookups = stats["hits"] + stats["misses"] + stats["expired"]
+            stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+            return stats
+
+
+class FrameTransaction:
+    """
+    坐标系及R寄存器修改事务
+
+    修改先暂存在内存中，提交时一批并发读取涉及的坐标系、R寄存器（修改前的值）及数据来源寄存器，
+    全部验证通过后一批并发写入；任一写入失败时用读取到的修改前的值恢复已写入的项。
+    提交后保留修改前的值，回滚时直接写回，不需要重新读取控制器。
+
+    状态：open（暂存中）、committed（已提交）、rolled_back（已回滚）
+    """
+
+    def __init__(self, txn_id):
+        self.txn_id = txn_id
+        self.lock = threading.Lock()
+        self.state = "open"
+        # 坐标系修改：(坐标系类型, 编号) -> [(位置参数编号, 来源, 值)]，按暂存顺序应用
+        self.frame_edits = {}
+        # R寄存器修改：编号 -> 值
+        self.register_edits = {}
+        # 提交时读取的修改前的值：(类型, 编号) -> 坐标系对象或R寄存器值
+        self.pre_image = {}
+        self.created_at = time.monotonic()
+
+    def edit_count(self):
+        """暂存的修改数"""
+        return sum(len(edits) for edits in self.frame_edits.values()) + len(self.register_edits)
+
+    def stage_frame(self, frame_type, frame_id, pos, source, value):
+        """
+        暂存坐标系修改
+
+        参数：
+        - frame_type: 坐标系类型（TF/UF）
+        - frame_id: 坐标系编号
+        - pos: 位置参数编号（1-6），来源为PR寄存器时忽略
+        - source: 0=参数值，1=R寄存器编号，2=PR寄存器编号（完整位姿）
+        - value: 参数值或寄存器编号
+        """
+        self.frame_edits.setdefault((frame_type, frame_id), []).append((pos, source, value))
+
+    def stage_register(self, r_id, value):
+        """暂存R寄存器修改"""
+        self.register_edits[r_id] = value
+
+    def touched(self):
+        """
+        事务修改的项
+
+        返回：
+        - list: [(类型, 编号)]，类型为TF/UF/R
+        """
+        return sorted(self.frame_edits) + [("R", r_id) for r_id in sorted(self.register_edits)]
+
+
+class TFShiftContext:
+    """
+    TFShift基准上下文
+
+    由基准工具坐标系、拍照点及基准视觉模板预先计算出与实际视觉坐标无关的变换，
+    之后每个工件的补正只需转换实际视觉坐标并做两次组合。
+    key为三者的位姿数值；versions为读取前三者在坐标系缓存及寄存器镜像中的版本号，用于判断基准数据是否变化。
+    """
+
+    def __init__(self, input_tf_id, cam_pose_id, ref_vis_id, ut1_ut0, ut1_uf1_pr2, c1_uf1, versions):
+        self.input_tf_id = input_tf_id
+        self.cam_pose_id = cam_pose_id
+        self.ref_vis_id = ref_vis_id
+        self.ut1_ut0 = ut1_ut0
+        self.ut1_uf1_pr2 = ut1_uf1_pr2
+        self.c1_uf1 = c1_uf1
+        ut1_ut0_key = TransformCache.pose_key(ut1_ut0)
+        pr2_key = TransformCache.pose_key(ut1_uf1_pr2)
+        c1_key = TransformCache.pose_key(c1_uf1)
+        self.key = (ut1_ut0_key, pr2_key, c1_key)
+        self.versions = versions
+
+        # 工件C1在工具坐标系中的位姿：T_UT1_C1 = inv(T_UF1_UT1_PR2) * T_UF1_C1，及其逆
+        self.T_UT1_C1 = _transform_cache.get(
+            ("UT1_C1", pr2_key, c1_key),
+            lambda: _transform_cache.inverse_of_pose(ut1_uf1_pr2) * _transform_cache.from_pose_zyx(c1_uf1)
+        )
+        self.T_C1_UT1 = _transform_cache.get(("C1_UT1", pr2_key, c1_key), self.T_UT1_C1.inverse)
+        # T_UT0_UT1 * inv(T_UF1_UT1_PR2)
+        self.T_UT0_UF1 = _transform_cache.get(
+            ("UT0_UF1", ut1_ut0_key, pr2_key),
+            lambda: _transform_cache.from_pose_zyx(ut1_ut0) * _transform_cache.inverse_of_pose(ut1_uf1_pr2)
+        )
+        self.armed_at = time.monotonic()
+
+    def same_source(self, other):
+        """两个上下文来自相同的坐标系、寄存器编号及位姿数值"""
+        return (
+            (self.input_tf_id, self.cam_pose_id, self.ref_vis_id, self.key)
+            == (other.input_tf_id, other.cam_pose_id, other.ref_vis_id, other.key)
+        )
+
+    def correct(self, c2_uf1):
+        """
+        计算新的工具坐标系TF2相对于TF0的位姿
+
+        参数：
+        - c2_uf1: 实际视觉坐标（工件C2在视觉坐标系中的位姿，PrecisionPose）
+
+        返回：
+        - PrecisionPose: TF2相对于TF0的位姿
+        """
+        # T_UT0_UT1 * T_UT1_C2 * inv(T_UT1_C1)，其中T_UT1_C2 = inv(T_UF1_UT1_PR2) * T_UF1_C2
+        T_UF1_C2 = RigidTransform.from_pose_zyx(c2_uf1)
+        T_UT0_UT2 = self.T_UT0_UF1 * T_UF1_C2 * self.T_C1_UT1
+
+        # 验证计算（可选）
+        if _TFSHIFT_VERIFY:
+            poseC1_in_UT1 = self.T_UT1_C1.get_pose_zyx()
+            T_UF1_UT0 = _transform_cache.get(
+                ("UF1_UT0", self.key[0], self.key[1]),
+                lambda: _transform_cache.from_pose_zyx(self.ut1_uf1_pr2) * _transform_cache.inverse_of_pose(self.ut1_ut0)
+            )
+            T_UF1_UT2 = T_UF1_UT0 * T_UT0_UT2
+            T_UT2_C2_actual = T_UF1_UT2.inverse() * T_UF1_C2
+            poseC2_in_UT2_actual = T_UT2_C2_actual.get_pose_zyx()
+
+            errorX = abs(poseC1_in_UT1.X - poseC2_in_UT2_actual.X)
+            errorY = abs(poseC1_in_UT1.Y - poseC2_in_UT2_actual.Y)
+            errorR = abs(poseC1_in_UT1.R - poseC2_in_UT2_actual.R)
+            logger.info(f"误差分析: ΔX={errorX:.12e}, ΔY={errorY:.12e}, ΔR={errorR:.12e}")
+
+        return T_UT0_UT2.get_pose_zyx()
+
+
+# 连接熔断器，控制器不可达时快速失败，避免每次指令调用都阻塞在连接超时上
+_connect_breaker = CircuitBreaker(_BREAKER_FAILURE_THRESHOLD, _BREAKER_BASE_DELAY, _BREAKER_MAX_DELAY)
+
+# 全局Arm连接池，用于长连接
+_arm_pool = ArmSessionPool(_ARM_POOL_SIZE)
+
+# 寄存器读缓存/寄存器镜像（_REG_CACHE_ENABLED开启时由订阅线程维护）
+_register_cache = RegisterCache(_REG_CACHE_STALENESS)
+
+# TF/UF坐标系缓存（_FRAME_CACHE_ENABLED开启时使用）
+_frame_cache = FrameCache(_FRAME_CACHE_TTL, __object_signature)
+
+# 位姿→变换转换LRU缓存（TFShift中基准工具坐标系、拍照点、基准视觉模板通常不变）
+_transform_cache = TransformCache(_TRANSFORM_CACHE_SIZE)
+
+
+# PR寄存器编号属性名（id、registerIndex或index），首次访问编号时从SDK返回的PR寄存器对象上探测一次
+_pr_index_attr = None
+
+
+def __probe_pr_index_attr(pr_register):
+    """
+    获取PR寄存器对象的编号属性名
+
+    不同SDK版本中PR寄存器编号可能为id、registerIndex或index属性，
+    首次调用时在SDK返回的PR寄存器对象上探测一次，之后直接返回探测结果。
+
+    返回：
+    - str: 编号属性名，对象上三者都没有时返回None
+    """
+    global _pr_index_attr
+    if _pr_index_attr is None:
+        for attr in ('id', 'registerIndex', 'index'):
+            if hasattr(pr_register, attr):
+                _pr_index_attr = attr
+                break
+    return _pr_index_attr
+
+
+def __get_pr_index(pr_register):
+    """
+    读取PR寄存器对象的编号
+
+    返回：
+    - int: PR寄存器编号，对象没有编号属性时返回None
+    """
+    attr = _pr_index_attr
+    if attr is None:
+        attr = __probe_pr_index_attr(pr_register)
+        if attr is None:
+            return None
+    return getattr(pr_register, attr, None)
+
+
+def __pr_position(pr_register):
+    """
+    获取PR寄存器的笛卡尔位姿对象（x/y/z/a/b/c）
+
+    返回：
+    - position对象，PR寄存器不包含位姿数据时返回None
+    """
+    try:
+        return pr_register.poseRegisterData.cartData.position
+    except AttributeError:
+        return None
+
+
+def __set_pr_index(pr_register, pr_id: int):
+    """
+    设置PR寄存器对象的编号（对象没有编号属性时不设置）
+    """
+    attr = _pr_index_attr
+    if attr is None:
+        attr = __probe_pr_index_attr(pr_register)
+        if attr is None:
+            return
+    setattr(pr_register, attr, pr_id)
+
+
 def __get_robot_ip():
     """
-    获取机器人IP地址
+    获取机器人IP地址（带缓存）
 
     SDK 2.0.0.0版本中，Extension类可以独立使用来获取机器人IP地址。
+    获取成功后缓存_ROBOT_IP_CACHE_TTL秒，重连时直接复用缓存的IP，
+    避免每次重连都额外请求一次IP。
 
     返回：
     - str: 机器人IP地址，失败返回None
     """
+    now = time.monotonic()
+    with _robot_ip_cache_lock:
+        cached_ip = _robot_ip_cache["ip"]
+        if cached_ip is not None and now < _robot_ip_cache["expire_at"]:
+            _robot_ip_cache_stats["hits"] += 1
+            return cached_ip
+        _robot_ip_cache_stats["misses"] += 1
+
     try:
         # SDK 2.0.0.0中，Extension类可以独立实例化
         extension = Extension()
         robot_ip = extension.get_robot_ip()
-        return robot_ip
     except Exception as ex:
         logger.error(f"获取机器人IP失败: {ex}")
         return None
 
+    if robot_ip:
+        with _robot_ip_cache_lock:
+            _robot_ip_cache["ip"] = robot_ip
+            _robot_ip_cache["expire_at"] = now + _ROBOT_IP_CACHE_TTL
+    return robot_ip
 
-def __get_arm_connection():
+
+def __invalidate_robot_ip():
     """
-    获取Arm连接（长连接机制）
-    如果未连接则连接，已连接则复用
+    使机器人IP缓存失效（连接失败时调用，下次重连将重新获取IP）
+    """
+    with _robot_ip_cache_lock:
+        cached_ip = _robot_ip_cache["ip"]
+        if cached_ip is not None:
+            _robot_ip_cache_stats["invalidations"] += 1
+        _robot_ip_cache["ip"] = None
+        _robot_ip_cache["expire_at"] = 0.0
+    if cached_ip is not None:
+        logger.info(f"机器人IP缓存已失效：{cached_ip}")
+
+
+def __get_robot_ip_cache_stats():
+    """
+    获取机器人IP缓存统计
+
+    返回：
+    - dict: {"ip": str, "hits": int, "misses": int, "invalidations": int}
+    """
+    with _robot_ip_cache_lock:
+        stats = dict(_robot_ip_cache_stats)
+        stats["ip"] = _robot_ip_cache["ip"]
+    return stats
+
+
+def __connect_session(session):
+    """
+    为会话建立新的Arm连接（调用方必须持有会话锁）
+
+    参数：
+    - session: ArmSession对象
 
     返回：
     - Arm: Arm对象，失败返回None
     - str: 错误信息，成功返回None
     """
-    global _global_arm
-
     try:
-        # 如果已有连接且连接状态正常，直接返回
-        if _global_arm is not None:
+        session.alive = False
+        if session.arm is not None:
+            # 释放已断开的旧连接
+            _pr_templates.pop(id(session.arm), None)
             try:
-                if _global_arm.is_connected():
-                    return _global_arm, None
-            except:
-                # 连接状态检查失败，重置连接
-                _global_arm = None
+                session.arm.disconnect()
+            except Exception:
+                pass
+            session.arm = None
+
+        # 熔断期间直接失败，不再尝试获取IP和连接
+        if not _connect_breaker.allow():
+            return None, f"控制器不可达，连接已熔断，{_connect_breaker.retry_after():.1f}秒后重试"
 
-        # 创建新连接
         robot_ip = __get_robot_ip()
         if robot_ip is None:
+            _connect_breaker.record_failure()
             return None, "无法获取机器人IP地址"
 
-        _global_arm = Arm()
-        ret = _global_arm.connect(robot_ip)
+        arm = Arm()
+        ret = arm.connect(robot_ip)
         if ret != StatusCodeEnum.OK:
-            _global_arm = None
+            _connect_breaker.record_failure()
+            # IP可能已变更，使缓存失效，下次重连重新获取
+            __invalidate_robot_ip()
             error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
             return None, f"连接机器人失败，错误代码：{error_msg}"
 
-        return _global_arm, None
+        _connect_breaker.record_success()
+        __instrument_arm(arm)
+        __track_known_registers(arm)
+        # 未变化写入跳过挂载在缓存之下，只记录实际从控制器读取到的值
+        if _SKIP_UNCHANGED_WRITES:
+            __attach_write_elision(arm)
+        if _REG_CACHE_ENABLED:
+            __attach_register_cache(arm)
+        if _FRAME_CACHE_ENABLED:
+            __attach_frame_cache(arm)
+        session.arm = arm
+        session.set_alive(True)
+        session.reconnect_failures = 0
+        return arm, None
 
     except Exception as ex:
-        logger.error(f"获取Arm连接失败: {ex}")
-        _global_arm = None
+        # 错误信息由调用方返回或记录（心跳只在状态变化时记录）
+        logger.debug(f"获取Arm连接失败: {ex}")
+        _connect_breaker.record_failure()
+        session.arm = None
+        __invalidate_robot_ip()
         return None, f"获取连接失败：{str(ex)}"
 
 
-def __get_param_name(param_index: int):
+def __heartbeat_loop():
     """
-    将参数编号转换为属性名（SDK 2.0.0.0中直接使用a/b/c，不再需要r/p/y转换）
+    后台心跳：定期检查空闲会话的连接状态并刷新存活标志，连接断开时在后台主动重连
+    """
+    while True:
+        time.sleep(_HEARTBEAT_INTERVAL)
+        for session in _arm_pool.sessions:
+            # 跳过从未连接过的会话和正在执行指令的会话
+            if session.arm is None and not session.alive_at:
+                continue
+            if not session.lock.acquire(blocking=False):
+                continue
+            try:
+                alive = False
+                if session.arm is not None:
+                    try:
+                        alive = bool(session.arm.is_connected())
+                    except Exception:
+                        alive = False
+
+                if alive:
+                    session.set_alive(True)
+                    continue
+
+                session.set_alive(False)
+                failures = session.reconnect_failures
+                if failures == 0:
+                    logger.warning(f"心跳检测到连接[{session.index}]断开，后台重连中...")
+                arm, error = __connect_session(session)
+                if arm is None:
+                    session.reconnect_failures = failures + 1
+                    # 控制器不可达期间每次心跳都会重连失败，只记录第一次
+                    if failures == 0:
+                        logger.warning(f"连接[{session.index}]后台重连失败：{error}，恢复前不再重复记录")
+                    else:
+                        logger.debug(f"连接[{session.index}]后台重连失败（第{failures + 1}次）：{error}")
+                else:
+                    logger.info(f"连接[{session.index}]后台重连成功" + (f"（此前失败{failures}次）" if failures else ""))
+            except Exception as ex:
+                logger.error(f"心跳检测异常: {ex}")
+            finally:
+                session.lock.release()
 
-    参数：
-    - param_index: 1-6 (1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C)
+
+def __start_heartbeat():
+    """
+    启动后台心跳线程（仅启动一次）
+    """
+    global _heartbeat_thread
+
+    if _heartbeat_thread is not None and _heartbeat_thread.is_alive():
+        return
+    with _heartbeat_lock:
+        if _heartbeat_thread is not None and _heartbeat_thread.is_alive():
+            return
+        _heartbeat_thread = threading.Thread(target=__heartbeat_loop, name="CM-heartbeat", daemon=True)
+        _heartbeat_thread.start()
+
+
+def __with_arm_session(func):
+    """
+    指令装饰器：指令执行结束后将本次借出的连接归还连接池
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # 嵌套调用时沿用外层指令借出的连接
+        if getattr(_session_local, 'session', None) is not None:
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            session = getattr(_session_local, 'session', None)
+            _session_local.session = None
+            if session is not None:
+                _arm_pool.release(session)
+    return wrapper
+
+
+def __get_arm_connection():
+    """
+    获取Arm连接（长连接机制）
+    从连接池借出一个连接，如果未连接则连接，已连接则复用
+
+    连接状态由后台心跳维护，心跳结果在_HEARTBEAT_STALENESS秒内有效时直接复用连接，
+    不再每次调用is_connected()；心跳结果过期时才同步检查连接状态。
+    借出的连接由__with_arm_session在指令结束时归还。
 
     返回：
-    - str: 属性名 ('x', 'y', 'z', 'a', 'b', 'c')
+    - Arm: Arm对象，失败返回None
+    - str: 错误信息，成功返回None
     """
-    param_map = {
-        1: 'x',  # X坐标
-        2: 'y',  # Y坐标
-        3: 'z',  # Z坐标
-        4: 'a',  # 绕X轴旋转角度 (A)
-        5: 'b',  # 绕Y轴旋转角度 (B)
-        6: 'c'   # 绕Z轴旋转角度 (C)
-    }
-    return param_map.get(param_index)
+    session = getattr(_session_local, 'session', None)
+    if session is None:
+        session = _arm_pool.checkout(_ARM_POOL_CHECKOUT_TIMEOUT)
+        if session is None:
+            return None, f"等待可用连接超时（{_ARM_POOL_CHECKOUT_TIMEOUT}秒），连接池大小：{_arm_pool.size}"
+        _session_local.session = session
 
+    return __ensure_session_connected(session)
 
-def __create_r_register(arm, r_id: int, initial_value: float = 0.0):
+
+def __ensure_session_connected(session):
     """
-    创建并初始化R寄存器（如果不存在）
+    确保会话已连接（调用方必须持有会话锁），已连接则复用，未连接或已断开则重新连接
 
     参数：
-    - arm: Arm对象
-    - r_id: R寄存器编号
-    - initial_value: 初始值，默认为0.0
+    - session: ArmSession对象
 
     返回：
-    - tuple: (StatusCodeEnum, 是否创建成功)
+    - Arm: Arm对象，失败返回None
+    - str: 错误信息，成功返回None
     """
-    try:
-        # 尝试读取R寄存器，如果存在则直接返回
-        r_value, ret = arm.register.read_R(r_id)
-        if ret == StatusCodeEnum.OK:
-            logger.info(f"R寄存器[{r_id}]已存在，无需创建")
-            return StatusCodeEnum.OK, False
+    if session.arm is not None:
+        # 心跳结果有效，直接复用连接
+        if session.is_fresh(_HEARTBEAT_STALENESS):
+            return session.arm, None
 
-        # R寄存器不存在，尝试通过写入来创建
-        logger.info(f"R寄存器[{r_id}]不存在，尝试自动创建（初始值={initial_value}）...")
-
-        # 尝试写入初始值来创建R寄存器
-        ret = arm.register.write_R(r_id, initial_value)
-        if ret == StatusCodeEnum.OK:
-            logger.info(f"成功创建R寄存器[{r_id}]（初始值={initial_value}）")
-            # 验证创建是否成功
-            verify_value, verify_ret = arm.register.read_R(r_id)
-            if verify_ret == StatusCodeEnum.OK:
-                logger.info(f"R寄存器[{r_id}]创建并验证成功，当前值={verify_value}")
-                return StatusCodeEnum.OK, True
-            else:
-                logger.warning(f"R寄存器[{r_id}]写入成功但验证失败，错误代码：{verify_ret}")
-                return StatusCodeEnum.OK, True  # 仍然返回成功，因为write_R成功了
-        else:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            logger.error(f"创建R寄存器[{r_id}]失败，错误代码：{error_msg}")
-            return ret, False
+        # 心跳结果过期，同步检查连接状态
+        try:
+            if session.arm.is_connected():
+                session.set_alive(True)
+                return session.arm, None
+        except:
+            # 连接状态检查失败，重新连接
+            pass
 
-    except Exception as ex:
-        logger.error(f"创建R寄存器[{r_id}]时发生异常：{ex}")
-        return StatusCodeEnum.CONTROLLER_ERROR, False
+    # 创建新连接
+    arm, error = __connect_session(session)
+    if arm is not None:
+        __start_heartbeat()
+        if _REG_CACHE_ENABLED:
+            __start_register_cache()
+    return arm, error
 
 
-def __create_pr_register(arm, pr_id: int):
+def __fill_pool():
     """
-    创建并初始化PR寄存器（如果不存在）
-
-    参数：
-    - arm: Arm对象
-    - pr_id: PR寄存器编号
+    后台为连接池中尚未连接的空闲会话建立连接
 
-    返回：
-    - tuple: (pr_register对象, StatusCodeEnum) 或 (None, 错误代码)
+    一次借出全部空闲会话，已连接的立即归还，其余逐个连接后归还。
+    熔断器不是closed状态时不尝试，任一连接失败即停止，避免后台连接反复计入熔断器。
     """
+    global _pool_fill_running
     try:
-        # 尝试读取PR寄存器，如果存在则直接返回
-        pr_register, ret = arm.register.read_PR(pr_id)
-        if ret == StatusCodeEnum.OK:
-            logger.info(f"PR寄存器[{pr_id}]已存在，无需创建")
-            return pr_register, ret
-
-        # PR寄存器不存在，需要创建
-        logger.info(f"PR寄存器[{pr_id}]不存在，开始创建...")
-
-        # 尝试通过写入一个初始化的PR寄存器对象来创建
-        # 需要根据SDK的实际结构创建PR寄存器对象
-        # 这里先尝试读取一个已存在的PR寄存器作为模板（如果可能）
-        # 或者创建一个新的PR寄存器对象
-
-        # 方法1：尝试读取任意已存在的PR寄存器作为模板
-        # 从PR[1]开始尝试，如果不存在则尝试PR[2]、PR[3]等，最多尝试10个
-        template_pr = None
-        template_ret = None
-        for template_id in range(1, 11):
-            template_pr, template_ret = arm.register.read_PR(template_id)
-            if template_ret == StatusCodeEnum.OK:
-                logger.debug(f"使用PR[{template_id}]作为模板创建PR[{pr_id}]")
+        if _connect_breaker.state != "closed":
+            return
+        idle = []
+        while len(idle) < _arm_pool.size:
+            session = _arm_pool.try_checkout()
+            if session is None:
                 break
-
-        if template_ret == StatusCodeEnum.OK and template_pr is not None:
-            # 使用模板创建新的PR寄存器
-            # 复制模板结构，但将所有值设为0
-            pr_register = copy.deepcopy(template_pr)
-
-            # 初始化所有分量为0
-            if hasattr(pr_register, 'poseRegisterData') and \
-               hasattr(pr_register.poseRegisterData, 'cartData') and \
-               hasattr(pr_register.poseRegisterData.cartData, 'position'):
-                pr_position = pr_register.poseRegisterData.cartData.position
-                pr_position.x = 0.0
-                pr_position.y = 0.0
-                pr_position.z = 0.0
-                pr_position.a = 0.0
-                pr_position.b = 0.0
-                pr_position.c = 0.0
-
-                # 设置PR寄存器索引
-                if hasattr(pr_register, 'id'):
-                    pr_register.id = pr_id
-                elif hasattr(pr_register, 'registerIndex'):
-                    pr_register.registerIndex = pr_id
-                elif hasattr(pr_register, 'index'):
-                    pr_register.index = pr_id
-
-                # 尝试写入PR寄存器（如果SDK支持通过写入来创建）
-                ret = arm.register.write_PR(pr_register)
-                if ret == StatusCodeEnum.OK:
-                    logger.info(f"成功创建PR寄存器[{pr_id}]（使用模板）")
-                    # 验证创建是否成功
-                    verify_pr, verify_ret = arm.register.read_PR(pr_id)
-                    if verify_ret == StatusCodeEnum.OK:
-                        logger.info(f"PR寄存器[{pr_id}]创建并验证成功")
-                        return verify_pr, StatusCodeEnum.OK
-                    else:
-                        logger.warning(f"PR寄存器[{pr_id}]写入成功但验证失败，错误代码：{verify_ret}")
-                        return pr_register, StatusCodeEnum.OK  # 仍然返回成功，因为write_PR成功了
-                else:
-                    error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-                    logger.error(f"写入PR寄存器[{pr_id}]失败，错误代码：{error_msg}")
-                    return None, ret
+            idle.append(session)
+        unconnected = []
+        for session in idle:
+            if session.arm is None:
+                unconnected.append(session)
             else:
-                logger.error(f"PR寄存器模板结构不正确")
-                return None, StatusCodeEnum.INVALID_PARAMETER
-        else:
-            # 方法2：如果没有任何PR寄存器存在，无法创建模板
-            logger.error(f"无法创建PR寄存器[{pr_id}]：系统中没有任何PR寄存器可以作为模板")
-            logger.error(f"请先在示教器中至少创建一个PR寄存器（如PR[1]），然后再使用此功能")
-            return None, StatusCodeEnum.NOT_FOUND
-
+                _arm_pool.release(session)
+        for index, session in enumerate(unconnected):
+            try:
+                arm, error = __ensure_session_connected(session)
+            except Exception as ex:
+                arm, error = None, str(ex)
+            _arm_pool.release(session)
+            if arm is None:
+                logger.warning(f"连接池补充连接[{session.index}]失败：{error}")
+                for remaining in unconnected[index + 1:]:
+                    _arm_pool.release(remaining)
+                return
+        if unconnected:
+            logger.info(f"连接池已补充{len(unconnected)}个连接")
     except Exception as ex:
-        logger.error(f"创建PR寄存器[{pr_id}]时发生异常：{ex}")
-        return None, StatusCodeEnum.CONTROLLER_ERROR
+        logger.error(f"连接池补充连接异常: {ex}")
+    finally:
+        with _pool_fill_lock:
+            _pool_fill_running = False
 
 
-def SetTF(ID: int, Pos: int, Value: float) -> dict:
+def __request_pool_fill():
     """
-    工具坐标系
+    在后台线程中为连接池补充连接（已有补充线程运行时不重复启动）
+    """
+    global _pool_fill_running
+    with _pool_fill_lock:
+        if _pool_fill_running:
+            return
+        _pool_fill_running = True
+    threading.Thread(target=__fill_pool, name="CM-pool-fill", daemon=True).start()
+
+
+def __run_sdk_batch(arm, calls):
+    """
+    并发执行一批互不依赖的SDK调用
+
+    除当前指令的连接外，再从连接池非阻塞借出最多_SDK_BATCH_PARALLEL-1个已连接的空闲连接，
+    每个连接一个线程依次领取调用执行；没有已连接的空闲连接时全部在当前连接上顺序执行。
+    批量调用不在指令执行中建立新连接，空闲会话尚未连接时由后台线程补充连接，供之后的批量调用使用。
 
     参数：
-    - ID (int): ID号（数值1-30，0是基础坐标系不可修改）
-    - Pos (int): 位置参数编号（1-6）
-      - 1: X坐标（单位：mm）
-      - 2: Y坐标（单位：mm）
-      - 3: Z坐标（单位：mm）
-      - 4: A角度（单位：度）
-      - 5: B角度（单位：度）
-      - 6: C角度（单位：度）
-    - Value (float): 参数值（输入框输入，数值类型）
+    - arm: 当前指令使用的Arm对象
+    - calls: [(方法路径, 参数元组)]，方法路径相对于Arm对象，如("register.read_PR", (1,))、("coordinate_system.TF.get", (1,))
 
     返回：
-    - dict: {"success": bool, "message": str, "error": str}
+    - list: 与calls顺序一致的[(返回值, 异常)]，调用抛出异常时返回值为None
     """
-    # 参数验证
-    # 验证ID为数值类型并转换为整数
+    results = [(None, None)] * len(calls)
+    if not calls:
+        return results
+
+    sessions = []
+    for _ in range(min(_SDK_BATCH_PARALLEL, len(calls)) - 1):
+        session = _arm_pool.try_checkout()
+        if session is None:
+            break
+        # 只借用心跳确认存活的连接，未连接的会话交给后台补充连接
+        if not session.is_fresh(_HEARTBEAT_STALENESS):
+            _arm_pool.release(session)
+            if session.arm is None:
+                __request_pool_fill()
+            break
+        sessions.append(session)
+
+    pending = iter(range(len(calls)))
+    pending_lock = threading.Lock()
+    # 其他线程执行的调用数，结束后计入当前指令的SDK调用次数
+    offloaded = [0]
+    call_id = getattr(_session_local, 'call_id', None)
+
+    def worker(worker_arm, counted=False):
+        # 其他线程沿用当前指令的调用编号
+        _session_local.call_id = call_id
+        while True:
+            with pending_lock:
+                index = next(pending, None)
+                if index is not None and counted:
+                    offloaded[0] += 1
+            if index is None:
+                return
+            method_path, args = calls[index]
+            try:
+                method = worker_arm
+                for attr in method_path.split('.'):
+                    method = getattr(method, attr)
+                results[index] = (method(*args), None)
+            except Exception as ex:
+                results[index] = (None, ex)
+
+    threads = [threading.Thread(target=worker, args=(session.arm, True), daemon=True) for session in sessions]
     try:
-        ID = int(ID)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "ID号必须是数值类型"}
-    if ID < 1 or ID > 30:
-        return {"success": False, "error": f"ID号必须在1-30之间，当前值：{ID}"}
+        for thread in threads:
+            thread.start()
+        worker(arm)
+        for thread in threads:
+            thread.join()
+    finally:
+        for session in sessions:
+            _arm_pool.release(session)
+        __count_rpc(offloaded[0])
+    return results
+
+
+def __get_arm_pool_stats():
+    """
+    获取连接池统计
 
-    # 验证位置参数
-    try:
-        Pos = int(Pos)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "位置参数必须是数值类型"}
-    if Pos < 1 or Pos > 6:
-        return {"success": False, "error": f"位置参数必须在1-6之间，当前值：{Pos}（1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C）"}
+    返回：
+    - dict: 连接池统计信息
+    """
+    return _arm_pool.stats()
 
-    # 验证Value为数值类型
-    try:
-        Value = float(Value)
-    except (ValueError, TypeError):
-        return {"success": False, "error": f"无效的参数值：{Value}，必须是数值类型"}
 
-    # 获取Arm连接（长连接机制）
-    arm, error = __get_arm_connection()
-    if arm is None:
-        return {"success": False, "error": error}
+def __get_connect_breaker_stats():
+    """
+    获取连接熔断器统计
 
-    try:
-        # 获取现有坐标系（SDK 2.0.0.0使用TF子类）
-        coordinate, ret = arm.coordinate_system.TF.get(ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"获取坐标系失败，错误代码：{error_msg}"}
+    返回：
+    - dict: 熔断器状态及状态转换统计
+    """
+    return _connect_breaker.stats()
 
-        # 更新参数值（保留三位小数）
-        Value = round(float(Value), 3)
 
-        # SDK 2.0.0.0中，坐标系数据存储在data属性中，直接包含x/y/z/a/b/c
-        # 参数映射：1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C
-        param_map = {1: 'x', 2: 'y', 3: 'z', 4: 'a', 5: 'b', 6: 'c'}
-        data_attr = param_map.get(Pos)
-        if data_attr is None:
-            return {"success": False, "error": f"无效的位置参数：{Pos}，必须是1-6之一"}
+def __record_latency(key, elapsed_ms):
+    """
+    记录一次耗时到对应的延迟直方图
 
-        setattr(coordinate.data, data_attr, Value)
+    参数：
+    - key: 统计项名称
+    - elapsed_ms: 耗时（毫秒）
+    """
+    with _latency_lock:
+        histogram = _latency_histograms.get(key)
+        if histogram is None:
+            histogram = LatencyHistogram(_LATENCY_BUCKETS_MS)
+            _latency_histograms[key] = histogram
+        histogram.record(elapsed_ms)
 
-        # 更新坐标系
-        ret = arm.coordinate_system.TF.update(coordinate)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"更新坐标系失败，错误代码：{error_msg}"}
 
-        param_names = {1: 'X', 2: 'Y', 3: 'Z', 4: 'A', 5: 'B', 6: 'C'}
-        param_display = param_names.get(Pos, f'参数{Pos}')
-        return {
-            "success": True,
-            "message": f"TF坐标系[{ID}]的{param_display}参数已更新为{Value}"
-        }
+def __record_rpc_count(key, count):
+    """
+    记录一次指令调用发起的SDK调用次数
 
-    except Exception as ex:
-        logger.error(f"SetTF执行失败: {ex}")
-        return {"success": False, "error": f"执行失败：{str(ex)}"}
+    参数：
+    - key: 指令名
+    - count: SDK调用次数
+    """
+    with _latency_lock:
+        counts = _rpc_counts.setdefault(key, {"calls": 0, "total": 0, "max": 0})
+        counts["calls"] += 1
+        counts["total"] += count
+        counts["max"] = max(counts["max"], count)
 
 
-def SetUF(ID: int, Pos: int, Value: float) -> dict:
+def __count_rpc(count=1):
+    """当前线程正在执行指令时，累加该指令发起的SDK调用次数"""
+    if getattr(_session_local, 'rpc_count', None) is not None:
+        _session_local.rpc_count += count
+
+
+def __timed_instruction(func):
     """
-    用户坐标系
+    指令装饰器：统计指令整体耗时及发起的SDK调用次数
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        outer_count = getattr(_session_local, 'rpc_count', None)
+        outer_call_id = getattr(_session_local, 'call_id', None)
+        _session_local.rpc_count = 0
+        # 嵌套调用时沿用外层指令的调用编号
+        if outer_call_id is None:
+            _session_local.call_id = next(_instruction_call_ids)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            __record_latency(func.__name__, (time.perf_counter() - start) * 1000.0)
+            count = _session_local.rpc_count
+            __record_rpc_count(func.__name__, count)
+            # 嵌套调用时计入外层指令
+            _session_local.rpc_count = None if outer_count is None else outer_count + count
+            _session_local.call_id = outer_call_id
+    return wrapper
+
+
+def __timed_sdk_call(key, method):
+    """
+    包装SDK方法，统计每次调用耗时
 
     参数：
-    - ID (int): ID号（数值1-30，0是基础坐标系不可修改）
-    - Pos (int): 位置参数编号（1-6）
-      - 1: X坐标（单位：mm）
-      - 2: Y坐标（单位：mm）
-      - 3: Z坐标（单位：mm）
-      - 4: A角度（单位：度）
-      - 5: B角度（单位：度）
-      - 6: C角度（单位：度）
-    - Value (float): 参数值（输入框输入，数值类型）
-
-    返回：
-    - dict: {"success": bool, "message": str, "error": str}
+    - key: 统计项名称
+    - method: SDK绑定方法
     """
-    # 参数验证
-    # 验证ID为数值类型并转换为整数
-    try:
-        ID = int(ID)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "ID号必须是数值类型"}
-    if ID < 1 or ID > 30:
-        return {"success": False, "error": f"ID号必须在1-30之间，当前值：{ID}"}
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        __count_rpc()
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            __record_latency(key, (time.perf_counter() - start) * 1000.0)
+    return wrapper
 
-    # 验证位置参数
-    try:
-        Pos = int(Pos)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "位置参数必须是数值类型"}
-    if Pos < 1 or Pos > 6:
-        return {"success": False, "error": f"位置参数必须在1-6之间，当前值：{Pos}（1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C）"}
 
-    # 验证Value为数值类型
-    try:
-        Value = float(Value)
-    except (ValueError, TypeError):
-        return {"success": False, "error": f"无效的参数值：{Value}，必须是数值类型"}
+def __instrument_arm(arm):
+    """
+    为Arm对象上需要统计的SDK方法挂载耗时统计（新建连接时调用一次）
 
-    # 获取Arm连接（长连接机制）
-    arm, error = __get_arm_connection()
-    if arm is None:
-        return {"success": False, "error": error}
+    参数：
+    - arm: Arm对象
+    """
+    for path, method_names in _TIMED_SDK_METHODS:
+        target = arm
+        for attr in filter(None, path.split('.')):
+            target = getattr(target, attr, None)
+        if target is None:
+            continue
+        # register下的方法直接使用方法名，TF/UF下的方法加上前缀区分
+        prefix = path.split('.')[-1] + '.' if path.startswith('coordinate_system') else ''
+        for method_name in method_names:
+            method = getattr(target, method_name, None)
+            if method is None:
+                continue
+            try:
+                setattr(target, method_name, __timed_sdk_call(f"rpc:{prefix}{method_name}", method))
+            except Exception as ex:
+                logger.debug(f"无法统计SDK方法{prefix}{method_name}的耗时: {ex}")
 
-    try:
-        # 获取现有坐标系（SDK 2.0.0.0使用UF子类）
-        coordinate, ret = arm.coordinate_system.UF.get(ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"获取坐标系失败，错误代码：{error_msg}"}
 
-        # 更新参数值（保留三位小数）
-        Value = round(float(Value), 3)
+def __track_register_call(kind, method_name, method):
+    """
+    包装SDK读写寄存器方法：调用成功时记录寄存器已存在，失败时移除记录
 
-        # SDK 2.0.0.0中，坐标系数据存储在data属性中，直接包含x/y/z/a/b/c
-        # 参数映射：1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C
-        param_map = {1: 'x', 2: 'y', 3: 'z', 4: 'a', 5: 'b', 6: 'c'}
-        data_attr = param_map.get(Pos)
-        if data_attr is None:
-            return {"success": False, "error": f"无效的位置参数：{Pos}，必须是1-6之一"}
+    参数：
+    - kind: 寄存器类型（R/PR）
+    - method_name: 方法名（read_*/write_*）
+    - method: SDK绑定方法
+    """
+    is_write = method_name.startswith("write_")
 
-        setattr(coordinate.data, data_attr, Value)
+    @functools.wraps(method)
+    def wrapper(*args):
+        result = method(*args)
+        ret = result if is_write else result[1]
+        reg_id = __get_pr_index(args[0]) if kind == "PR" and is_write else args[0]
+        if ret == StatusCodeEnum.OK:
+            _known_registers.add((kind, reg_id))
+        else:
+            _known_registers.discard((kind, reg_id))
+        return result
+    return wrapper
 
-        # 更新坐标系
-        ret = arm.coordinate_system.UF.update(coordinate)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"更新坐标系失败，错误代码：{error_msg}"}
 
-        param_names = {1: 'X', 2: 'Y', 3: 'Z', 4: 'A', 5: 'B', 6: 'C'}
-        param_display = param_names.get(Pos, f'参数{Pos}')
-        return {
-            "success": True,
-            "message": f"UF坐标系[{ID}]的{param_display}参数已更新为{Value}"
-        }
+def __track_known_registers(arm):
+    """
+    为Arm对象的R/PR读写方法挂载寄存器存在性记录（新建连接时调用一次）
 
-    except Exception as ex:
-        logger.error(f"SetUF执行失败: {ex}")
-        return {"success": False, "error": f"执行失败：{str(ex)}"}
+    参数：
+    - arm: Arm对象
+    """
+    register = getattr(arm, 'register', None)
+    if register is None:
+        return
+    for kind in ("R", "PR"):
+        for method_name in (f"read_{kind}", f"write_{kind}"):
+            method = getattr(register, method_name, None)
+            if method is None:
+                continue
+            try:
+                setattr(register, method_name, __track_register_call(kind, method_name, method))
+            except Exception as ex:
+                logger.debug(f"无法记录{kind}寄存器存在性: {ex}")
 
 
-def SetTF_R(ID: int, Pos: int, R_ID: int) -> dict:
+def __snapshot_value(kind, obj):
     """
-    工具坐标系（从R寄存器读取值）
+    提取用于比较的值
 
     参数：
-    - ID (int): ID号（数值1-30，0是基础坐标系不可修改）
-    - Pos (int): 位置参数编号（1-6）
-      - 1: X坐标（单位：mm）
-      - 2: Y坐标（单位：mm）
-      - 3: Z坐标（单位：mm）
-      - 4: A角度（单位：度）
-      - 5: B角度（单位：度）
-      - 6: C角度（单位：度）
-    - R_ID (int): R寄存器编号
+    - kind: 类型（TF/UF/R/PR/SR）
+    - obj: 坐标系对象、寄存器值或PR寄存器对象
 
     返回：
-    - dict: {"success": bool, "message": str, "error": str}
+    - 坐标系和PR寄存器为((x, y, z, a, b, c), 其余字段的结构签名)，R寄存器为float，SR寄存器为str；无法提取时返回None
     """
-    # 参数验证
-    # 验证ID为数值类型并转换为整数
-    try:
-        ID = int(ID)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "ID号必须是数值类型"}
-    if ID < 1 or ID > 30:
-        return {"success": False, "error": f"ID号必须在1-30之间，当前值：{ID}"}
+    if kind in ("TF", "UF", "PR"):
+        position = obj.data if kind != "PR" else __pr_position(obj)
+        if position is None:
+            return None
+        pose = tuple(float(getattr(position, attr)) for attr in ('x', 'y', 'z', 'a', 'b', 'c'))
+        # 位姿对象中x..c以外的字段也参与签名
+        extra = {name: value for name, value in vars(position).items() if name not in ('x', 'y', 'z', 'a', 'b', 'c')}
+        return pose, (__object_signature(obj, skip=position), __object_signature(extra))
+    if kind == "R":
+        return float(obj)
+    return obj
+
+
+def __is_unchanged(kind, reg_id, obj):
+    """
+    判断写入的值与本次指令调用中读取到的值是否相同（数值差在_WRITE_TOLERANCE内）
 
-    # 验证位置参数
-    try:
-        Pos = int(Pos)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "位置参数必须是数值类型"}
-    if Pos < 1 or Pos > 6:
-        return {"success": False, "error": f"位置参数必须在1-6之间，当前值：{Pos}（1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C）"}
+    只比较同一次指令调用中从控制器读取到的值，避免示教器程序在两次调用之间修改了值时误判为未变化；
+    寄存器缓存、坐标系缓存命中的读取不经过控制器，不记录比较值，之后的写入不会被跳过。
 
-    # 验证R_ID为数值类型并转换为整数
-    try:
-        R_ID = int(R_ID)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "R寄存器编号必须是数值类型"}
-
-    # 获取Arm连接（长连接机制）
-    arm, error = __get_arm_connection()
-    if arm is None:
-        return {"success": False, "error": error}
+    参数：
+    - kind: 类型（TF/UF/R/PR/SR）
+    - reg_id: 坐标系或寄存器编号
+    - obj: 将要写入的坐标系对象、寄存器值或PR寄存器对象
 
+    返回：
+    - bool: 相同返回True（可以跳过写入）
+    """
+    snapshot = _read_snapshots.get((kind, reg_id))
+    call_id = getattr(_session_local, 'call_id', None)
+    if snapshot is None or call_id is None or snapshot[1] != call_id:
+        return False
     try:
-        # 读取R寄存器
-        r_value, ret = arm.register.read_R(R_ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"读取R寄存器[{R_ID}]失败，错误代码：{error_msg}"}
+        value = __snapshot_value(kind, obj)
+    except (AttributeError, TypeError, ValueError):
+        return False
+    old_value = snapshot[0]
+    if isinstance(value, tuple):
+        # 位姿按容差比较，名称、注释、形态等其余字段必须完全相同
+        (pose, signature), (old_pose, old_signature) = value, old_value
+        return signature == old_signature and all(
+            abs(new - old) <= _WRITE_TOLERANCE for new, old in zip(pose, old_pose)
+        )
+    if isinstance(value, float):
+        return abs(value - old_value) <= _WRITE_TOLERANCE
+    return value == old_value
+
+
+def __elided_write_stats_snapshot():
+    """写入统计的副本（加锁读取）"""
+    with _elided_write_stats_lock:
+        return {kind: dict(stats) for kind, stats in _elided_write_stats.items()}
+
+
+def __elision_read(kind, method):
+    """
+    包装SDK读取方法：读取成功时记录比较值
 
-        # 获取现有坐标系（SDK 2.0.0.0使用TF子类）
-        coordinate, ret = arm.coordinate_system.TF.get(ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"获取坐标系失败，错误代码：{error_msg}"}
+    参数：
+    - kind: 类型（TF/UF/R/PR/SR）
+    - method: SDK绑定方法
+    """
+    @functools.wraps(method)
+    def wrapper(reg_id):
+        result = method(reg_id)
+        value, ret = result
+        try:
+            snapshot = __snapshot_value(kind, value) if ret == StatusCodeEnum.OK else None
+        except (AttributeError, TypeError, ValueError):
+            snapshot = None
+        if snapshot is None:
+            _read_snapshots.pop((kind, reg_id), None)
+        else:
+            _read_snapshots[(kind, reg_id)] = (snapshot, getattr(_session_local, 'call_id', None))
+        return result
+    return wrapper
 
-        # 更新参数值（保留三位小数）
-        Value = round(float(r_value), 3)
 
-        # SDK 2.0.0.0中，坐标系数据存储在data属性中，直接包含x/y/z/a/b/c
-        # 参数映射：1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C
-        param_map = {1: 'x', 2: 'y', 3: 'z', 4: 'a', 5: 'b', 6: 'c'}
-        data_attr = param_map.get(Pos)
-        if data_attr is None:
-            return {"success": False, "error": f"无效的位置参数：{Pos}，必须是1-6之一"}
+def __elision_list(kind, method):
+    """
+    包装SDK整表读取坐标系方法：读取成功时记录每个坐标系的比较值
 
-        setattr(coordinate.data, data_attr, Value)
+    参数：
+    - kind: 坐标系类型（TF/UF）
+    - method: SDK绑定方法
+    """
+    @functools.wraps(method)
+    def wrapper():
+        result = method()
+        frame_list, ret = result
+        if ret == StatusCodeEnum.OK:
+            call_id = getattr(_session_local, 'call_id', None)
+            for coordinate in frame_list:
+                frame_id = getattr(coordinate, 'id', None)
+                if frame_id is None:
+                    continue
+                try:
+                    snapshot = __snapshot_value(kind, coordinate)
+                except (AttributeError, TypeError, ValueError):
+                    snapshot = None
+                if snapshot is None:
+                    _read_snapshots.pop((kind, frame_id), None)
+                else:
+                    _read_snapshots[(kind, frame_id)] = (snapshot, call_id)
+        return result
+    return wrapper
 
-        # 更新坐标系
-        ret = arm.coordinate_system.TF.update(coordinate)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"更新坐标系失败，错误代码：{error_msg}"}
 
-        param_names = {1: 'X', 2: 'Y', 3: 'Z', 4: 'A', 5: 'B', 6: 'C'}
-        param_display = param_names.get(Pos, f'参数{Pos}')
-        return {
-            "success": True,
-            "message": f"TF坐标系[{ID}]的{param_display}参数已从R寄存器[{R_ID}]更新为{Value}"
-        }
+def __elision_write(kind, method):
+    """
+    包装SDK写入方法：与本次指令调用中读取到的值相同时跳过写入并直接返回成功
 
-    except Exception as ex:
-        logger.error(f"SetTF_R执行失败: {ex}")
-        return {"success": False, "error": f"执行失败：{str(ex)}"}
+    实际写入前清除记录的比较值，之后必须重新读取才会再次比较。
 
+    参数：
+    - kind: 类型（TF/UF/R/PR/SR）
+    - method: SDK绑定方法
+    """
+    @functools.wraps(method)
+    def wrapper(*args):
+        if kind in ("TF", "UF", "PR"):
+            obj = args[0]
+            reg_id = getattr(obj, 'id', None) if kind != "PR" else __get_pr_index(obj)
+        else:
+            reg_id, obj = args[0], args[1]
+        unchanged = reg_id is not None and __is_unchanged(kind, reg_id, obj)
+        with _elided_write_stats_lock:
+            stats = _elided_write_stats[kind]
+            stats["writes"] += 1
+            if unchanged:
+                stats["elided"] += 1
+        if unchanged:
+            logger.debug(f"{kind}[{reg_id}]的值未变化，跳过写入")
+            return StatusCodeEnum.OK
+        _read_snapshots.pop((kind, reg_id), None)
+        return method(*args)
+    return wrapper
+
+
+def __attach_write_elision(arm):
+    """
+    为Arm对象的坐标系及寄存器读写方法挂载未变化写入跳过（新建连接时调用一次）
 
-def SetUF_R(ID: int, Pos: int, R_ID: int) -> dict:
+    必须在寄存器缓存、坐标系缓存之前挂载：缓存命中的读取不经过本层，不会记录比较值。
+
+    参数：
+    - arm: Arm对象
     """
-    用户坐标系（从R寄存器读取值）
+    targets = [(arm.coordinate_system.TF, "TF", "get", "update"), (arm.coordinate_system.UF, "UF", "get", "update")]
+    targets += [(arm.register, kind, f"read_{kind}", f"write_{kind}") for kind in ("R", "PR", "SR")]
+    for target, kind, read_name, write_name in targets:
+        try:
+            setattr(target, read_name, __elision_read(kind, getattr(target, read_name)))
+            setattr(target, write_name, __elision_write(kind, getattr(target, write_name)))
+            if kind in ("TF", "UF"):
+                target.get_coordinate_list = __elision_list(kind, target.get_coordinate_list)
+        except Exception as ex:
+            logger.debug(f"无法为{kind}挂载未变化写入跳过: {ex}")
+
+
+def __get_latency_stats(reset: bool = False):
+    """
+    获取延迟直方图摘要
 
     参数：
-    - ID (int): ID号（数值1-30，0是基础坐标系不可修改）
-    - Pos (int): 位置参数编号（1-6）
-      - 1: X坐标（单位：mm）
-      - 2: Y坐标（单位：mm）
-      - 3: Z坐标（单位：mm）
-      - 4: A角度（单位：度）
-      - 5: B角度（单位：度）
-      - 6: C角度（单位：度）
-    - R_ID (int): R寄存器编号
+    - reset: 读取后是否清空统计
 
     返回：
-    - dict: {"success": bool, "message": str, "error": str}
+    - dict: {统计项名称: 直方图摘要}，指令项附带单次调用的SDK调用次数（rpc_avg、rpc_max）
     """
-    # 参数验证
-    # 验证ID为数值类型并转换为整数
-    try:
-        ID = int(ID)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "ID号必须是数值类型"}
-    if ID < 1 or ID > 30:
-        return {"success": False, "error": f"ID号必须在1-30之间，当前值：{ID}"}
+    with _latency_lock:
+        stats = {key: histogram.summary() for key, histogram in sorted(_latency_histograms.items())}
+        for key, counts in _rpc_counts.items():
+            if key in stats:
+                stats[key]["rpc_avg"] = counts["total"] / counts["calls"] if counts["calls"] else 0.0
+                stats[key]["rpc_max"] = counts["max"]
+        if reset:
+            _latency_histograms.clear()
+            _rpc_counts.clear()
+    return stats
+
+
+def __cached_register_read(kind, method):
+    """
+    包装SDK读寄存器方法：订阅有效且命中时直接返回缓存值，否则RPC读取并回填缓存
 
-    # 验证位置参数
-    try:
-        Pos = int(Pos)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "位置参数必须是数值类型"}
-    if Pos < 1 or Pos > 6:
-        return {"success": False, "error": f"位置参数必须在1-6之间，当前值：{Pos}（1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C）"}
+    参数：
+    - kind: 寄存器类型（R/PR/SR）
+    - method: SDK绑定方法
+    """
+    @functools.wraps(method)
+    def wrapper(reg_id):
+        hit, value = _register_cache.get(kind, reg_id)
+        if hit:
+            return value, StatusCodeEnum.OK
+        version = _register_cache.version(kind, reg_id)
+        value, ret = method(reg_id)
+        if ret == StatusCodeEnum.OK:
+            _register_cache.fill(kind, reg_id, value, version)
+        return value, ret
+    return wrapper
 
-    # 验证R_ID为数值类型并转换为整数
-    try:
-        R_ID = int(R_ID)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "R寄存器编号必须是数值类型"}
 
-    # 获取Arm连接（长连接机制）
-    arm, error = __get_arm_connection()
-    if arm is None:
-        return {"success": False, "error": error}
+def __cached_register_write(kind, method):
+    """
+    包装SDK写寄存器方法：写入成功后同步更新缓存，失败时使缓存失效
 
-    try:
-        # 读取R寄存器
-        r_value, ret = arm.register.read_R(R_ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"读取R寄存器[{R_ID}]失败，错误代码：{error_msg}"}
+    参数：
+    - kind: 寄存器类型（R/PR/SR）
+    - method: SDK绑定方法
+    """
+    @functools.wraps(method)
+    def wrapper(*args):
+        ret = method(*args)
+        if kind == "PR":
+            reg_id, value = __get_pr_index(args[0]), args[0]
+        else:
+            reg_id, value = args[0], args[1]
+        if ret == StatusCodeEnum.OK and reg_id is not None:
+            _register_cache.store(kind, reg_id, value)
+        else:
+            _register_cache.invalidate(kind, reg_id)
+        return ret
+    return wrapper
 
-        # 获取现有坐标系（SDK 2.0.0.0使用UF子类）
-        coordinate, ret = arm.coordinate_system.UF.get(ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"获取坐标系失败，错误代码：{error_msg}"}
 
-        # 更新参数值（保留三位小数）
-        Value = round(float(r_value), 3)
+def __attach_register_cache(arm):
+    """
+    为Arm对象的读写寄存器方法挂载寄存器读缓存（新建连接时调用一次）
 
-        # SDK 2.0.0.0中，坐标系数据存储在data属性中，直接包含x/y/z/a/b/c
-        # 参数映射：1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C
-        param_map = {1: 'x', 2: 'y', 3: 'z', 4: 'a', 5: 'b', 6: 'c'}
-        data_attr = param_map.get(Pos)
-        if data_attr is None:
-            return {"success": False, "error": f"无效的位置参数：{Pos}，必须是1-6之一"}
+    参数：
+    - arm: Arm对象
+    """
+    register = getattr(arm, 'register', None)
+    if register is None:
+        return
+    for kind in ("R", "PR", "SR"):
+        try:
+            setattr(register, f"read_{kind}", __cached_register_read(kind, getattr(register, f"read_{kind}")))
+            setattr(register, f"write_{kind}", __cached_register_write(kind, getattr(register, f"write_{kind}")))
+        except Exception as ex:
+            logger.debug(f"无法为{kind}寄存器挂载读缓存: {ex}")
 
-        setattr(coordinate.data, data_attr, Value)
 
-        # 更新坐标系
-        ret = arm.coordinate_system.UF.update(coordinate)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"更新坐标系失败，错误代码：{error_msg}"}
+def __cached_frame_list(kind, method):
+    """
+    包装SDK整表读取坐标系方法：始终读取控制器，成功后整表填充坐标系缓存
 
-        param_names = {1: 'X', 2: 'Y', 3: 'Z', 4: 'A', 5: 'B', 6: 'C'}
-        param_display = param_names.get(Pos, f'参数{Pos}')
-        return {
-            "success": True,
-            "message": f"UF坐标系[{ID}]的{param_display}参数已从R寄存器[{R_ID}]更新为{Value}"
-        }
+    参数：
+    - kind: 坐标系类型（TF/UF）
+    - method: SDK绑定方法
+    """
+    @functools.wraps(method)
+    def wrapper():
+        frame_list, ret = method()
+        if ret == StatusCodeEnum.OK:
+            _frame_cache.store_all(kind, frame_list)
+        else:
+            _frame_cache.invalidate(kind)
+        return frame_list, ret
+    return wrapper
 
-    except Exception as ex:
-        logger.error(f"SetUF_R执行失败: {ex}")
-        return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+def __cached_frame_get(kind, method, list_method):
+    """
+    包装SDK读取坐标系方法：命中缓存时直接返回副本；未命中时先整表读取一次，仍未命中再单独读取
+
+    参数：
+    - kind: 坐标系类型（TF/UF）
+    - method: SDK绑定方法
+    - list_method: 已包装的整表读取方法
+    """
+    @functools.wraps(method)
+    def wrapper(frame_id):
+        hit, coordinate = _frame_cache.get(kind, frame_id)
+        if hit:
+            return coordinate, StatusCodeEnum.OK
+        if _frame_cache.list_due(kind):
+            list_method()
+            hit, coordinate = _frame_cache.get(kind, frame_id, count=False)
+            if hit:
+                return coordinate, StatusCodeEnum.OK
+        coordinate, ret = method(frame_id)
+        if ret == StatusCodeEnum.OK:
+            _frame_cache.store(kind, coordinate)
+        else:
+            _frame_cache.invalidate(kind, frame_id)
+        return coordinate, ret
+    return wrapper
 
 
-def SetTF_PR(ID: int, PR_ID: int) -> dict:
+def __cached_frame_write(kind, method):
     """
-    工具坐标系（从PR寄存器读取完整位姿）
+    包装SDK写入坐标系方法（update/add）：写入成功后同步更新缓存，失败时使缓存失效
 
     参数：
-    - ID (int): ID号（数值1-30，0是基础坐标系不可修改）
-    - PR_ID (int): PR寄存器编号
+    - kind: 坐标系类型（TF/UF）
+    - method: SDK绑定方法
+    """
+    @functools.wraps(method)
+    def wrapper(coordinate):
+        ret = method(coordinate)
+        if ret == StatusCodeEnum.OK:
+            _frame_cache.store(kind, coordinate)
+        else:
+            _frame_cache.invalidate(kind, getattr(coordinate, 'id', None))
+        return ret
+    return wrapper
+
+
+def __attach_frame_cache(arm):
+    """
+    为Arm对象的TF/UF读写方法挂载坐标系缓存（新建连接时调用一次）
+
+    参数：
+    - arm: Arm对象
+    """
+    for kind in ("TF", "UF"):
+        try:
+            frame_api = getattr(arm.coordinate_system, kind)
+            list_method = __cached_frame_list(kind, frame_api.get_coordinate_list)
+            frame_api.get_coordinate_list = list_method
+            frame_api.get = __cached_frame_get(kind, frame_api.get, list_method)
+            for method_name in ("update", "add"):
+                method = getattr(frame_api, method_name, None)
+                if method is not None:
+                    setattr(frame_api, method_name, __cached_frame_write(kind, method))
+        except Exception as ex:
+            logger.debug(f"无法为{kind}坐标系挂载缓存: {ex}")
+
+
+async def __subscribe_registers(subscribe_register, keys):
+    """
+    按寄存器类型分组订阅寄存器（SDK手册4.14.4：subscribe_register(reg_type, reg_ids, frequency)）
+
+    参数：
+    - subscribe_register: SDK订阅寄存器方法
+    - keys: [(寄存器类型, 编号)]
 
     返回：
-    - dict: {"success": bool, "message": str, "error": str}
+    - set: 订阅成功的寄存器
     """
-    # 参数验证
-    # 验证ID为数值类型并转换为整数
-    try:
-        ID = int(ID)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "ID号必须是数值类型"}
-    if ID < 1 or ID > 30:
-        return {"success": False, "error": f"ID号必须在1-30之间，当前值：{ID}"}
+    subscribed = set()
+    for kind, group in itertools.groupby(sorted(keys), key=lambda key: key[0]):
+        group = list(group)
+        ret = await subscribe_register(
+            getattr(RegTopicType, kind), [reg_id for _, reg_id in group], frequency=_REG_CACHE_FREQUENCY
+        )
+        if ret == StatusCodeEnum.OK:
+            subscribed.update(group)
+        else:
+            logger.warning(f"订阅{kind}寄存器失败：{ret}")
+    return subscribed
 
-    # 验证PR_ID为数值类型并转换为整数
-    try:
-        PR_ID = int(PR_ID)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "PR寄存器编号必须是数值类型"}
 
-    # 获取Arm连接（长连接机制）
+@__with_arm_session
+def __read_mirror_batch(calls):
+    """
+    借用连接池连接批量读取镜像范围内的寄存器（与指令相同，由__run_sdk_batch分摊到空闲连接）
+
+    参数：
+    - calls: [(SDK方法路径, 参数)]
+
+    返回：
+    - list: __run_sdk_batch的结果，获取连接失败时返回None
+    """
     arm, error = __get_arm_connection()
     if arm is None:
-        return {"success": False, "error": error}
+        logger.warning(f"寄存器镜像预读获取连接失败：{error}")
+        return None
+    return __run_sdk_batch(arm, calls)
 
-    try:
-        # 读取PR寄存器
-        pr_register, ret = arm.register.read_PR(PR_ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"读取PR寄存器[{PR_ID}]失败，错误代码：{error_msg}"}
 
-        # 检查PR寄存器数据类型
-        if not hasattr(pr_register, 'poseRegisterData') or \
-           not hasattr(pr_register.poseRegisterData, 'cartData') or \
-           not hasattr(pr_register.poseRegisterData.cartData, 'position'):
-            return {"success": False, "error": f"PR寄存器[{PR_ID}]数据格式不正确，必须包含位姿数据"}
+async def __seed_register_mirror(subscribe_register):
+    """
+    订阅并批量预读镜像范围内的寄存器（每次订阅通道建立后执行一次）
 
-        # 获取现有坐标系（SDK 2.0.0.0使用TF子类）
-        coordinate, ret = arm.coordinate_system.TF.get(ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"获取坐标系失败，错误代码：{error_msg}"}
+    先订阅再读取，预读期间到达的订阅消息不会被预读结果覆盖。
+    订阅线程的连接只用于订阅通道，预读借用连接池连接。
 
-        # 从PR寄存器读取XYZABC值并更新到坐标系（保留三位小数）
-        # SDK 2.0.0.0中，坐标系数据直接使用a/b/c，不再需要r/p/y转换
-        pr_position = pr_register.poseRegisterData.cartData.position
-        # 更新坐标系数据（直接映射：x->x, y->y, z->z, a->a, b->b, c->c）
-        coordinate.data.x = round(pr_position.x, 3)
-        coordinate.data.y = round(pr_position.y, 3)
-        coordinate.data.z = round(pr_position.z, 3)
-        coordinate.data.a = round(pr_position.a, 3)
-        coordinate.data.b = round(pr_position.b, 3)
-        coordinate.data.c = round(pr_position.c, 3)
+    参数：
+    - subscribe_register: SDK订阅寄存器方法
+    """
+    keys = [(kind, reg_id) for kind, start, end in _REG_MIRROR_RANGES for reg_id in range(start, end + 1)]
+    subscribed = await __subscribe_registers(subscribe_register, keys)
+    keys = [key for key in keys if key in subscribed]
+    if not keys:
+        logger.warning("订阅寄存器镜像范围失败")
+        return
+    start = time.perf_counter()
+    _register_cache.begin_seed(keys)
+    try:
+        calls = [(f"register.read_{kind}", (reg_id,)) for kind, reg_id in keys]
+        results = await asyncio.get_running_loop().run_in_executor(None, __read_mirror_batch, calls)
+    finally:
+        _register_cache.end_seed()
+    if results is None:
+        return
+    seeded = [
+        (key, result[0]) for key, (result, ex) in zip(keys, results)
+        if ex is None and result is not None and result[1] == StatusCodeEnum.OK
+    ]
+    _register_cache.seed(seeded)
+    logger.info(f"寄存器镜像预读完成：{len(seeded)}/{len(keys)}个寄存器，耗时{time.perf_counter() - start:.3f}秒")
+
+
+async def __register_cache_session():
+    """
+    订阅线程的一次订阅会话：建立独立连接，预读镜像范围，订阅读过的寄存器并接收推送消息，连接断开时返回
 
-        # 更新坐标系
-        ret = arm.coordinate_system.TF.update(coordinate)
+    返回：
+    - bool: SDK不支持订阅寄存器时返回False，其余情况返回True
+    """
+    robot_ip = __get_robot_ip()
+    if robot_ip is None:
+        return True
+    arm = Arm()
+    if arm.connect(robot_ip) != StatusCodeEnum.OK:
+        return True
+    sub_pub = arm.sub_pub
+    try:
+        ret = await sub_pub.connect()
         if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"更新坐标系失败，错误代码：{error_msg}"}
+            logger.warning(f"寄存器订阅通道连接失败：{ret}")
+            return True
+        subscribe_register = getattr(sub_pub, 'subscribe_register', None)
+        if subscribe_register is None:
+            logger.warning("当前SDK不支持订阅寄存器，寄存器读缓存不可用")
+            return False
 
-        return {
-            "success": True,
-            "message": f"TF坐标系[{ID}]已从PR寄存器[{PR_ID}]更新：X={coordinate.data.x}, Y={coordinate.data.y}, Z={coordinate.data.z}, A={coordinate.data.a}, B={coordinate.data.b}, C={coordinate.data.c}"
-        }
+        async def handler(message):
+            _register_cache.apply_message(message)
 
-    except Exception as ex:
-        logger.error(f"SetTF_PR执行失败: {ex}")
-        return {"success": False, "error": f"执行失败：{str(ex)}"}
+        ret = await sub_pub.start_receiving(handler)
+        if ret != StatusCodeEnum.OK:
+            logger.warning(f"启动寄存器订阅消息接收失败：{ret}")
+            return True
+        logger.info("寄存器订阅通道已建立")
+        if _REG_MIRROR_RANGES:
+            await __seed_register_mirror(subscribe_register)
+
+        # 通道活动时间只由收到的订阅消息刷新（RegisterCache.apply_message），
+        # 订阅通道静默断开而RPC连接仍正常时，镜像在staleness秒后失效，读寄存器回退为RPC
+        while arm.is_connected():
+            pending = _register_cache.take_pending()
+            if pending:
+                _register_cache.mark_watched(await __subscribe_registers(subscribe_register, pending))
+            await asyncio.sleep(_REG_CACHE_STALENESS / 4)
+        return True
+    finally:
+        try:
+            await sub_pub.disconnect()
+        except Exception:
+            pass
+        arm.disconnect()
 
 
-def SetUF_PR(ID: int, PR_ID: int) -> dict:
+def __register_cache_loop():
     """
-    用户坐标系（从PR寄存器读取完整位姿）
+    寄存器订阅线程：维护订阅会话，会话断开后清空缓存并重建，SDK不支持订阅寄存器时退出
+    """
+    while True:
+        supported = True
+        try:
+            supported = asyncio.run(__register_cache_session())
+        except Exception as ex:
+            logger.error(f"寄存器订阅异常: {ex}")
+        _register_cache.reset()
+        if not supported:
+            return
+        time.sleep(_HEARTBEAT_INTERVAL)
 
-    参数：
-    - ID (int): ID号（数值1-30，0是基础坐标系不可修改）
-    - PR_ID (int): PR寄存器编号
 
-    返回：
-    - dict: {"success": bool, "message": str, "error": str}
+def __start_register_cache():
     """
-    # 参数验证
-    # 验证ID为数值类型并转换为整数
-    try:
-        ID = int(ID)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "ID号必须是数值类型"}
-    if ID < 1 or ID > 30:
-        return {"success": False, "error": f"ID号必须在1-30之间，当前值：{ID}"}
+    启动寄存器订阅线程（仅启动一次）
+    """
+    global _reg_cache_thread
 
-    # 验证PR_ID为数值类型并转换为整数
-    try:
-        PR_ID = int(PR_ID)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "PR寄存器编号必须是数值类型"}
+    # 订阅线程只在SDK不支持订阅寄存器时退出，退出后不再重启
+    if _reg_cache_thread is not None:
+        return
+    with _reg_cache_lock:
+        if _reg_cache_thread is not None:
+            return
+        _reg_cache_thread = threading.Thread(target=__register_cache_loop, name="CM-register-cache", daemon=True)
+        _reg_cache_thread.start()
 
-    # 获取Arm连接（长连接机制）
-    arm, error = __get_arm_connection()
-    if arm is None:
-        return {"success": False, "error": error}
 
+@__with_arm_session
+def __warmup():
+    """
+    连接预热：建立连接，启用坐标系缓存时整表预取TF/UF坐标系填充缓存（在后台线程中执行）
+    """
+    start = time.monotonic()
     try:
-        # 读取PR寄存器
-        pr_register, ret = arm.register.read_PR(PR_ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"读取PR寄存器[{PR_ID}]失败，错误代码：{error_msg}"}
-
-        # 检查PR寄存器数据类型
-        if not hasattr(pr_register, 'poseRegisterData') or \
-           not hasattr(pr_register.poseRegisterData, 'cartData') or \
-           not hasattr(pr_register.poseRegisterData.cartData, 'position'):
-            return {"success": False, "error": f"PR寄存器[{PR_ID}]数据格式不正确，必须包含位姿数据"}
-
-        # 获取现有坐标系（SDK 2.0.0.0使用UF子类）
-        coordinate, ret = arm.coordinate_system.UF.get(ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"获取坐标系失败，错误代码：{error_msg}"}
-
-        # 从PR寄存器读取XYZABC值并更新到坐标系（保留三位小数）
-        # SDK 2.0.0.0中，坐标系数据直接使用a/b/c，不再需要r/p/y转换
-        pr_position = pr_register.poseRegisterData.cartData.position
-        # 更新坐标系数据（直接映射：x->x, y->y, z->z, a->a, b->b, c->c）
-        coordinate.data.x = round(pr_position.x, 3)
-        coordinate.data.y = round(pr_position.y, 3)
-        coordinate.data.z = round(pr_position.z, 3)
-        coordinate.data.a = round(pr_position.a, 3)
-        coordinate.data.b = round(pr_position.b, 3)
-        coordinate.data.c = round(pr_position.c, 3)
+        arm, error = __get_arm_connection()
+        if arm is None:
+            _warmup_state["error"] = error
+            _warmup_state["status"] = "failed"
+            logger.warning(f"连接预热失败：{error}")
+            return
+
+        # 整表读取经坐标系缓存包装后填充_frame_cache，SetTF/SetUF等的get直接命中缓存；
+        # 未启用缓存时预取结果无处使用，不再读取
+        if _FRAME_CACHE_ENABLED:
+            for frame_type, frame_api in (("TF", arm.coordinate_system.TF), ("UF", arm.coordinate_system.UF)):
+                _, ret = frame_api.get_coordinate_list()
+                if ret != StatusCodeEnum.OK:
+                    error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+                    logger.warning(f"预取{frame_type}坐标系列表失败，错误代码：{error_msg}")
+        _warmup_state["status"] = "ready"
+        # 连接池其余会话在后台补充连接，之后的批量调用可以直接借用
+        __request_pool_fill()
+        logger.info(f"连接预热完成，耗时{time.monotonic() - start:.3f}秒")
 
-        # 更新坐标系
-        ret = arm.coordinate_system.UF.update(coordinate)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"更新坐标系失败，错误代码：{error_msg}"}
+    except Exception as ex:
+        logger.error(f"连接预热异常: {ex}")
+        _warmup_state["error"] = str(ex)
+        _warmup_state["status"] = "failed"
+    finally:
+        _warmup_state["elapsed"] = time.monotonic() - start
 
-        return {
-            "success": True,
-            "message": f"UF坐标系[{ID}]已从PR寄存器[{PR_ID}]更新：X={coordinate.data.x}, Y={coordinate.data.y}, Z={coordinate.data.z}, A={coordinate.data.a}, B={coordinate.data.b}, C={coordinate.data.c}"
-        }
 
-    except Exception as ex:
-        logger.error(f"SetUF_PR执行失败: {ex}")
-        return {"success": False, "error": f"执行失败：{str(ex)}"}
+def __start_warmup():
+    """
+    在后台线程中启动连接预热，不阻塞插件注册
+    """
+    _warmup_state["status"] = "running"
+    thread = threading.Thread(target=__warmup, name="CM-warmup", daemon=True)
+    thread.start()
 
 
-def Incr(R_ID: int, Step: float = 1.0) -> dict:
+def __get_r_lock(r_id: int):
     """
-    R寄存器自增
+    获取R寄存器的读改写锁（同一编号始终返回同一把锁）
 
     参数：
-    - R_ID (int): R寄存器编号
-    - Step (float): 自增步长，默认为1.0
+    - r_id: R寄存器编号
 
     返回：
-    - dict: {"success": bool, "message": str, "error": str}
+    - threading.Lock: 锁对象
     """
-    # 参数验证
-    # 验证R_ID为数值类型并转换为整数
-    try:
-        R_ID = int(R_ID)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "R寄存器编号必须是数值类型"}
-
-    # 验证Step为数值类型并转换为浮点数
-    try:
-        Step = float(Step)
-    except (ValueError, TypeError):
-        return {"success": False, "error": f"自增步长必须是数值类型，当前值：{Step}"}
+    lock = _r_locks.get(r_id)
+    if lock is None:
+        with _r_locks_guard:
+            lock = _r_locks.setdefault(r_id, threading.Lock())
+    return lock
 
-    # 获取Arm连接（长连接机制）
-    arm, error = __get_arm_connection()
-    if arm is None:
-        return {"success": False, "error": error}
 
-    try:
-        # 读取R寄存器当前值
-        current_value, ret = arm.register.read_R(R_ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"读取R寄存器[{R_ID}]失败，错误代码：{error_msg}"}
+def __snapshot_pose(position):
+    """
+    位姿对象转换为快照中保存的列表 [x, y, z, a, b, c]
 
-        # 计算新值
-        new_value = float(current_value) + float(Step)
+    参数：
+    - position: 含x/y/z/a/b/c属性的位姿对象
 
-        # 写入新值
-        ret = arm.register.write_R(R_ID, new_value)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"写入R寄存器[{R_ID}]失败，错误代码：{error_msg}"}
+    返回：
+    - list: [x, y, z, a, b, c]
+    """
+    return [float(getattr(position, attr)) for attr in ('x', 'y', 'z', 'a', 'b', 'c')]
 
-        return {
-            "success": True,
-            "message": f"R寄存器[{R_ID}]已自增{Step}，当前值：{current_value} -> {new_value}"
-        }
 
-    except Exception as ex:
-        logger.error(f"Incr执行失败: {ex}")
-        return {"success": False, "error": f"执行失败：{str(ex)}"}
+def __pose_differs(position, values):
+    """
+    判断位姿对象与快照中的 [x, y, z, a, b, c] 是否不同（差值超过_WRITE_TOLERANCE）
+    """
+    return any(abs(old - new) > _WRITE_TOLERANCE for old, new in zip(__snapshot_pose(position), values))
 
 
-def Decr(R_ID: int, Step: float = 1.0) -> dict:
+def __validate_snapshot_slot(slot, label="快照编号"):
     """
-    R寄存器自减
+    验证快照（或坐标系表、TFShift上下文）编号
 
     参数：
-    - R_ID (int): R寄存器编号
-    - Step (float): 自减步长，默认为1.0
+    - slot: 编号
+    - label: 错误信息中的编号名称
 
     返回：
-    - dict: {"success": bool, "message": str, "error": str}
+    - int: 快照编号，无效时返回None
+    - str: 错误信息，有效时返回None
     """
-    # 参数验证
-    # 验证R_ID为数值类型并转换为整数
     try:
-        R_ID = int(R_ID)
+        slot = int(slot)
     except (ValueError, TypeError):
-        return {"success": False, "error": "R寄存器编号必须是数值类型"}
+        return None, f"{label}必须是数值类型"
+    if slot < 1 or slot > 99:
+        return None, f"{label}必须在1-99之间，当前值：{slot}"
+    return slot, None
 
-    # 验证Step为数值类型并转换为浮点数
+
+def __frame_table_entry(coordinate):
+    """
+    坐标系对象转换为坐标系表中保存的项
+
+    返回：
+    - dict: {"name": str, "comment": str, "pose": [x, y, z, a, b, c]}
+    """
+    return {
+        "name": getattr(coordinate, 'name', ""),
+        "comment": getattr(coordinate, 'comment', ""),
+        "pose": __snapshot_pose(coordinate.data),
+    }
+
+
+def __validate_txn_id(txn_id):
+    """
+    验证事务编号
+
+    返回：
+    - int: 事务编号，无效时返回None
+    - str: 错误信息，有效时返回None
+    """
     try:
-        Step = float(Step)
+        txn_id = int(txn_id)
     except (ValueError, TypeError):
-        return {"success": False, "error": f"自减步长必须是数值类型，当前值：{Step}"}
+        return None, "事务编号必须是数值类型"
+    if txn_id < 1 or txn_id > 99:
+        return None, f"事务编号必须在1-99之间，当前值：{txn_id}"
+    return txn_id, None
 
-    # 获取Arm连接（长连接机制）
-    arm, error = __get_arm_connection()
-    if arm is None:
-        return {"success": False, "error": error}
 
-    try:
-        # 读取R寄存器当前值
-        current_value, ret = arm.register.read_R(R_ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"读取R寄存器[{R_ID}]失败，错误代码：{error_msg}"}
+def __get_open_transaction(txn_id):
+    """
+    获取暂存中的事务
 
-        # 计算新值（减去步长）
-        new_value = float(current_value) - float(Step)
+    返回：
+    - FrameTransaction: 事务，不存在或不在暂存中时返回None
+    - str: 错误信息
+    """
+    with _transactions_lock:
+        txn = _transactions.get(txn_id)
+    if txn is None:
+        return None, f"事务[{txn_id}]不存在，请先调用TxnBegin"
+    if txn.state != "open":
+        return None, f"事务[{txn_id}]已{'提交' if txn.state == 'committed' else '回滚'}，请先调用TxnBegin开始新事务"
+    return txn, None
 
-        # 写入新值
-        ret = arm.register.write_R(R_ID, new_value)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"写入R寄存器[{R_ID}]失败，错误代码：{error_msg}"}
 
-        return {
-            "success": True,
-            "message": f"R寄存器[{R_ID}]已自减{Step}，当前值：{current_value} -> {new_value}"
-        }
+def __format_ret(ret):
+    """SDK返回码转换为错误信息"""
+    return ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
 
-    except Exception as ex:
-        logger.error(f"Decr执行失败: {ex}")
-        return {"success": False, "error": f"执行失败：{str(ex)}"}
 
+def __write_batch(arm, writes, labels):
+    """
+    并发写入一批坐标系或寄存器
 
-def Strp(SR_ID: int, R_ID_Status: int, PR_ID: int, R_ID_Error: int) -> dict:
+    返回：
+    - list: 写入成功的序号
+    - list: 失败项描述
     """
-    拆解字符串数据到PR寄存器（视觉数据格式）
+    succeeded = []
+    failed = []
+    for index, (label, (ret, write_ex)) in enumerate(zip(labels, __run_sdk_batch(arm, writes))):
+        if write_ex is not None:
+            failed.append(f"{label}（{write_ex}）")
+        elif ret != StatusCodeEnum.OK:
+            failed.append(f"{label}（{__format_ret(ret)}）")
+        else:
+            succeeded.append(index)
+    return succeeded, failed
 
-    数据格式说明：
-    SR寄存器中的字符串格式：以分隔符分隔的数据（自动检测分隔符类型）
-    支持的分隔符：逗号","、分号";"、空格" "、制表符"\t"、竖线"|"等
-    示例（1组数据）：SR[1] = "1,100.5,200.3,45.0"
-    示例（2组数据）：SR[1] = "1,100.5,200.3,45.0,150.0,250.0,90.0"
 
-    数据格式规则：
-    1. 第一个数据为物料检测状态位
-       - "1" = 有物料，可以处理
-       - "0" = 无物料，不处理
-    2. 状态位后的数据必须是3的倍数（X,Y,C为一组）
-       - 示例：3个数据（1组）、6个数据（2组）、9个数据（3组）等
-    3. 每组数据按顺序映射为 (X, Y, C)
+def __pre_image_write(kind, item_id, value):
+    """修改前的值对应的写入调用"""
+    if kind == "R":
+        return ("register.write_R", (item_id, value))
+    return (f"coordinate_system.{kind}.update", (copy.deepcopy(value),))
 
-    数据映射到PR寄存器：
-    每个PR寄存器存储6个分量（X, Y, Z, A, B, C）
-    数据映射规则：
-    - 第1组：X1 → PR[PR_ID].x, Y1 → PR[PR_ID].y, C1 → PR[PR_ID].c
-    - 第2组：X2 → PR[PR_ID+1].x, Y2 → PR[PR_ID+1].y, C2 → PR[PR_ID+1].c
-    - 以此类推...
-    - Z, A, B 分量保留PR寄存器原有的值，不修改
 
-    状态码说明：
-    - R_ID_Status：物料检测状态（1=有物料，0=无物料）
-    - R_ID_Error：错误状态码（0=正确，1=错误）
-      - 状态位=0（无物料）→ R_ID_Status=0, R_ID_Error=1（错误）
-      - 状态位=1且数据格式正确（3的倍数）→ R_ID_Status=1, R_ID_Error=0（正确）
-      - 状态位=1但数据格式错误（不是3的倍数）→ R_ID_Status=1, R_ID_Error=1（格式错误）
+def __commit_transaction(arm, txn):
+    """
+    提交事务：一批并发读取修改前的值及数据来源，验证后一批并发写入，写入失败时恢复已写入的项
 
     参数：
-    - SR_ID (int): 字符串寄存器编号，包含视觉数据
-                   格式：状态位,X,Y,C 或 状态位,X1,Y1,C1,X2,Y2,C2,...
-                   示例："1,100.5,200.3,45.0"
-    - R_ID_Status (int): R寄存器编号，用于输出物料检测状态（1=有物料，0=无物料）
-    - PR_ID (int): PR寄存器起始编号，用于保存拆解后的数据
-    - R_ID_Error (int): R寄存器编号，用于输出错误状态码（0=正确，1=错误）
+    - arm: Arm对象
+    - txn: FrameTransaction（调用方持有txn.lock）
 
     返回：
     - dict: {"success": bool, "message": str, "error": str}
     """
-    # 参数验证
-    try:
-        SR_ID = int(SR_ID)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "SR寄存器编号必须是数值类型"}
+    start = time.monotonic()
+    touched = txn.touched()
+
+    # 读取修改前的值及数据来源寄存器（同一批并发读取）
+    reads = [(kind, item_id) for kind, item_id in touched]
+    for edits in txn.frame_edits.values():
+        for _, source, value in edits:
+            if source == 1 and ("R", value) not in reads:
+                reads.append(("R", value))
+            elif source == 2 and ("PR", value) not in reads:
+                reads.append(("PR", value))
+    calls = [
+        (f"register.read_{kind}", (item_id,)) if kind in ("R", "PR") else (f"coordinate_system.{kind}.get", (item_id,))
+        for kind, item_id in reads
+    ]
+    values = {}
+    errors = []
+    for (kind, item_id), (result, read_ex) in zip(reads, __run_sdk_batch(arm, calls)):
+        if read_ex is not None:
+            errors.append(f"{kind}[{item_id}]（{read_ex}）")
+            continue
+        value, ret = result
+        if ret != StatusCodeEnum.OK:
+            errors.append(f"{kind}[{item_id}]（{__format_ret(ret)}）")
+            continue
+        values[(kind, item_id)] = value
+    if errors:
+        return {"success": False, "error": f"事务[{txn.txn_id}]验证失败，未写入任何项，无法读取：{', '.join(errors)}"}
+
+    # 基于修改前的值生成写入内容
+    writes = []
+    for frame_type, frame_id in sorted(txn.frame_edits):
+        coordinate = copy.deepcopy(values[(frame_type, frame_id)])
+        for pos, source, value in txn.frame_edits[(frame_type, frame_id)]:
+            if source == 2:
+                pr_position = __pr_position(values[("PR", value)])
+                if pr_position is None:
+                    return {"success": False, "error": f"事务[{txn.txn_id}]验证失败，未写入任何项：PR寄存器[{value}]不是直角坐标位姿"}
+                for attr in ('x', 'y', 'z', 'a', 'b', 'c'):
+                    setattr(coordinate.data, attr, round(float(getattr(pr_position, attr)), 3))
+                continue
+            new_value = float(values[("R", value)]) if source == 1 else value
+            setattr(coordinate.data, __get_param_name(pos), round(new_value, 3))
+        writes.append((f"coordinate_system.{frame_type}.update", (coordinate,)))
+    for r_id in sorted(txn.register_edits):
+        writes.append(("register.write_R", (r_id, float(txn.register_edits[r_id]))))
+
+    labels = [f"{kind}[{item_id}]" for kind, item_id in touched]
+    txn.pre_image = {key: values[key] for key in touched}
+    succeeded, failed = __write_batch(arm, writes, labels)
+    if failed:
+        # 部分写入失败：恢复已写入的项
+        restore = [__pre_image_write(*touched[index], txn.pre_image[touched[index]]) for index in succeeded]
+        _, restore_failed = __write_batch(arm, restore, [labels[index] for index in succeeded])
+        txn.state = "rolled_back"
+        message = f"事务[{txn.txn_id}]提交失败，失败{len(failed)}项：{', '.join(failed)}；已恢复{len(succeeded) - len(restore_failed)}项"
+        if restore_failed:
+            message += f"，恢复失败：{', '.join(restore_failed)}"
+        return {"success": False, "error": message}
+
+    txn.state = "committed"
+    elapsed = time.monotonic() - start
+    logger.info(f"事务[{txn.txn_id}]已提交：{'、'.join(labels)}，耗时{elapsed:.3f}秒")
+    return {"success": True, "message": f"事务[{txn.txn_id}]已提交：写入{'、'.join(labels)}共{len(labels)}项，耗时{elapsed:.3f}秒"}
+
+
+def __rollback_transaction(arm, txn):
+    """
+    回滚已提交的事务：一批并发写回提交时读取的修改前的值（不重新读取控制器）
 
-    try:
-        R_ID_Status = int(R_ID_Status)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "R_ID_Status寄存器编号必须是数值类型"}
+    参数：
+    - arm: Arm对象
+    - txn: FrameTransaction（调用方持有txn.lock）
 
-    try:
-        PR_ID = int(PR_ID)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "PR寄存器编号必须是数值类型"}
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    start = time.monotonic()
+    touched = txn.touched()
+    writes = [__pre_image_write(kind, item_id, txn.pre_image[(kind, item_id)]) for kind, item_id in touched]
+    labels = [f"{kind}[{item_id}]" for kind, item_id in touched]
+    _, failed = __write_batch(arm, writes, labels)
+    if failed:
+        return {"success": False, "error": f"事务[{txn.txn_id}]部分回滚失败，失败{len(failed)}项：{', '.join(failed)}"}
+    txn.state = "rolled_back"
+    elapsed = time.monotonic() - start
+    logger.info(f"事务[{txn.txn_id}]已回滚：{'、'.join(labels)}，耗时{elapsed:.3f}秒")
+    return {"success": True, "message": f"事务[{txn.txn_id}]已回滚：恢复{'、'.join(labels)}共{len(labels)}项，耗时{elapsed:.3f}秒"}
 
-    try:
-        R_ID_Error = int(R_ID_Error)
-    except (ValueError, TypeError):
-        return {"success": False, "error": "R_ID_Error寄存器编号必须是数值类型"}
 
-    # 获取Arm连接（长连接机制）
-    arm, error = __get_arm_connection()
-    if arm is None:
-        return {"success": False, "error": error}
+def __get_param_name(param_index: int):
+    """
+    将参数编号转换为属性名（SDK 2.0.0.0中直接使用a/b/c，不再需要r/p/y转换）
 
-    try:
-        # ========== 步骤1：读取字符串寄存器 ==========
-        # 读取SR寄存器内容，格式示例："1,100.5,200.3,300.1,45.2,60.8,90.0"
-        logger.info(f"步骤1：读取SR寄存器[{SR_ID}]")
-        str_value, ret = arm.register.read_SR(SR_ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            logger.error(f"读取SR寄存器[{SR_ID}]失败，错误代码：{error_msg}")
-            return {"success": False, "error": f"读取SR寄存器[{SR_ID}]失败，错误代码：{error_msg}"}
-        logger.info(f"SR寄存器[{SR_ID}]内容：{str_value}")
+    参数：
+    - param_index: 1-6 (1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C)
 
-        # 检查字符串是否为空
-        if not str_value or len(str_value.strip()) == 0:
-            logger.error(f"SR寄存器[{SR_ID}]内容为空，无法拆解")
-            # 确保R寄存器存在并写入状态码
-            __create_r_register(arm, R_ID_Status, 0)
-            __create_r_register(arm, R_ID_Error, 1)
-            arm.register.write_R(R_ID_Status, 0)
-            arm.register.write_R(R_ID_Error, 1)
-            return {"success": False, "error": f"SR寄存器[{SR_ID}]内容为空，无法拆解"}
+    返回：
+    - str: 属性名 ('x', 'y', 'z', 'a', 'b', 'c')
+    """
+    param_map = {
+        1: 'x',  # X坐标
+        2: 'y',  # Y坐标
+        3: 'z',  # Z坐标
+        4: 'a',  # 绕X轴旋转角度 (A)
+        5: 'b',  # 绕Y轴旋转角度 (B)
+        6: 'c'   # 绕Z轴旋转角度 (C)
+    }
+    return param_map.get(param_index)
 
-        # ========== 步骤2：自动检测分隔符并拆解字符串 ==========
-        # 自动检测常见分隔符：逗号、分号、竖线、制表符、空格等
-        # 按检测到的分隔符分割字符串，去除每个部分的前后空格
-        logger.info(f"步骤2：自动检测分隔符并拆解字符串")
 
-        def detect_delimiter(text):
-            """
-            自动检测字符串中使用的分隔符
-            返回检测到的分隔符
-            """
-            # 常见分隔符列表（按优先级排序）
-            common_delimiters = [',', ';', '|', '\t', ' ']
+def __create_r_register(arm, r_id: int, initial_value: float = 0.0):
+    """
+    创建并初始化R寄存器（如果不存在）
+
+    参数：
+    - arm: Arm对象
+    - r_id: R寄存器编号
+    - initial_value: 初始值，默认为0.0
+
+    返回：
+    - tuple: (StatusCodeEnum, 是否创建成功)
+    """
+    # 已确认存在的R寄存器直接返回，不再读取确认
+    if ("R", r_id) in _known_registers:
+        return StatusCodeEnum.OK, False
+
+    try:
+        # 尝试读取R寄存器，如果存在则直接返回
+        r_value, ret = arm.register.read_R(r_id)
+        if ret == StatusCodeEnum.OK:
+            logger.info(f"R寄存器[{r_id}]已存在，无需创建")
+            return StatusCodeEnum.OK, False
+
+        # R寄存器不存在，尝试通过写入来创建
+        logger.info(f"R寄存器[{r_id}]不存在，尝试自动创建（初始值={initial_value}）...")
+
+        # 尝试写入初始值来创建R寄存器
+        ret = arm.register.write_R(r_id, initial_value)
+        if ret == StatusCodeEnum.OK:
+            logger.info(f"成功创建R寄存器[{r_id}]（初始值={initial_value}）")
+            # 验证创建是否成功
+            verify_value, verify_ret = arm.register.read_R(r_id)
+            if verify_ret == StatusCodeEnum.OK:
+                logger.info(f"R寄存器[{r_id}]创建并验证成功，当前值={verify_value}")
+                return StatusCodeEnum.OK, True
+            else:
+                logger.warning(f"R寄存器[{r_id}]写入成功但验证失败，错误代码：{verify_ret}")
+                return StatusCodeEnum.OK, True  # 仍然返回成功，因为write_R成功了
+        else:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            logger.error(f"创建R寄存器[{r_id}]失败，错误代码：{error_msg}")
+            return ret, False
+
+    except Exception as ex:
+        logger.error(f"创建R寄存器[{r_id}]时发生异常：{ex}")
+        return StatusCodeEnum.CONTROLLER_ERROR, False
+
+
+def __get_pr_template(arm):
+    """
+    获取当前连接缓存的PR寄存器模板（所有分量已清零），首次调用时读取一个已存在的PR寄存器生成
+
+    优先使用已确认存在的PR寄存器作为模板，其次依次尝试PR[1]到PR[10]。
+    模板按Arm对象缓存，重新连接后重新生成。
+
+    参数：
+    - arm: Arm对象
+
+    返回：
+    - PR寄存器模板对象（调用方需复制后使用），没有可用模板时返回None
+    """
+    template_pr = _pr_templates.get(id(arm))
+    if template_pr is not None:
+        return template_pr
+
+    known_ids = sorted(reg_id for kind, reg_id in list(_known_registers) if kind == "PR")[:3]
+    for template_id in known_ids + [i for i in range(1, 11) if i not in known_ids]:
+        template_pr, template_ret = arm.register.read_PR(template_id)
+        if template_ret != StatusCodeEnum.OK:
+            continue
+        pr_position = __pr_position(template_pr)
+        if pr_position is None:
+            logger.warning(f"PR[{template_id}]结构不正确，不能作为模板")
+            continue
+
+        # 复制模板结构，但将所有值设为0
+        pr_position.x = 0.0
+        pr_position.y = 0.0
+        pr_position.z = 0.0
+        pr_position.a = 0.0
+        pr_position.b = 0.0
+        pr_position.c = 0.0
+        logger.debug(f"使用PR[{template_id}]生成PR寄存器模板")
+        _pr_templates[id(arm)] = template_pr
+        return template_pr
+    return None
+
+
+def __create_pr_register(arm, pr_id: int, verify: bool = True):
+    """
+    创建并初始化PR寄存器（如果不存在）
+
+    使用当前连接缓存的PR寄存器模板创建，模板已缓存时创建只需一次写入（及一次可选的验证读取）。
+
+    参数：
+    - arm: Arm对象
+    - pr_id: PR寄存器编号
+    - verify: 创建后是否读取验证，默认True
+
+    返回：
+    - tuple: (pr_register对象, StatusCodeEnum) 或 (None, 错误代码)
+    """
+    try:
+        # 尝试读取PR寄存器，如果存在则直接返回
+        pr_register, ret = arm.register.read_PR(pr_id)
+        if ret == StatusCodeEnum.OK:
+            logger.info(f"PR寄存器[{pr_id}]已存在，无需创建")
+            return pr_register, ret
+
+        # PR寄存器不存在，需要创建
+        logger.info(f"PR寄存器[{pr_id}]不存在，开始创建...")
+
+        # 通过写入一个由模板复制的PR寄存器对象来创建
+        template_pr = __get_pr_template(arm)
+        if template_pr is None:
+            # 没有任何PR寄存器存在，无法创建模板
+            logger.error(f"无法创建PR寄存器[{pr_id}]：系统中没有任何PR寄存器可以作为模板")
+            logger.error(f"请先在示教器中至少创建一个PR寄存器（如PR[1]），然后再使用此功能")
+            return None, StatusCodeEnum.NOT_FOUND
+
+        pr_register = copy.deepcopy(template_pr)
+
+        # 设置PR寄存器索引
+        __set_pr_index(pr_register, pr_id)
+
+        # 尝试写入PR寄存器（如果SDK支持通过写入来创建）
+        ret = arm.register.write_PR(pr_register)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            logger.error(f"写入PR寄存器[{pr_id}]失败，错误代码：{error_msg}")
+            return None, ret
+        logger.info(f"成功创建PR寄存器[{pr_id}]（使用模板）")
+
+        if not verify:
+            return pr_register, StatusCodeEnum.OK
+
+        # 验证创建是否成功
+        verify_pr, verify_ret = arm.register.read_PR(pr_id)
+        if verify_ret == StatusCodeEnum.OK:
+            logger.info(f"PR寄存器[{pr_id}]创建并验证成功")
+            return verify_pr, StatusCodeEnum.OK
+        logger.warning(f"PR寄存器[{pr_id}]写入成功但验证失败，错误代码：{verify_ret}")
+        return pr_register, StatusCodeEnum.OK  # 仍然返回成功，因为write_PR成功了
+
+    except Exception as ex:
+        logger.error(f"创建PR寄存器[{pr_id}]时发生异常：{ex}")
+        return None, StatusCodeEnum.CONTROLLER_ERROR
+
+
+def __set_frame_multi(frame_type: str, ID, Source, pairs) -> dict:
+    """
+    一次读取、一次更新修改坐标系的多个分量（SetTFMulti/SetUFMulti的实现）
+
+    来源为R寄存器时，坐标系与各R寄存器在同一批并发读取中完成。
+
+    参数：
+    - frame_type: 坐标系类型（TF/UF）
+    - ID: 坐标系ID号
+    - Source: 0=Value为参数值，1=Value为R寄存器编号
+    - pairs: [(Pos, Value)]，Pos为0的项忽略
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 验证ID为数值类型并转换为整数
+    try:
+        ID = int(ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "ID号必须是数值类型"}
+    if ID < 1 or ID > 30:
+        return {"success": False, "error": f"ID号必须在1-30之间，当前值：{ID}"}
+
+    try:
+        Source = int(Source)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "来源必须是数值类型（0或1）"}
+    if Source not in (0, 1):
+        return {"success": False, "error": f"来源必须是0（参数值）或1（R寄存器），当前值：{Source}"}
+
+    # 验证位置参数及参数值，Pos为0表示不修改
+    updates = []
+    for index, (pos, value) in enumerate(pairs, start=1):
+        try:
+            pos = int(pos)
+        except (ValueError, TypeError):
+            return {"success": False, "error": f"位置参数{index}必须是数值类型"}
+        if pos == 0:
+            continue
+        if __get_param_name(pos) is None:
+            return {"success": False, "error": f"位置参数{index}必须在0-6之间，当前值：{pos}（0=不修改, 1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C）"}
+        if any(pos == used for used, _ in updates):
+            return {"success": False, "error": f"位置参数{index}与前面的位置参数重复：{pos}"}
+        try:
+            value = int(value) if Source == 1 else float(value)
+        except (ValueError, TypeError):
+            if Source == 1:
+                return {"success": False, "error": f"R寄存器编号{index}必须是数值类型"}
+            return {"success": False, "error": f"无效的参数值{index}：{value}，必须是数值类型"}
+        updates.append((pos, value))
+    if not updates:
+        return {"success": False, "error": "至少需要指定一个位置参数（1-6）"}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    # 读取坐标系及R寄存器（一批并发读取）
+    calls = [(f"coordinate_system.{frame_type}.get", (ID,))]
+    if Source == 1:
+        calls += [("register.read_R", (r_id,)) for _, r_id in updates]
+    results = __run_sdk_batch(arm, calls)
+    for (method_path, args), (result, ex) in zip(calls, results):
+        if ex is not None:
+            logger.error(f"Set{frame_type}Multi读取失败: {ex}", exc_info=ex)
+            if method_path == "register.read_R":
+                return {"success": False, "error": f"读取R寄存器[{args[0]}]失败：{str(ex)}"}
+            return {"success": False, "error": f"获取坐标系失败：{str(ex)}"}
+        value, ret = result
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            if method_path == "register.read_R":
+                return {"success": False, "error": f"读取R寄存器[{args[0]}]失败，错误代码：{error_msg}"}
+            return {"success": False, "error": f"获取坐标系失败，错误代码：{error_msg}"}
+
+    coordinate = results[0][0][0]
+    param_names = {1: 'X', 2: 'Y', 3: 'Z', 4: 'A', 5: 'B', 6: 'C'}
+    changes = []
+    for index, (pos, value) in enumerate(updates):
+        if Source == 1:
+            new_value = round(float(results[index + 1][0][0]), 3)
+            changes.append(f"{param_names[pos]}={new_value}（R[{value}]）")
+        else:
+            new_value = round(value, 3)
+            changes.append(f"{param_names[pos]}={new_value}")
+        setattr(coordinate.data, __get_param_name(pos), new_value)
+
+    # 更新坐标系（所有分量一次写入）
+    frame_api = getattr(arm.coordinate_system, frame_type)
+    ret = frame_api.update(coordinate)
+    if ret != StatusCodeEnum.OK:
+        error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+        return {"success": False, "error": f"更新坐标系失败，错误代码：{error_msg}"}
+
+    return {
+        "success": True,
+        "message": f"{frame_type}坐标系[{ID}]已更新：{', '.join(changes)}"
+    }
+
+
+@__timed_instruction
+@__with_arm_session
+def SetTF(ID: int, Pos: int, Value: float) -> dict:
+    """
+    工具坐标系
+
+    参数：
+    - ID (int): ID号（数值1-30，0是基础坐标系不可修改）
+    - Pos (int): 位置参数编号（1-6）
+      - 1: X坐标（单位：mm）
+      - 2: Y坐标（单位：mm）
+      - 3: Z坐标（单位：mm）
+      - 4: A角度（单位：度）
+      - 5: B角度（单位：度）
+      - 6: C角度（单位：度）
+    - Value (float): 参数值（输入框输入，数值类型）
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    # 验证ID为数值类型并转换为整数
+    try:
+        ID = int(ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "ID号必须是数值类型"}
+    if ID < 1 or ID > 30:
+        return {"success": False, "error": f"ID号必须在1-30之间，当前值：{ID}"}
+
+    # 验证位置参数
+    try:
+        Pos = int(Pos)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "位置参数必须是数值类型"}
+    if Pos < 1 or Pos > 6:
+        return {"success": False, "error": f"位置参数必须在1-6之间，当前值：{Pos}（1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C）"}
+
+    # 验证Value为数值类型
+    try:
+        Value = float(Value)
+    except (ValueError, TypeError):
+        return {"success": False, "error": f"无效的参数值：{Value}，必须是数值类型"}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    try:
+        # 获取现有坐标系（SDK 2.0.0.0使用TF子类）
+        coordinate, ret = arm.coordinate_system.TF.get(ID)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            return {"success": False, "error": f"获取坐标系失败，错误代码：{error_msg}"}
+
+        # 更新参数值（保留三位小数）
+        Value = round(float(Value), 3)
+
+        # SDK 2.0.0.0中，坐标系数据存储在data属性中，直接包含x/y/z/a/b/c
+        # 参数映射：1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C
+        param_map = {1: 'x', 2: 'y', 3: 'z', 4: 'a', 5: 'b', 6: 'c'}
+        data_attr = param_map.get(Pos)
+        if data_attr is None:
+            return {"success": False, "error": f"无效的位置参数：{Pos}，必须是1-6之一"}
+
+        setattr(coordinate.data, data_attr, Value)
+
+        # 更新坐标系
+        ret = arm.coordinate_system.TF.update(coordinate)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            return {"success": False, "error": f"更新坐标系失败，错误代码：{error_msg}"}
+
+        param_names = {1: 'X', 2: 'Y', 3: 'Z', 4: 'A', 5: 'B', 6: 'C'}
+        param_display = param_names.get(Pos, f'参数{Pos}')
+        return {
+            "success": True,
+            "message": f"TF坐标系[{ID}]的{param_display}参数已更新为{Value}"
+        }
+
+    except Exception as ex:
+        logger.error(f"SetTF执行失败: {ex}")
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+
+@__timed_instruction
+@__with_arm_session
+def SetUF(ID: int, Pos: int, Value: float) -> dict:
+    """
+    用户坐标系
+
+    参数：
+    - ID (int): ID号（数值1-30，0是基础坐标系不可修改）
+    - Pos (int): 位置参数编号（1-6）
+      - 1: X坐标（单位：mm）
+      - 2: Y坐标（单位：mm）
+      - 3: Z坐标（单位：mm）
+      - 4: A角度（单位：度）
+      - 5: B角度（单位：度）
+      - 6: C角度（单位：度）
+    - Value (float): 参数值（输入框输入，数值类型）
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    # 验证ID为数值类型并转换为整数
+    try:
+        ID = int(ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "ID号必须是数值类型"}
+    if ID < 1 or ID > 30:
+        return {"success": False, "error": f"ID号必须在1-30之间，当前值：{ID}"}
+
+    # 验证位置参数
+    try:
+        Pos = int(Pos)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "位置参数必须是数值类型"}
+    if Pos < 1 or Pos > 6:
+        return {"success": False, "error": f"位置参数必须在1-6之间，当前值：{Pos}（1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C）"}
+
+    # 验证Value为数值类型
+    try:
+        Value = float(Value)
+    except (ValueError, TypeError):
+        return {"success": False, "error": f"无效的参数值：{Value}，必须是数值类型"}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    try:
+        # 获取现有坐标系（SDK 2.0.0.0使用UF子类）
+        coordinate, ret = arm.coordinate_system.UF.get(ID)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            return {"success": False, "error": f"获取坐标系失败，错误代码：{error_msg}"}
+
+        # 更新参数值（保留三位小数）
+        Value = round(float(Value), 3)
+
+        # SDK 2.0.0.0中，坐标系数据存储在data属性中，直接包含x/y/z/a/b/c
+        # 参数映射：1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C
+        param_map = {1: 'x', 2: 'y', 3: 'z', 4: 'a', 5: 'b', 6: 'c'}
+        data_attr = param_map.get(Pos)
+        if data_attr is None:
+            return {"success": False, "error": f"无效的位置参数：{Pos}，必须是1-6之一"}
+
+        setattr(coordinate.data, data_attr, Value)
+
+        # 更新坐标系
+        ret = arm.coordinate_system.UF.update(coordinate)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            return {"success": False, "error": f"更新坐标系失败，错误代码：{error_msg}"}
+
+        param_names = {1: 'X', 2: 'Y', 3: 'Z', 4: 'A', 5: 'B', 6: 'C'}
+        param_display = param_names.get(Pos, f'参数{Pos}')
+        return {
+            "success": True,
+            "message": f"UF坐标系[{ID}]的{param_display}参数已更新为{Value}"
+        }
+
+    except Exception as ex:
+        logger.error(f"SetUF执行失败: {ex}")
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+
+@__timed_instruction
+@__with_arm_session
+def SetTF_R(ID: int, Pos: int, R_ID: int) -> dict:
+    """
+    工具坐标系（从R寄存器读取值）
+
+    参数：
+    - ID (int): ID号（数值1-30，0是基础坐标系不可修改）
+    - Pos (int): 位置参数编号（1-6）
+      - 1: X坐标（单位：mm）
+      - 2: Y坐标（单位：mm）
+      - 3: Z坐标（单位：mm）
+      - 4: A角度（单位：度）
+      - 5: B角度（单位：度）
+      - 6: C角度（单位：度）
+    - R_ID (int): R寄存器编号
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    # 验证ID为数值类型并转换为整数
+    try:
+        ID = int(ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "ID号必须是数值类型"}
+    if ID < 1 or ID > 30:
+        return {"success": False, "error": f"ID号必须在1-30之间，当前值：{ID}"}
+
+    # 验证位置参数
+    try:
+        Pos = int(Pos)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "位置参数必须是数值类型"}
+    if Pos < 1 or Pos > 6:
+        return {"success": False, "error": f"位置参数必须在1-6之间，当前值：{Pos}（1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C）"}
+
+    # 验证R_ID为数值类型并转换为整数
+    try:
+        R_ID = int(R_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "R寄存器编号必须是数值类型"}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    try:
+        # 读取R寄存器
+        r_value, ret = arm.register.read_R(R_ID)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            return {"success": False, "error": f"读取R寄存器[{R_ID}]失败，错误代码：{error_msg}"}
+
+        # 获取现有坐标系（SDK 2.0.0.0使用TF子类）
+        coordinate, ret = arm.coordinate_system.TF.get(ID)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            return {"success": False, "error": f"获取坐标系失败，错误代码：{error_msg}"}
+
+        # 更新参数值（保留三位小数）
+        Value = round(float(r_value), 3)
+
+        # SDK 2.0.0.0中，坐标系数据存储在data属性中，直接包含x/y/z/a/b/c
+        # 参数映射：1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C
+        param_map = {1: 'x', 2: 'y', 3: 'z', 4: 'a', 5: 'b', 6: 'c'}
+        data_attr = param_map.get(Pos)
+        if data_attr is None:
+            return {"success": False, "error": f"无效的位置参数：{Pos}，必须是1-6之一"}
+
+        setattr(coordinate.data, data_attr, Value)
+
+        # 更新坐标系
+        ret = arm.coordinate_system.TF.update(coordinate)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            return {"success": False, "error": f"更新坐标系失败，错误代码：{error_msg}"}
+
+        param_names = {1: 'X', 2: 'Y', 3: 'Z', 4: 'A', 5: 'B', 6: 'C'}
+        param_display = param_names.get(Pos, f'参数{Pos}')
+        return {
+            "success": True,
+            "message": f"TF坐标系[{ID}]的{param_display}参数已从R寄存器[{R_ID}]更新为{Value}"
+        }
+
+    except Exception as ex:
+        logger.error(f"SetTF_R执行失败: {ex}")
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+
+@__timed_instruction
+@__with_arm_session
+def SetUF_R(ID: int, Pos: int, R_ID: int) -> dict:
+    """
+    用户坐标系（从R寄存器读取值）
+
+    参数：
+    - ID (int): ID号（数值1-30，0是基础坐标系不可修改）
+    - Pos (int): 位置参数编号（1-6）
+      - 1: X坐标（单位：mm）
+      - 2: Y坐标（单位：mm）
+      - 3: Z坐标（单位：mm）
+      - 4: A角度（单位：度）
+      - 5: B角度（单位：度）
+      - 6: C角度（单位：度）
+    - R_ID (int): R寄存器编号
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    # 验证ID为数值类型并转换为整数
+    try:
+        ID = int(ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "ID号必须是数值类型"}
+    if ID < 1 or ID > 30:
+        return {"success": False, "error": f"ID号必须在1-30之间，当前值：{ID}"}
+
+    # 验证位置参数
+    try:
+        Pos = int(Pos)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "位置参数必须是数值类型"}
+    if Pos < 1 or Pos > 6:
+        return {"success": False, "error": f"位置参数必须在1-6之间，当前值：{Pos}（1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C）"}
+
+    # 验证R_ID为数值类型并转换为整数
+    try:
+        R_ID = int(R_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "R寄存器编号必须是数值类型"}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    try:
+        # 读取R寄存器
+        r_value, ret = arm.register.read_R(R_ID)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            return {"success": False, "error": f"读取R寄存器[{R_ID}]失败，错误代码：{error_msg}"}
+
+        # 获取现有坐标系（SDK 2.0.0.0使用UF子类）
+        coordinate, ret = arm.coordinate_system.UF.get(ID)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            return {"success": False, "error": f"获取坐标系失败，错误代码：{error_msg}"}
+
+        # 更新参数值（保留三位小数）
+        Value = round(float(r_value), 3)
+
+        # SDK 2.0.0.0中，坐标系数据存储在data属性中，直接包含x/y/z/a/b/c
+        # 参数映射：1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C
+        param_map = {1: 'x', 2: 'y', 3: 'z', 4: 'a', 5: 'b', 6: 'c'}
+        data_attr = param_map.get(Pos)
+        if data_attr is None:
+            return {"success": False, "error": f"无效的位置参数：{Pos}，必须是1-6之一"}
+
+        setattr(coordinate.data, data_attr, Value)
+
+        # 更新坐标系
+        ret = arm.coordinate_system.UF.update(coordinate)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            return {"success": False, "error": f"更新坐标系失败，错误代码：{error_msg}"}
+
+        param_names = {1: 'X', 2: 'Y', 3: 'Z', 4: 'A', 5: 'B', 6: 'C'}
+        param_display = param_names.get(Pos, f'参数{Pos}')
+        return {
+            "success": True,
+            "message": f"UF坐标系[{ID}]的{param_display}参数已从R寄存器[{R_ID}]更新为{Value}"
+        }
+
+    except Exception as ex:
+        logger.error(f"SetUF_R执行失败: {ex}")
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+
+@__timed_instruction
+@__with_arm_session
+def SetTF_PR(ID: int, PR_ID: int) -> dict:
+    """
+    工具坐标系（从PR寄存器读取完整位姿）
+
+    参数：
+    - ID (int): ID号（数值1-30，0是基础坐标系不可修改）
+    - PR_ID (int): PR寄存器编号
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    # 验证ID为数值类型并转换为整数
+    try:
+        ID = int(ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "ID号必须是数值类型"}
+    if ID < 1 or ID > 30:
+        return {"success": False, "error": f"ID号必须在1-30之间，当前值：{ID}"}
+
+    # 验证PR_ID为数值类型并转换为整数
+    try:
+        PR_ID = int(PR_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "PR寄存器编号必须是数值类型"}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    try:
+        # 读取PR寄存器
+        pr_register, ret = arm.register.read_PR(PR_ID)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            return {"success": False, "error": f"读取PR寄存器[{PR_ID}]失败，错误代码：{error_msg}"}
+
+        # 检查PR寄存器数据类型
+        pr_position = __pr_position(pr_register)
+        if pr_position is None:
+            return {"success": False, "error": f"PR寄存器[{PR_ID}]数据格式不正确，必须包含位姿数据"}
+
+        # 获取现有坐标系（SDK 2.0.0.0使用TF子类）
+        coordinate, ret = arm.coordinate_system.TF.get(ID)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            return {"success": False, "error": f"获取坐标系失败，错误代码：{error_msg}"}
+
+        # 从PR寄存器读取XYZABC值并更新到坐标系（保留三位小数）
+        # SDK 2.0.0.0中，坐标系数据直接使用a/b/c，不再需要r/p/y转换
+        # 更新坐标系数据（直接映射：x->x, y->y, z->z, a->a, b->b, c->c）
+        coordinate.data.x = round(pr_position.x, 3)
+        coordinate.data.y = round(pr_position.y, 3)
+        coordinate.data.z = round(pr_position.z, 3)
+        coordinate.data.a = round(pr_position.a, 3)
+        coordinate.data.b = round(pr_position.b, 3)
+        coordinate.data.c = round(pr_position.c, 3)
+
+        # 更新坐标系
+        ret = arm.coordinate_system.TF.update(coordinate)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            return {"success": False, "error": f"更新坐标系失败，错误代码：{error_msg}"}
+
+        return {
+            "success": True,
+            "message": f"TF坐标系[{ID}]已从PR寄存器[{PR_ID}]更新：X={coordinate.data.x}, Y={coordinate.data.y}, Z={coordinate.data.z}, A={coordinate.data.a}, B={coordinate.data.b}, C={coordinate.data.c}"
+        }
+
+    except Exception as ex:
+        logger.error(f"SetTF_PR执行失败: {ex}")
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+
+@__timed_instruction
+@__with_arm_session
+def SetUF_PR(ID: int, PR_ID: int) -> dict:
+    """
+    用户坐标系（从PR寄存器读取完整位姿）
+
+    参数：
+    - ID (int): ID号（数值1-30，0是基础坐标系不可修改）
+    - PR_ID (int): PR寄存器编号
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    # 验证ID为数值类型并转换为整数
+    try:
+        ID = int(ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "ID号必须是数值类型"}
+    if ID < 1 or ID > 30:
+        return {"success": False, "error": f"ID号必须在1-30之间，当前值：{ID}"}
+
+    # 验证PR_ID为数值类型并转换为整数
+    try:
+        PR_ID = int(PR_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "PR寄存器编号必须是数值类型"}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    try:
+        # 读取PR寄存器
+        pr_register, ret = arm.register.read_PR(PR_ID)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            return {"success": False, "error": f"读取PR寄存器[{PR_ID}]失败，错误代码：{error_msg}"}
+
+        # 检查PR寄存器数据类型
+        pr_position = __pr_position(pr_register)
+        if pr_position is None:
+            return {"success": False, "error": f"PR寄存器[{PR_ID}]数据格式不正确，必须包含位姿数据"}
+
+        # 获取现有坐标系（SDK 2.0.0.0使用UF子类）
+        coordinate, ret = arm.coordinate_system.UF.get(ID)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            return {"success": False, "error": f"获取坐标系失败，错误代码：{error_msg}"}
+
+        # 从PR寄存器读取XYZABC值并更新到坐标系（保留三位小数）
+        # SDK 2.0.0.0中，坐标系数据直接使用a/b/c，不再需要r/p/y转换
+        # 更新坐标系数据（直接映射：x->x, y->y, z->z, a->a, b->b, c->c）
+        coordinate.data.x = round(pr_position.x, 3)
+        coordinate.data.y = round(pr_position.y, 3)
+        coordinate.data.z = round(pr_position.z, 3)
+        coordinate.data.a = round(pr_position.a, 3)
+        coordinate.data.b = round(pr_position.b, 3)
+        coordinate.data.c = round(pr_position.c, 3)
+
+        # 更新坐标系
+        ret = arm.coordinate_system.UF.update(coordinate)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            return {"success": False, "error": f"更新坐标系失败，错误代码：{error_msg}"}
+
+        return {
+            "success": True,
+            "message": f"UF坐标系[{ID}]已从PR寄存器[{PR_ID}]更新：X={coordinate.data.x}, Y={coordinate.data.y}, Z={coordinate.data.z}, A={coordinate.data.a}, B={coordinate.data.b}, C={coordinate.data.c}"
+        }
+
+    except Exception as ex:
+        logger.error(f"SetUF_PR执行失败: {ex}")
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+
+@__timed_instruction
+@__with_arm_session
+def SetTFMulti(ID: int, Source: int = 0,
+               Pos1: int = 0, Value1: float = 0.0, Pos2: int = 0, Value2: float = 0.0,
+               Pos3: int = 0, Value3: float = 0.0, Pos4: int = 0, Value4: float = 0.0,
+               Pos5: int = 0, Value5: float = 0.0, Pos6: int = 0, Value6: float = 0.0) -> dict:
+    """
+    工具坐标系（多个分量一次更新）
+
+    一次读取、一次更新写入所有指定分量，坐标系不会出现只更新了部分分量的中间状态。
+
+    参数：
+    - ID (int): ID号（数值1-30，0是基础坐标系不可修改）
+    - Source (int): 参数值来源，默认0
+      - 0: Value1-Value6为参数值
+      - 1: Value1-Value6为R寄存器编号，从R寄存器读取参数值
+    - Pos1-Pos6 (int): 位置参数编号（0=不修改, 1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C），不能重复
+    - Value1-Value6 (float): 对应位置参数的参数值或R寄存器编号
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    try:
+        pairs = [(Pos1, Value1), (Pos2, Value2), (Pos3, Value3), (Pos4, Value4), (Pos5, Value5), (Pos6, Value6)]
+        return __set_frame_multi("TF", ID, Source, pairs)
+    except Exception as ex:
+        logger.error(f"SetTFMulti执行失败: {ex}", exc_info=True)
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+
+@__timed_instruction
+@__with_arm_session
+def SetUFMulti(ID: int, Source: int = 0,
+               Pos1: int = 0, Value1: float = 0.0, Pos2: int = 0, Value2: float = 0.0,
+               Pos3: int = 0, Value3: float = 0.0, Pos4: int = 0, Value4: float = 0.0,
+               Pos5: int = 0, Value5: float = 0.0, Pos6: int = 0, Value6: float = 0.0) -> dict:
+    """
+    用户坐标系（多个分量一次更新）
+
+    一次读取、一次更新写入所有指定分量，坐标系不会出现只更新了部分分量的中间状态。
+
+    参数：
+    - ID (int): ID号（数值1-30，0是基础坐标系不可修改）
+    - Source (int): 参数值来源，默认0
+      - 0: Value1-Value6为参数值
+      - 1: Value1-Value6为R寄存器编号，从R寄存器读取参数值
+    - Pos1-Pos6 (int): 位置参数编号（0=不修改, 1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C），不能重复
+    - Value1-Value6 (float): 对应位置参数的参数值或R寄存器编号
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    try:
+        pairs = [(Pos1, Value1), (Pos2, Value2), (Pos3, Value3), (Pos4, Value4), (Pos5, Value5), (Pos6, Value6)]
+        return __set_frame_multi("UF", ID, Source, pairs)
+    except Exception as ex:
+        logger.error(f"SetUFMulti执行失败: {ex}", exc_info=True)
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+
+@__timed_instruction
+@__with_arm_session
+def Incr(R_ID: int, Step: float = 1.0) -> dict:
+    """
+    R寄存器自增
+
+    参数：
+    - R_ID (int): R寄存器编号
+    - Step (float): 自增步长，默认为1.0
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    # 验证R_ID为数值类型并转换为整数
+    try:
+        R_ID = int(R_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "R寄存器编号必须是数值类型"}
+
+    # 验证Step为数值类型并转换为浮点数
+    try:
+        Step = float(Step)
+    except (ValueError, TypeError):
+        return {"success": False, "error": f"自增步长必须是数值类型，当前值：{Step}"}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    try:
+        # 读改写期间持有该R寄存器的锁，并发调用时不丢失更新
+        with __get_r_lock(R_ID):
+            # 读取R寄存器当前值
+            current_value, ret = arm.register.read_R(R_ID)
+            if ret != StatusCodeEnum.OK:
+                error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+                return {"success": False, "error": f"读取R寄存器[{R_ID}]失败，错误代码：{error_msg}"}
+
+            # 计算新值
+            new_value = float(current_value) + float(Step)
+
+            # 写入新值
+            ret = arm.register.write_R(R_ID, new_value)
+            if ret != StatusCodeEnum.OK:
+                error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+                return {"success": False, "error": f"写入R寄存器[{R_ID}]失败，错误代码：{error_msg}"}
+
+        return {
+            "success": True,
+            "message": f"R寄存器[{R_ID}]已自增{Step}，当前值：{current_value} -> {new_value}"
+        }
+
+    except Exception as ex:
+        logger.error(f"Incr执行失败: {ex}")
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+
+@__timed_instruction
+@__with_arm_session
+def Decr(R_ID: int, Step: float = 1.0) -> dict:
+    """
+    R寄存器自减
+
+    参数：
+    - R_ID (int): R寄存器编号
+    - Step (float): 自减步长，默认为1.0
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    # 验证R_ID为数值类型并转换为整数
+    try:
+        R_ID = int(R_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "R寄存器编号必须是数值类型"}
+
+    # 验证Step为数值类型并转换为浮点数
+    try:
+        Step = float(Step)
+    except (ValueError, TypeError):
+        return {"success": False, "error": f"自减步长必须是数值类型，当前值：{Step}"}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    try:
+        # 读改写期间持有该R寄存器的锁，并发调用时不丢失更新
+        with __get_r_lock(R_ID):
+            # 读取R寄存器当前值
+            current_value, ret = arm.register.read_R(R_ID)
+            if ret != StatusCodeEnum.OK:
+                error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+                return {"success": False, "error": f"读取R寄存器[{R_ID}]失败，错误代码：{error_msg}"}
+
+            # 计算新值（减去步长）
+            new_value = float(current_value) - float(Step)
+
+            # 写入新值
+            ret = arm.register.write_R(R_ID, new_value)
+            if ret != StatusCodeEnum.OK:
+                error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+                return {"success": False, "error": f"写入R寄存器[{R_ID}]失败，错误代码：{error_msg}"}
+
+        return {
+            "success": True,
+            "message": f"R寄存器[{R_ID}]已自减{Step}，当前值：{current_value} -> {new_value}"
+        }
+
+    except Exception as ex:
+        logger.error(f"Decr执行失败: {ex}")
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+
+@__timed_instruction
+@__with_arm_session
+def IncrBatch(R_ID: int, Count: int, Step: float = 1.0) -> dict:
+    """
+    批量R寄存器自增（连续编号）
+
+    将R[R_ID]到R[R_ID+Count-1]共Count个R寄存器各自增Step（Step为负数时自减），
+    一次调用内并发读取、并发写入，与Incr/Decr共用每个R寄存器的读改写锁。
+
+    参数：
+    - R_ID (int): 起始R寄存器编号
+    - Count (int): R寄存器个数（1-100）
+    - Step (float): 自增步长，默认为1.0
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    try:
+        R_ID = int(R_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "R寄存器编号必须是数值类型"}
+
+    try:
+        Count = int(Count)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "R寄存器个数必须是数值类型"}
+
+    if Count < 1 or Count > 100:
+        return {"success": False, "error": f"R寄存器个数必须在1-100之间，当前值：{Count}"}
+
+    try:
+        Step = float(Step)
+    except (ValueError, TypeError):
+        return {"success": False, "error": f"自增步长必须是数值类型，当前值：{Step}"}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    r_ids = list(range(R_ID, R_ID + Count))
+    # 按编号顺序加锁，避免与其他批量调用交叉加锁造成死锁
+    locks = [__get_r_lock(r_id) for r_id in r_ids]
+    for lock in locks:
+        lock.acquire()
+    try:
+        # 并发读取全部R寄存器，任一读取失败时不写入
+        read_results = __run_sdk_batch(arm, [("register.read_R", (r_id,)) for r_id in r_ids])
+        current_values = []
+        for r_id, (result, read_ex) in zip(r_ids, read_results):
+            if read_ex is not None:
+                raise read_ex
+            current_value, ret = result
+            if ret != StatusCodeEnum.OK:
+                error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+                return {"success": False, "error": f"读取R寄存器[{r_id}]失败，错误代码：{error_msg}"}
+            current_values.append(float(current_value))
+
+        # 并发写入新值，逐个检查写入结果
+        new_values = [current_value + Step for current_value in current_values]
+        write_results = __run_sdk_batch(
+            arm, [("register.write_R", (r_id, new_value)) for r_id, new_value in zip(r_ids, new_values)]
+        )
+        failed = []
+        for r_id, (ret, write_ex) in zip(r_ids, write_results):
+            if write_ex is not None:
+                failed.append(f"R[{r_id}]（{write_ex}）")
+            elif ret != StatusCodeEnum.OK:
+                failed.append(f"R[{r_id}]（{ret.errmsg if hasattr(ret, 'errmsg') else str(ret)}）")
+        if failed:
+            return {"success": False, "error": f"写入R寄存器失败{len(failed)}/{Count}个：{', '.join(failed)}"}
+
+        changes = ", ".join(
+            f"R[{r_id}]: {current_value} -> {new_value}"
+            for r_id, current_value, new_value in zip(r_ids, current_values, new_values)
+        )
+        return {"success": True, "message": f"{Count}个R寄存器已自增{Step}：{changes}"}
+
+    except Exception as ex:
+        logger.error(f"IncrBatch执行失败: {ex}")
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
+    finally:
+        for lock in reversed(locks):
+            lock.release()
+
+
+@__timed_instruction
+@__with_arm_session
+def Strp(SR_ID: int, R_ID_Status: int, PR_ID: int, R_ID_Error: int) -> dict:
+    """
+    拆解字符串数据到PR寄存器（视觉数据格式）
+
+    数据格式说明：
+    SR寄存器中的字符串格式：以分隔符分隔的数据（自动检测分隔符类型）
+    支持的分隔符：逗号","、分号";"、空格" "、制表符"\t"、竖线"|"等
+    示例（1组数据）：SR[1] = "1,100.5,200.3,45.0"
+    示例（2组数据）：SR[1] = "1,100.5,200.3,45.0,150.0,250.0,90.0"
+
+    数据格式规则：
+    1. 第一个数据为物料检测状态位
+       - "1" = 有物料，可以处理
+       - "0" = 无物料，不处理
+    2. 状态位后的数据必须是3的倍数（X,Y,C为一组）
+       - 示例：3个数据（1组）、6个数据（2组）、9个数据（3组）等
+    3. 每组数据按顺序映射为 (X, Y, C)
+
+    数据映射到PR寄存器：
+    每个PR寄存器存储6个分量（X, Y, Z, A, B, C）
+    数据映射规则：
+    - 第1组：X1 → PR[PR_ID].x, Y1 → PR[PR_ID].y, C1 → PR[PR_ID].c
+    - 第2组：X2 → PR[PR_ID+1].x, Y2 → PR[PR_ID+1].y, C2 → PR[PR_ID+1].c
+    - 以此类推...
+    - Z, A, B 分量保留PR寄存器原有的值，不修改
+
+    状态码说明：
+    - R_ID_Status：物料检测状态（1=有物料，0=无物料）
+    - R_ID_Error：错误状态码（0=正确，1=错误）
+      - 状态位=0（无物料）→ R_ID_Status=0, R_ID_Error=1（错误）
+      - 状态位=1且数据格式正确（3的倍数）→ R_ID_Status=1, R_ID_Error=0（正确）
+      - 状态位=1但数据格式错误（不是3的倍数）→ R_ID_Status=1, R_ID_Error=1（格式错误）
+
+    参数：
+    - SR_ID (int): 字符串寄存器编号，包含视觉数据
+                   格式：状态位,X,Y,C 或 状态位,X1,Y1,C1,X2,Y2,C2,...
+                   示例："1,100.5,200.3,45.0"
+    - R_ID_Status (int): R寄存器编号，用于输出物料检测状态（1=有物料，0=无物料）
+    - PR_ID (int): PR寄存器起始编号，用于保存拆解后的数据
+    - R_ID_Error (int): R寄存器编号，用于输出错误状态码（0=正确，1=错误）
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    try:
+        SR_ID = int(SR_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "SR寄存器编号必须是数值类型"}
+
+    try:
+        R_ID_Status = int(R_ID_Status)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "R_ID_Status寄存器编号必须是数值类型"}
+
+    try:
+        PR_ID = int(PR_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "PR寄存器编号必须是数值类型"}
+
+    try:
+        R_ID_Error = int(R_ID_Error)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "R_ID_Error寄存器编号必须是数值类型"}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    try:
+        # ========== 步骤1：读取字符串寄存器 ==========
+        # 读取SR寄存器内容，格式示例："1,100.5,200.3,300.1,45.2,60.8,90.0"
+        logger.info(f"步骤1：读取SR寄存器[{SR_ID}]")
+        str_value, ret = arm.register.read_SR(SR_ID)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            logger.error(f"读取SR寄存器[{SR_ID}]失败，错误代码：{error_msg}")
+            return {"success": False, "error": f"读取SR寄存器[{SR_ID}]失败，错误代码：{error_msg}"}
+        logger.info(f"SR寄存器[{SR_ID}]内容：{str_value}")
+
+        # 检查字符串是否为空
+        if not str_value or len(str_value.strip()) == 0:
+            logger.error(f"SR寄存器[{SR_ID}]内容为空，无法拆解")
+            # 确保R寄存器存在并写入状态码
+            __create_r_register(arm, R_ID_Status, 0)
+            __create_r_register(arm, R_ID_Error, 1)
+            arm.register.write_R(R_ID_Status, 0)
+            arm.register.write_R(R_ID_Error, 1)
+            return {"success": False, "error": f"SR寄存器[{SR_ID}]内容为空，无法拆解"}
+
+        # ========== 步骤2：自动检测分隔符并拆解字符串 ==========
+        # 自动检测常见分隔符：逗号、分号、竖线、制表符、空格等
+        # 按检测到的分隔符分割字符串，去除每个部分的前后空格
+        logger.info(f"步骤2：自动检测分隔符并拆解字符串")
+
+        def detect_delimiter(text):
+            """
+            自动检测字符串中使用的分隔符
+            返回检测到的分隔符
+            """
+            # 常见分隔符列表（按优先级排序）
+            common_delimiters = [',', ';', '|', '\t', ' ']
+
+            # 检测使用的分隔符：选择能产生最多有效部分（非空）的分隔符
+            detected_delimiter = None
+            max_valid_parts = 0
+
+            for delimiter in common_delimiters:
+                parts = [p.strip() for p in text.split(delimiter)]
+                valid_parts = [p for p in parts if p]  # 过滤空字符串
+                if len(valid_parts) > max_valid_parts:
+                    max_valid_parts = len(valid_parts)
+                    detected_delimiter = delimiter
+
+            # 如果没检测到常见分隔符，尝试检测其他字符
+            if detected_delimiter is None or max_valid_parts < 2:
+                # 查找第一个非数字、非小数点、非负号、非空格的字符作为分隔符
+                for i, char in enumerate(text):
+                    if i > 0 and char not in '0123456789.- \t':
+                        detected_delimiter = char
+                        logger.info(f"检测到自定义分隔符：'{char}'")
+                        break
+
+            # 如果还是没检测到，默认使用逗号
+            if detected_delimiter is None:
+                detected_delimiter = ','
+                logger.info(f"未检测到分隔符，使用默认分隔符：逗号")
+            else:
+                # 显示分隔符的可读名称
+                delimiter_names = {
+                    ',': '逗号',
+                    ';': '分号',
+                    '|': '竖线',
+                    '\t': '制表符',
+                    ' ': '空格'
+                }
+                delimiter_name = delimiter_names.get(detected_delimiter, f"'{detected_delimiter}'")
+                logger.info(f"检测到分隔符：{delimiter_name} ('{detected_delimiter}')")
+
+            return detected_delimiter
+
+        # 检测分隔符
+        detected_delimiter = detect_delimiter(str_value)
+
+        # 按检测到的分隔符拆解字符串
+        values = [v.strip() for v in str_value.split(detected_delimiter)]
+        logger.debug(f"拆解后的值：{values}")
+
+        # 过滤空值（防止有连续逗号或空字符串）
+        values = [v for v in values if v]
+
+        if len(values) == 0:
+            logger.error(f"SR寄存器[{SR_ID}]中没有有效数据")
+            # 确保R寄存器存在并写入状态码
+            __create_r_register(arm, R_ID_Status, 0)
+            __create_r_register(arm, R_ID_Error, 1)
+            arm.register.write_R(R_ID_Status, 0)
+            arm.register.write_R(R_ID_Error, 1)
+            return {"success": False, "error": f"SR寄存器[{SR_ID}]中没有有效数据"}
+
+        # ========== 步骤3：提取状态位（第一个数据） ==========
+        # 第一个值是物料检测状态位
+        # 示例：values[0] = "1" → status_value = 1（有物料）
+        logger.info(f"步骤3：提取物料检测状态位（第一个值：{values[0]}）")
+        try:
+            status_value = int(float(values[0]))
+            logger.info(f"物料检测状态位值：{status_value} ({'有物料' if status_value == 1 else '无物料'})")
+        except (ValueError, TypeError):
+            logger.error(f"SR寄存器[{SR_ID}]第一个值'{values[0]}'无法转换为状态位")
+            # 确保R寄存器存在并写入状态码
+            __create_r_register(arm, R_ID_Status, 0)
+            __create_r_register(arm, R_ID_Error, 1)
+            arm.register.write_R(R_ID_Status, 0)
+            arm.register.write_R(R_ID_Error, 1)
+            return {"success": False, "error": f"SR寄存器[{SR_ID}]第一个值'{values[0]}'无法转换为状态位"}
+
+        # ========== 步骤4：检查状态位并设置R_ID_Status ==========
+        # 将物料检测状态写入R_ID_Status寄存器
+        logger.info(f"步骤4：写入物料检测状态到R_ID_Status寄存器[{R_ID_Status}]")
+        __create_r_register(arm, R_ID_Status, status_value)
+        ret = arm.register.write_R(R_ID_Status, status_value)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            logger.warning(f"写入R_ID_Status寄存器[{R_ID_Status}]失败，错误代码：{error_msg}")
+
+        # ========== 步骤5：检查状态位 ==========
+        # 状态位为0表示无物料，不处理，设置R_ID_Error=1（错误）
+        if status_value == 0:
+            logger.warning(f"状态位为0，无物料，不进行拆解")
+            __create_r_register(arm, R_ID_Error, 1)
+            arm.register.write_R(R_ID_Error, 1)
+            return {
+                "success": False,
+                "error": f"SR寄存器[{SR_ID}]状态位为0，无物料，不进行拆解"
+            }
+
+        # ========== 步骤6：检查是否有数据 ==========
+        # 状态位为1，需要处理后面的数据（从第二个值开始）
+        if len(values) < 2:
+            logger.error(f"SR寄存器[{SR_ID}]只有状态位，没有数据")
+            # 确保R寄存器存在并写入状态码（格式错误）
+            __create_r_register(arm, R_ID_Error, 1)
+            arm.register.write_R(R_ID_Error, 1)
+            return {"success": False, "error": f"SR寄存器[{SR_ID}]只有状态位，没有数据"}
+
+        # ========== 步骤7：提取数据部分并验证格式 ==========
+        # 数据部分：状态位之后的所有数据
+        # 示例：values = ["1", "100.5", "200.3", "45.0"]
+        #      data_values = ["100.5", "200.3", "45.0"]
+        logger.info(f"步骤7：提取数据部分（跳过状态位）")
+        data_values = values[1:]
+        logger.info(f"数据部分：{data_values}，共{len(data_values)}个数据")
+
+        # ========== 步骤8：验证数据格式（必须是3的倍数） ==========
+        # 数据个数必须是3的倍数（X,Y,C为一组）
+        if len(data_values) % 3 != 0:
+            logger.error(f"SR寄存器[{SR_ID}]数据格式错误：数据个数{len(data_values)}不是3的倍数")
+            __create_r_register(arm, R_ID_Error, 1)
+            arm.register.write_R(R_ID_Error, 1)
+            return {
+                "success": False,
+                "error": f"SR寄存器[{SR_ID}]数据格式错误：数据个数{len(data_values)}不是3的倍数，必须是3的倍数（X,Y,C为一组）"
+            }
+        logger.info(f"数据格式验证通过：{len(data_values)}个数据，共{len(data_values) // 3}组")
+
+        # ========== 步骤9：将字符串值转换为浮点数 ==========
+        # 将数据字符串转换为浮点数
+        # 示例：["100.5", "200.3", "45.0"] → [100.5, 200.3, 45.0]
+        logger.info(f"步骤9：将字符串值转换为浮点数")
+        float_values = []
+        for i, val in enumerate(data_values):
+            try:
+                float_val = float(val)
+                float_values.append(float_val)
+                logger.debug(f"  数据{i+1}：'{val}' → {float_val}")
+            except (ValueError, TypeError):
+                logger.error(f"第{i+1}个数据'{val}'无法转换为数值")
+                # 确保R寄存器存在并写入状态码（数据格式错误）
+                __create_r_register(arm, R_ID_Error, 1)
+                arm.register.write_R(R_ID_Error, 1)
+                return {"success": False, "error": f"第{i+1}个数据'{val}'无法转换为数值"}
+        logger.info(f"转换完成，共{len(float_values)}个浮点数：{float_values}")
+
+        # ========== 步骤10：设置R_ID_Error=0（格式正确） ==========
+        logger.info(f"步骤10：数据格式正确，设置R_ID_Error寄存器[{R_ID_Error}]=0")
+        __create_r_register(arm, R_ID_Error, 0)
+        arm.register.write_R(R_ID_Error, 0)
+
+        # ========== 步骤11：计算需要多少个PR寄存器 ==========
+        # 每组3个数据（X,Y,C）写入一个PR寄存器
+        # 计算公式：数据数量 / 3
+        num_pr_registers = len(float_values) // 3
+        logger.info(f"步骤11：计算需要{num_pr_registers}个PR寄存器（{len(float_values)}个数据，{num_pr_registers}组）")
+
+        # ========== 步骤12：批量读取PR寄存器 ==========
+        # 先并发读取全部目标PR寄存器，全部存在且格式正确后再统一写入，避免只写入部分PR寄存器
+        pr_ids = [PR_ID + i for i in range(num_pr_registers)]
+        logger.info(f"步骤12：批量读取PR寄存器{pr_ids}")
+        read_results = __run_sdk_batch(arm, [("register.read_PR", (pr_id,)) for pr_id in pr_ids])
+
+        pr_registers = []
+        for pr_id, (result, read_ex) in zip(pr_ids, read_results):
+            if read_ex is not None:
+                raise read_ex
+            pr_register, ret = result
+
+            # 如果PR寄存器不存在，返回错误（需要手动创建）
+            if ret != StatusCodeEnum.OK:
+                error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+                logger.error(f"PR寄存器[{pr_id}]不存在（错误代码：{error_msg}）")
+                __create_r_register(arm, R_ID_Error, 1)
+                arm.register.write_R(R_ID_Error, 1)
+                return {
+                    "success": False,
+                    "error": f"PR寄存器[{pr_id}]不存在，请手动创建PR寄存器后再使用"
+                }
+
+            # 检查PR寄存器数据类型
+            if __pr_position(pr_register) is None:
+                logger.error(f"PR寄存器[{pr_id}]数据格式不正确，必须包含位姿数据")
+                __create_r_register(arm, R_ID_Error, 1)
+                arm.register.write_R(R_ID_Error, 1)
+                return {"success": False, "error": f"PR寄存器[{pr_id}]数据格式不正确，必须包含位姿数据"}
+            pr_registers.append(pr_register)
+
+        # ========== 步骤13：计算PR寄存器更新 ==========
+        # 按组处理数据，每组3个数据（X,Y,C）写入一个PR寄存器
+        # 数据映射关系：
+        #   - 第1组：数据[0] → PR[PR_ID].x, 数据[1] → PR[PR_ID].y, 数据[2] → PR[PR_ID].c
+        #   - 第2组：数据[3] → PR[PR_ID+1].x, 数据[4] → PR[PR_ID+1].y, 数据[5] → PR[PR_ID+1].c
+        #   - Z, A, B 保留PR寄存器原有的值，不修改
+        logger.info(f"步骤13：计算{num_pr_registers}个PR寄存器的更新")
+        for pr_count, (pr_id, pr_register) in enumerate(zip(pr_ids, pr_registers)):
+            pr_position = __pr_position(pr_register)
+
+            # 计算当前组的数据索引
+            group_start_idx = pr_count * 3  # 每组3个数据
+            x_value = round(float_values[group_start_idx], 3)      # X
+            y_value = round(float_values[group_start_idx + 1], 3)  # Y
+            c_value = round(float_values[group_start_idx + 2], 3)  # C
+
+            # 只更新X、Y、C三个分量，Z、A、B保留原值
+            pr_position.x = x_value
+            pr_position.y = y_value
+            pr_position.c = c_value
+
+            logger.info(f"  设置PR[{pr_id}]：X={x_value}, Y={y_value}, C={c_value}（Z={pr_position.z}, A={pr_position.a}, B={pr_position.b}保持不变）")
+
+            # 确保PR寄存器对象包含正确的索引信息（如果需要）
+            __set_pr_index(pr_register, pr_id)
+
+        # ========== 步骤14：批量写入PR寄存器 ==========
+        # 并发写入全部PR寄存器，逐个检查写入结果，部分失败时报告每个失败的PR寄存器
+        logger.info(f"步骤14：批量写入PR寄存器{pr_ids}")
+        write_results = __run_sdk_batch(arm, [("register.write_PR", (pr_register,)) for pr_register in pr_registers])
+
+        failed = []
+        for pr_id, (ret, write_ex) in zip(pr_ids, write_results):
+            if write_ex is not None:
+                error_msg = str(write_ex)
+            elif ret != StatusCodeEnum.OK:
+                error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            else:
+                logger.info(f"成功写入PR寄存器[{pr_id}]")
+                continue
+            logger.error(f"写入PR寄存器[{pr_id}]失败，错误代码：{error_msg}")
+            failed.append(f"PR[{pr_id}]（{error_msg}）")
+
+        if failed:
+            __create_r_register(arm, R_ID_Error, 1)
+            arm.register.write_R(R_ID_Error, 1)
+            return {
+                "success": False,
+                "error": f"写入PR寄存器失败{len(failed)}/{num_pr_registers}个：{', '.join(failed)}。请检查：1) PR寄存器是否存在 2) PR寄存器是否被锁定 3) 数据格式是否正确"
+            }
+
+        # 构建成功消息
+        pr_list = []
+        for i in range(num_pr_registers):
+            pr_list.append(f"PR[{PR_ID + i}]")
+        pr_str = ", ".join(pr_list)
+
+        logger.info(f"✅ 所有数据已成功写入PR寄存器：{pr_str}")
+        logger.info(f"成功拆解{len(float_values)}个数据（{num_pr_registers}组），共使用{num_pr_registers}个PR寄存器")
+        return {
+            "success": True,
+            "message": f"成功拆解{len(float_values)}个数据（{num_pr_registers}组）到{pr_str}，R_ID_Status={status_value}（物料状态），R_ID_Error=0（正确）"
+        }
+
+    except Exception as ex:
+        logger.error(f"Strp执行失败，发生异常: {ex}", exc_info=True)
+        # 发生异常时，确保R寄存器存在并写入状态码
+        try:
+            arm, _ = __get_arm_connection()
+            if arm:
+                __create_r_register(arm, R_ID_Status, 0)
+                __create_r_register(arm, R_ID_Error, 1)
+                arm.register.write_R(R_ID_Status, 0)
+                arm.register.write_R(R_ID_Error, 1)
+        except:
+            pass
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+
+def __tfshift_read_pose(pr_read, pr_id, label):
+    """
+    解析TFShift读取的PR寄存器位姿
 
-            # 检测使用的分隔符：选择能产生最多有效部分（非空）的分隔符
-            detected_delimiter = None
-            max_valid_parts = 0
+    参数：
+    - pr_read: read_PR的返回值(pr_register, ret)
+    - pr_id: PR寄存器编号
+    - label: 错误信息中的寄存器名称（如"拍照点"）
+
+    返回：
+    - PrecisionPose: 位姿，失败时返回None
+    - str: 错误信息，成功时返回None
+    """
+    pr_register, ret = pr_read
+    if ret != StatusCodeEnum.OK:
+        error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+        return None, f"读取{label}PR寄存器[{pr_id}]失败，错误代码：{error_msg}"
+    pr_position = __pr_position(pr_register)
+    if pr_position is None:
+        return None, f"PR寄存器[{pr_id}]数据格式不正确，必须包含位姿数据"
+    # 转换为W/P/R格式（W绕X轴，P绕Y轴，R绕Z轴，对应a/b/c）
+    return PrecisionPose([
+        pr_position.x,
+        pr_position.y,
+        pr_position.z,
+        pr_position.a,  # W (绕X轴) = a
+        pr_position.b,  # P (绕Y轴) = b
+        pr_position.c   # R (绕Z轴) = c
+    ]), None
+
+
+def __tfshift_reference_reads(InputTF_ID, CamPose_ID, RefVis_ID):
+    """TFShift基准数据（基准工具坐标系、拍照点、基准视觉模板）的批量读取项"""
+    return [
+        ("coordinate_system.TF.get", (InputTF_ID,)),
+        ("register.read_PR", (CamPose_ID,)),
+        ("register.read_PR", (RefVis_ID,)),
+    ]
+
+
+def __tfshift_source_versions(InputTF_ID, CamPose_ID, RefVis_ID):
+    """TFShift基准数据在坐标系缓存及寄存器镜像中的版本号（数据每变化一次加1）"""
+    return (
+        _frame_cache.version("TF", InputTF_ID),
+        _register_cache.version("PR", CamPose_ID),
+        _register_cache.version("PR", RefVis_ID),
+    )
+
+
+def __tfshift_build_context(InputTF_ID, CamPose_ID, RefVis_ID, versions, tf_read, cam_read, ref_read):
+    """
+    由读取到的基准数据构建TFShift基准上下文
+
+    参数：
+    - InputTF_ID、CamPose_ID、RefVis_ID: 基准工具坐标系及拍照点、基准视觉模板PR寄存器编号
+    - versions: 读取前记录的基准数据版本号（__tfshift_source_versions）
+    - tf_read、cam_read、ref_read: 对应的读取结果(对象, ret)
+
+    返回：
+    - TFShiftContext: 基准上下文，失败时返回None
+    - str: 错误信息，成功时返回None
+    """
+    # 基准工具坐标系数据（SDK 2.0.0.0使用TF子类）
+    coordinate, ret = tf_read
+    if ret != StatusCodeEnum.OK:
+        error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+        return None, f"读取基准工具坐标系[{InputTF_ID}]失败，错误代码：{error_msg}"
+    # SDK 2.0.0.0中，坐标系数据存储在data属性中，直接包含x/y/z/a/b/c
+    # 转换为W/P/R格式（W绕X轴，P绕Y轴，R绕Z轴，对应a/b/c）
+    ut1_ut0 = PrecisionPose([
+        coordinate.data.x,
+        coordinate.data.y,
+        coordinate.data.z,
+        coordinate.data.a,  # W (绕X轴) = a
+        coordinate.data.b,  # P (绕Y轴) = b
+        coordinate.data.c   # R (绕Z轴) = c
+    ])
+
+    # 拍照点位姿（UT1在UF1中的位姿）
+    ut1_uf1_pr2, error = __tfshift_read_pose(cam_read, CamPose_ID, "拍照点")
+    if error:
+        return None, error
+
+    # 基准视觉模板数据（工件C1在视觉坐标系中的位姿）
+    c1_uf1, error = __tfshift_read_pose(ref_read, RefVis_ID, "基准视觉模板")
+    if error:
+        return None, error
+
+    return TFShiftContext(InputTF_ID, CamPose_ID, RefVis_ID, ut1_ut0, ut1_uf1_pr2, c1_uf1, versions), None
+
+
+def __tfshift_context_changed(context):
+    """
+    检查基准数据是否已变化（不产生RPC）
+
+    上下文保存TFShiftArm读取到的基准位姿，默认直接使用，修改基准数据后需重新执行TFShiftArm。
+    开启寄存器镜像时比较拍照点及基准视觉模板PR寄存器的版本号（订阅通道失效时无法确认，视为已变化），
+    开启坐标系缓存时比较基准工具坐标系的版本号；版本号在读取基准数据之前记录，读取期间发生的变化也会被发现。
+
+    返回：
+    - str: 变化原因，未发现变化时返回None
+    """
+    if _REG_CACHE_ENABLED and not _register_cache.is_live():
+        return "寄存器镜像订阅通道失效"
+    versions = __tfshift_source_versions(context.input_tf_id, context.cam_pose_id, context.ref_vis_id)
+    checks = (
+        (_FRAME_CACHE_ENABLED, f"基准工具坐标系[{context.input_tf_id}]已变化"),
+        (_REG_CACHE_ENABLED, f"拍照点PR寄存器[{context.cam_pose_id}]已变化"),
+        (_REG_CACHE_ENABLED, f"基准视觉模板PR寄存器[{context.ref_vis_id}]已变化"),
+    )
+    for (enabled, label), armed, current in zip(checks, context.versions, versions):
+        if enabled and armed != current:
+            return label
+    return None
+
+
+def __tfshift_write_result(arm, context, ActVis_ID, act_read, ResultTF_ID, result_read):
+    """
+    按基准上下文计算补正结果并写入结果工具坐标系
+
+    参数：
+    - arm: Arm连接
+    - context: TFShift基准上下文
+    - ActVis_ID: 实际视觉坐标PR寄存器编号
+    - act_read: 实际视觉坐标PR寄存器的读取结果(pr_register, ret)
+    - ResultTF_ID: 结果工具坐标系编号
+    - result_read: 结果工具坐标系的读取结果(coordinate, ret)
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 实际视觉坐标数据（工件C2在视觉坐标系中的位姿）
+    c2_uf1, error = __tfshift_read_pose(act_read, ActVis_ID, "实际视觉坐标")
+    if error:
+        return {"success": False, "error": error}
+
+    poseUT2_relative_to_UT0 = context.correct(c2_uf1)
+
+    # 构建结果位姿列表
+    ut2_pose_list = [
+        poseUT2_relative_to_UT0.X,
+        poseUT2_relative_to_UT0.Y,
+        poseUT2_relative_to_UT0.Z,
+        poseUT2_relative_to_UT0.W,
+        poseUT2_relative_to_UT0.P,
+        poseUT2_relative_to_UT0.R
+    ]
+
+    # 写入结果工具坐标系（SDK 2.0.0.0使用TF子类）
+    logger.info(f"写入计算结果到工具坐标系[{ResultTF_ID}]")
+    coordinate, ret = result_read
+    if ret != StatusCodeEnum.OK:
+        error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+        return {"success": False, "error": f"获取工具坐标系[{ResultTF_ID}]失败，错误代码：{error_msg}"}
+
+    # SDK 2.0.0.0中，坐标系数据存储在data属性中，直接包含x/y/z/a/b/c
+    # W/P/R转换为a/b/c（W绕X轴=a, P绕Y轴=b, R绕Z轴=c）
+    coordinate.data.x = ut2_pose_list[0]
+    coordinate.data.y = ut2_pose_list[1]
+    coordinate.data.z = ut2_pose_list[2]
+    coordinate.data.a = ut2_pose_list[3]  # W (绕X轴) -> a
+    coordinate.data.b = ut2_pose_list[4]  # P (绕Y轴) -> b
+    coordinate.data.c = ut2_pose_list[5]  # R (绕Z轴) -> c
+
+    ret = arm.coordinate_system.TF.update(coordinate)
+    if ret != StatusCodeEnum.OK:
+        error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+        return {"success": False, "error": f"更新工具坐标系[{ResultTF_ID}]失败，错误代码：{error_msg}"}
+
+    return {
+        "success": True,
+        "message": f"工具坐标系补正完成，结果已写入TF[{ResultTF_ID}]：X={ut2_pose_list[0]:.6f}, Y={ut2_pose_list[1]:.6f}, Z={ut2_pose_list[2]:.6f}, A={ut2_pose_list[3]:.6f}, B={ut2_pose_list[4]:.6f}, C={ut2_pose_list[5]:.6f}"
+    }
+
+
+@__timed_instruction
+@__with_arm_session
+def TFShift(InputTF_ID: int = 1, ResultTF_ID: int = 3, CamPose_ID: int = 60, RefVis_ID: int = 61, ActVis_ID: int = 62) -> dict:
+    """
+    工具坐标系补正（基于视觉反馈）
+
+    该指令通过读取不同的视觉目标点偏差与基准视觉位置的偏差，来计算工具坐标系的相对偏差，
+    从而将偏差输出在工具坐标系中。
+
+    参数：
+    - InputTF_ID (int): 基准标定坐标系编号（1-30），默认1
+    - ResultTF_ID (int): 最终算法计算后写入的坐标系编号（1-30），默认3
+    - CamPose_ID (int): 拍照点PR寄存器编号，默认60
+    - RefVis_ID (int): 基准视觉模板数据PR寄存器编号，默认61（需要手动写入）
+    - ActVis_ID (int): 视觉输出的实际坐标数据PR寄存器编号，默认62（需要手动写入）
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    try:
+        InputTF_ID = int(InputTF_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "InputTF_ID必须是数值类型"}
+    if InputTF_ID < 1 or InputTF_ID > 30:
+        return {"success": False, "error": f"InputTF_ID必须在1-30之间，当前值：{InputTF_ID}"}
+
+    try:
+        ResultTF_ID = int(ResultTF_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "ResultTF_ID必须是数值类型"}
+    if ResultTF_ID < 1 or ResultTF_ID > 30:
+        return {"success": False, "error": f"ResultTF_ID必须在1-30之间，当前值：{ResultTF_ID}"}
+
+    try:
+        CamPose_ID = int(CamPose_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "CamPose_ID必须是数值类型"}
+
+    try:
+        RefVis_ID = int(RefVis_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "RefVis_ID必须是数值类型"}
+
+    try:
+        ActVis_ID = int(ActVis_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "ActVis_ID必须是数值类型"}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    try:
+        # 并发读取基准工具坐标系、拍照点、基准视觉模板、实际视觉坐标三个PR寄存器及结果工具坐标系（互不依赖）
+        logger.info(f"读取基准工具坐标系[{InputTF_ID}]及PR寄存器[{CamPose_ID}]、[{RefVis_ID}]、[{ActVis_ID}]")
+        versions = __tfshift_source_versions(InputTF_ID, CamPose_ID, RefVis_ID)
+        read_results = __run_sdk_batch(arm, __tfshift_reference_reads(InputTF_ID, CamPose_ID, RefVis_ID) + [
+            ("register.read_PR", (ActVis_ID,)),
+            ("coordinate_system.TF.get", (ResultTF_ID,)),
+        ])
+        for _, read_ex in read_results:
+            if read_ex is not None:
+                raise read_ex
+        tf_read, cam_read, ref_read, act_read, result_read = [result for result, _ in read_results]
+
+        context, error = __tfshift_build_context(InputTF_ID, CamPose_ID, RefVis_ID, versions, tf_read, cam_read, ref_read)
+        if error:
+            return {"success": False, "error": error}
+        return __tfshift_write_result(arm, context, ActVis_ID, act_read, ResultTF_ID, result_read)
+
+    except Exception as ex:
+        logger.error(f"TFShift执行失败: {ex}", exc_info=True)
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+
+@__timed_instruction
+@__with_arm_session
+def TFShiftArm(InputTF_ID: int = 1, CamPose_ID: int = 60, RefVis_ID: int = 61, Context: int = 1) -> dict:
+    """
+    准备工具坐标系补正的基准上下文
+
+    读取基准工具坐标系、拍照点及基准视觉模板，预先计算与实际视觉坐标无关的变换并保存在插件中，
+    之后每个工件执行TFShiftRun，只读取实际视觉坐标并写入结果工具坐标系。
+    基准数据未变化时沿用已有上下文的变换。
+
+    参数：
+    - InputTF_ID (int): 基准标定坐标系编号（1-30），默认1
+    - CamPose_ID (int): 拍照点PR寄存器编号，默认60
+    - RefVis_ID (int): 基准视觉模板数据PR寄存器编号，默认61
+    - Context (int): 上下文编号（1-99），默认1
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    try:
+        InputTF_ID = int(InputTF_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "InputTF_ID必须是数值类型"}
+    if InputTF_ID < 1 or InputTF_ID > 30:
+        return {"success": False, "error": f"InputTF_ID必须在1-30之间，当前值：{InputTF_ID}"}
+
+    try:
+        CamPose_ID = int(CamPose_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "CamPose_ID必须是数值类型"}
+
+    try:
+        RefVis_ID = int(RefVis_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "RefVis_ID必须是数值类型"}
+
+    Context, error = __validate_snapshot_slot(Context, "上下文编号")
+    if error:
+        return {"success": False, "error": error}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    try:
+        logger.info(f"读取基准工具坐标系[{InputTF_ID}]及PR寄存器[{CamPose_ID}]、[{RefVis_ID}]")
+        versions = __tfshift_source_versions(InputTF_ID, CamPose_ID, RefVis_ID)
+        read_results = __run_sdk_batch(arm, __tfshift_reference_reads(InputTF_ID, CamPose_ID, RefVis_ID))
+        for _, read_ex in read_results:
+            if read_ex is not None:
+                raise read_ex
+        tf_read, cam_read, ref_read = [result for result, _ in read_results]
+
+        context, error = __tfshift_build_context(InputTF_ID, CamPose_ID, RefVis_ID, versions, tf_read, cam_read, ref_read)
+        if error:
+            return {"success": False, "error": error}
+
+        # 变换由转换缓存复用，基准数据未变化时替换上下文只更新版本号
+        with _tfshift_contexts_lock:
+            previous = _tfshift_contexts.get(Context)
+            unchanged = previous is not None and previous.same_source(context)
+            _tfshift_contexts[Context] = context
+
+        source = f"基准TF[{InputTF_ID}]、拍照点PR[{CamPose_ID}]、基准视觉模板PR[{RefVis_ID}]"
+        if unchanged:
+            return {"success": True, "message": f"TFShift上下文[{Context}]基准数据未变化，沿用已有上下文（{source}）"}
+        return {"success": True, "message": f"TFShift上下文[{Context}]已就绪（{source}）"}
+
+    except Exception as ex:
+        logger.error(f"TFShiftArm执行失败: {ex}", exc_info=True)
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+
+@__timed_instruction
+@__with_arm_session
+def TFShiftRun(ResultTF_ID: int = 3, ActVis_ID: int = 62, Context: int = 1) -> dict:
+    """
+    按基准上下文执行工具坐标系补正
+
+    使用TFShiftArm准备好的上下文，只读取实际视觉坐标并写入结果工具坐标系，基准数据修改后需重新执行TFShiftArm。
+    开启寄存器镜像或坐标系缓存时，由版本号发现对应基准数据的变化，只在变化后重新读取基准数据并更新上下文；
+    寄存器镜像订阅通道失效时无法确认，与实际视觉坐标一并重新读取基准数据。
+
+    参数：
+    - ResultTF_ID (int): 最终算法计算后写入的坐标系编号（1-30），默认3
+    - ActVis_ID (int): 视觉输出的实际坐标数据PR寄存器编号，默认62
+    - Context (int): 上下文编号（1-99），默认1
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    try:
+        ResultTF_ID = int(ResultTF_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "ResultTF_ID必须是数值类型"}
+    if ResultTF_ID < 1 or ResultTF_ID > 30:
+        return {"success": False, "error": f"ResultTF_ID必须在1-30之间，当前值：{ResultTF_ID}"}
+
+    try:
+        ActVis_ID = int(ActVis_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "ActVis_ID必须是数值类型"}
+
+    Context, error = __validate_snapshot_slot(Context, "上下文编号")
+    if error:
+        return {"success": False, "error": error}
+
+    with _tfshift_contexts_lock:
+        context = _tfshift_contexts.get(Context)
+    if context is None:
+        return {"success": False, "error": f"TFShift上下文[{Context}]未就绪，请先执行TFShiftArm"}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    try:
+        # 并发读取实际视觉坐标及结果工具坐标系；基准数据已变化时一并重新读取
+        changed = __tfshift_context_changed(context)
+        reads = [
+            ("register.read_PR", (ActVis_ID,)),
+            ("coordinate_system.TF.get", (ResultTF_ID,)),
+        ]
+        if changed:
+            logger.debug(f"{changed}，重新读取TFShift上下文[{Context}]的基准数据")
+            versions = __tfshift_source_versions(context.input_tf_id, context.cam_pose_id, context.ref_vis_id)
+            reads += __tfshift_reference_reads(context.input_tf_id, context.cam_pose_id, context.ref_vis_id)
+        read_results = __run_sdk_batch(arm, reads)
+        for _, read_ex in read_results:
+            if read_ex is not None:
+                raise read_ex
+        act_read, result_read = [result for result, _ in read_results[:2]]
+
+        if changed:
+            tf_read, cam_read, ref_read = [result for result, _ in read_results[2:]]
+            context, error = __tfshift_build_context(
+                context.input_tf_id, context.cam_pose_id, context.ref_vis_id, versions, tf_read, cam_read, ref_read
+            )
+            if error:
+                return {"success": False, "error": error}
+            with _tfshift_contexts_lock:
+                previous = _tfshift_contexts.get(Context)
+                _tfshift_contexts[Context] = context
+            if previous is not None and not previous.same_source(context):
+                logger.info(f"TFShift上下文[{Context}]的基准数据已变化，已按新的基准数据更新")
+
+        return __tfshift_write_result(arm, context, ActVis_ID, act_read, ResultTF_ID, result_read)
+
+    except Exception as ex:
+        logger.error(f"TFShiftRun执行失败: {ex}", exc_info=True)
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+
+@__timed_instruction
+@__with_arm_session
+def DecToHex(R_ID: int, SR_ID: int) -> dict:
+    """
+    从十进制转换为十六进制
+
+    参数：
+    - R_ID (int): R寄存器编号，包含需要转换的十进制数（支持整数和浮点数）
+    - SR_ID (int): SR寄存器编号，用于保存转换后的十六进制字符串
+
+    转换规则：
+    1. 浮点数处理：截断（直接丢弃小数部分，不四舍五入）
+    2. 数值范围：32位整数（-2147483648 到 2147483647）
+    3. 负数处理：使用32位补码形式表示
+    4. 输出格式：固定8位十六进制字符串（大写，不足8位前面补零）
+
+    示例：
+    - R[1] = 255 → SR[1] = "000000FF"
+    - R[1] = 255.99 → SR[1] = "000000FF"（截断）
+    - R[1] = -1 → SR[1] = "FFFFFFFF"
+    - R[1] = -255 → SR[1] = "FFFFFF01"
+    - R[1] = 0 → SR[1] = "00000000"
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    # 验证R_ID为数值类型并转换为整数
+    try:
+        R_ID = int(R_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "R寄存器编号必须是数值类型"}
+
+    # 验证SR_ID为数值类型并转换为整数
+    try:
+        SR_ID = int(SR_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "SR寄存器编号必须是数值类型"}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    try:
+        # ========== 步骤1：读取R寄存器值 ==========
+        logger.info(f"步骤1：读取R寄存器[{R_ID}]")
+        r_value, ret = arm.register.read_R(R_ID)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            logger.error(f"读取R寄存器[{R_ID}]失败，错误代码：{error_msg}")
+            return {"success": False, "error": f"读取R寄存器[{R_ID}]失败，错误代码：{error_msg}"}
+        logger.info(f"R寄存器[{R_ID}]原始值：{r_value}（类型：{type(r_value).__name__}）")
+
+        # ========== 步骤2：转换为浮点数（统一处理） ==========
+        try:
+            float_value = float(r_value)
+        except (ValueError, TypeError):
+            logger.error(f"R寄存器[{R_ID}]的值'{r_value}'无法转换为数值")
+            return {"success": False, "error": f"R寄存器[{R_ID}]的值'{r_value}'无法转换为数值"}
+
+        # ========== 步骤3：截断为整数（丢弃小数部分） ==========
+        logger.info(f"步骤3：截断浮点数{float_value}为整数")
+        int_value = int(float_value)  # 直接截断，不四舍五入
+        logger.info(f"截断后的整数值：{int_value}")
+
+        # ========== 步骤4：验证32位整数范围 ==========
+        logger.info(f"步骤4：验证32位整数范围")
+        INT32_MIN = -2147483648
+        INT32_MAX = 2147483647
+        if int_value < INT32_MIN or int_value > INT32_MAX:
+            logger.error(f"数值{int_value}超出32位整数范围（{INT32_MIN} 到 {INT32_MAX}）")
+            return {
+                "success": False,
+                "error": f"数值{int_value}超出32位整数范围（{INT32_MIN} 到 {INT32_MAX}）"
+            }
+        logger.info(f"数值范围验证通过：{int_value}在32位范围内")
+
+        # ========== 步骤5：转换为32位补码（处理负数） ==========
+        logger.info(f"步骤5：转换为32位补码")
+        # 使用位运算确保是32位无符号整数（负数自动转换为补码）
+        uint32_value = int_value & 0xFFFFFFFF
+        logger.info(f"32位补码值（无符号整数）：{uint32_value} (0x{uint32_value:08X})")
+
+        # ========== 步骤6：格式化为8位大写十六进制字符串 ==========
+        logger.info(f"步骤6：格式化为8位大写十六进制字符串")
+        # format(value, '08X') 表示：8位，大写，不足8位前面补零
+        hex_string = format(uint32_value, '08X')
+        logger.info(f"十六进制字符串：'{hex_string}'")
 
-            for delimiter in common_delimiters:
-                parts = [p.strip() for p in text.split(delimiter)]
-                valid_parts = [p for p in parts if p]  # 过滤空字符串
-                if len(valid_parts) > max_valid_parts:
-                    max_valid_parts = len(valid_parts)
-                    detected_delimiter = delimiter
+        # ========== 步骤7：写入SR寄存器 ==========
+        logger.info(f"步骤7：写入SR寄存器[{SR_ID}]")
+        ret = arm.register.write_SR(SR_ID, hex_string)
+        if ret != StatusCodeEnum.OK:
+            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+            logger.error(f"写入SR寄存器[{SR_ID}]失败，错误代码：{error_msg}")
+            return {"success": False, "error": f"写入SR寄存器[{SR_ID}]失败，错误代码：{error_msg}"}
+        logger.info(f"成功写入SR寄存器[{SR_ID}]：'{hex_string}'")
 
-            # 如果没检测到常见分隔符，尝试检测其他字符
-            if detected_delimiter is None or max_valid_parts < 2:
-                # 查找第一个非数字、非小数点、非负号、非空格的字符作为分隔符
-                for i, char in enumerate(text):
-                    if i > 0 and char not in '0123456789.- \t':
-                        detected_delimiter = char
-                        logger.info(f"检测到自定义分隔符：'{char}'")
-                        break
+        # ========== 步骤8：返回成功信息 ==========
+        # 构建消息：显示原始值、截断后的整数值和十六进制结果
+        original_display = f"{r_value}" if isinstance(r_value, int) or r_value == int_value else f"{r_value}（截断为{int_value}）"
+        return {
+            "success": True,
+            "message": f"R寄存器[{R_ID}]的值{original_display}已转换为十六进制'{hex_string}'并写入SR寄存器[{SR_ID}]"
+        }
 
-            # 如果还是没检测到，默认使用逗号
-            if detected_delimiter is None:
-                detected_delimiter = ','
-                logger.info(f"未检测到分隔符，使用默认分隔符：逗号")
-            else:
-                # 显示分隔符的可读名称
-                delimiter_names = {
-                    ',': '逗号',
-                    ';': '分号',
-                    '|': '竖线',
-                    '\t': '制表符',
-                    ' ': '空格'
-                }
-                delimiter_name = delimiter_names.get(detected_delimiter, f"'{detected_delimiter}'")
-                logger.info(f"检测到分隔符：{delimiter_name} ('{detected_delimiter}')")
+    except Exception as ex:
+        logger.error(f"DecToHex执行失败: {ex}", exc_info=True)
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
 
-            return detected_delimiter
 
-        # 检测分隔符
-        detected_delimiter = detect_delimiter(str_value)
+@__timed_instruction
+@__with_arm_session
+def SaveSnapshot(Slot: int = 1, R_Count: int = 100, PR_Count: int = 100, SR_Count: int = 0) -> dict:
+    """
+    保存寄存器及坐标系快照到本地文件
 
-        # 按检测到的分隔符拆解字符串
-        values = [v.strip() for v in str_value.split(detected_delimiter)]
-        logger.debug(f"拆解后的值：{values}")
+    读取R[1]~R[R_Count]、PR[1]~PR[PR_Count]、SR[1]~SR[SR_Count]及全部TF/UF坐标系（1-30），
+    保存到插件目录下的CM_snapshot_<Slot>.json。寄存器并发读取，坐标系通过列表接口一次读取；
+    不存在的寄存器不写入快照。
 
-        # 过滤空值（防止有连续逗号或空字符串）
-        values = [v for v in values if v]
+    参数：
+    - Slot (int): 快照编号（1-99），默认1
+    - R_Count (int): 保存的R寄存器个数（从R[1]开始，0-1000），默认100
+    - PR_Count (int): 保存的PR寄存器个数（从PR[1]开始，0-1000），默认100
+    - SR_Count (int): 保存的SR寄存器个数（从SR[1]开始，0-1000），默认0
 
-        if len(values) == 0:
-            logger.error(f"SR寄存器[{SR_ID}]中没有有效数据")
-            # 确保R寄存器存在并写入状态码
-            __create_r_register(arm, R_ID_Status, 0)
-            __create_r_register(arm, R_ID_Error, 1)
-            arm.register.write_R(R_ID_Status, 0)
-            arm.register.write_R(R_ID_Error, 1)
-            return {"success": False, "error": f"SR寄存器[{SR_ID}]中没有有效数据"}
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    Slot, error = __validate_snapshot_slot(Slot)
+    if error:
+        return {"success": False, "error": error}
 
-        # ========== 步骤3：提取状态位（第一个数据） ==========
-        # 第一个值是物料检测状态位
-        # 示例：values[0] = "1" → status_value = 1（有物料）
-        logger.info(f"步骤3：提取物料检测状态位（第一个值：{values[0]}）")
+    counts = {}
+    for kind, count in (("R", R_Count), ("PR", PR_Count), ("SR", SR_Count)):
         try:
-            status_value = int(float(values[0]))
-            logger.info(f"物料检测状态位值：{status_value} ({'有物料' if status_value == 1 else '无物料'})")
+            count = int(count)
         except (ValueError, TypeError):
-            logger.error(f"SR寄存器[{SR_ID}]第一个值'{values[0]}'无法转换为状态位")
-            # 确保R寄存器存在并写入状态码
-            __create_r_register(arm, R_ID_Status, 0)
-            __create_r_register(arm, R_ID_Error, 1)
-            arm.register.write_R(R_ID_Status, 0)
-            arm.register.write_R(R_ID_Error, 1)
-            return {"success": False, "error": f"SR寄存器[{SR_ID}]第一个值'{values[0]}'无法转换为状态位"}
+            return {"success": False, "error": f"{kind}_Count必须是数值类型"}
+        if count < 0 or count > _SNAPSHOT_MAX_REGISTERS:
+            return {"success": False, "error": f"{kind}_Count必须在0-{_SNAPSHOT_MAX_REGISTERS}之间，当前值：{count}"}
+        counts[kind] = count
 
-        # ========== 步骤4：检查状态位并设置R_ID_Status ==========
-        # 将物料检测状态写入R_ID_Status寄存器
-        logger.info(f"步骤4：写入物料检测状态到R_ID_Status寄存器[{R_ID_Status}]")
-        __create_r_register(arm, R_ID_Status, status_value)
-        ret = arm.register.write_R(R_ID_Status, status_value)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            logger.warning(f"写入R_ID_Status寄存器[{R_ID_Status}]失败，错误代码：{error_msg}")
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
 
-        # ========== 步骤5：检查状态位 ==========
-        # 状态位为0表示无物料，不处理，设置R_ID_Error=1（错误）
-        if status_value == 0:
-            logger.warning(f"状态位为0，无物料，不进行拆解")
-            __create_r_register(arm, R_ID_Error, 1)
-            arm.register.write_R(R_ID_Error, 1)
-            return {
-                "success": False,
-                "error": f"SR寄存器[{SR_ID}]状态位为0，无物料，不进行拆解"
+    try:
+        start = time.monotonic()
+        snapshot = {"version": 1, "created": time.strftime("%Y-%m-%d %H:%M:%S")}
+
+        # 并发读取寄存器，读取失败（不存在）的寄存器不保存
+        calls = [(kind, reg_id) for kind in ("R", "PR", "SR") for reg_id in range(1, counts[kind] + 1)]
+        results = __run_sdk_batch(arm, [(f"register.read_{kind}", (reg_id,)) for kind, reg_id in calls])
+        for kind in ("R", "PR", "SR"):
+            snapshot[kind] = {}
+        for (kind, reg_id), (result, read_ex) in zip(calls, results):
+            if read_ex is not None:
+                raise read_ex
+            value, ret = result
+            if ret != StatusCodeEnum.OK:
+                continue
+            if kind == "PR":
+                pr_position = __pr_position(value)
+                if pr_position is None:
+                    continue
+                value = __snapshot_pose(pr_position)
+            elif kind == "R":
+                value = float(value)
+            snapshot[kind][str(reg_id)] = value
+
+        # 读取全部TF/UF坐标系
+        for frame_type, frame_api in (("TF", arm.coordinate_system.TF), ("UF", arm.coordinate_system.UF)):
+            frame_list, ret = frame_api.get_coordinate_list()
+            if ret != StatusCodeEnum.OK:
+                error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+                return {"success": False, "error": f"读取{frame_type}坐标系列表失败，错误代码：{error_msg}"}
+            snapshot[frame_type] = {
+                str(coordinate.id): __snapshot_pose(coordinate.data)
+                for coordinate in frame_list if 1 <= coordinate.id <= 30
             }
 
-        # ========== 步骤6：检查是否有数据 ==========
-        # 状态位为1，需要处理后面的数据（从第二个值开始）
-        if len(values) < 2:
-            logger.error(f"SR寄存器[{SR_ID}]只有状态位，没有数据")
-            # 确保R寄存器存在并写入状态码（格式错误）
-            __create_r_register(arm, R_ID_Error, 1)
-            arm.register.write_R(R_ID_Error, 1)
-            return {"success": False, "error": f"SR寄存器[{SR_ID}]只有状态位，没有数据"}
+        # 先写临时文件再替换，避免写入中断时损坏已有快照
+        path = _SNAPSHOT_FILE_FORMAT.format(Slot)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(path + ".tmp", path)
 
-        # ========== 步骤7：提取数据部分并验证格式 ==========
-        # 数据部分：状态位之后的所有数据
-        # 示例：values = ["1", "100.5", "200.3", "45.0"]
-        #      data_values = ["100.5", "200.3", "45.0"]
-        logger.info(f"步骤7：提取数据部分（跳过状态位）")
-        data_values = values[1:]
-        logger.info(f"数据部分：{data_values}，共{len(data_values)}个数据")
+        summary = "，".join(f"{kind} {len(snapshot[kind])}个" for kind in ("R", "PR", "SR", "TF", "UF"))
+        logger.info(f"快照[{Slot}]已保存：{summary}，耗时{time.monotonic() - start:.3f}秒")
+        return {"success": True, "message": f"快照[{Slot}]已保存：{summary}"}
 
-        # ========== 步骤8：验证数据格式（必须是3的倍数） ==========
-        # 数据个数必须是3的倍数（X,Y,C为一组）
-        if len(data_values) % 3 != 0:
-            logger.error(f"SR寄存器[{SR_ID}]数据格式错误：数据个数{len(data_values)}不是3的倍数")
-            __create_r_register(arm, R_ID_Error, 1)
-            arm.register.write_R(R_ID_Error, 1)
-            return {
-                "success": False,
-                "error": f"SR寄存器[{SR_ID}]数据格式错误：数据个数{len(data_values)}不是3的倍数，必须是3的倍数（X,Y,C为一组）"
-            }
-        logger.info(f"数据格式验证通过：{len(data_values)}个数据，共{len(data_values) // 3}组")
+    except Exception as ex:
+        logger.error(f"SaveSnapshot执行失败: {ex}", exc_info=True)
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
 
-        # ========== 步骤9：将字符串值转换为浮点数 ==========
-        # 将数据字符串转换为浮点数
-        # 示例：["100.5", "200.3", "45.0"] → [100.5, 200.3, 45.0]
-        logger.info(f"步骤9：将字符串值转换为浮点数")
-        float_values = []
-        for i, val in enumerate(data_values):
-            try:
-                float_val = float(val)
-                float_values.append(float_val)
-                logger.debug(f"  数据{i+1}：'{val}' → {float_val}")
-            except (ValueError, TypeError):
-                logger.error(f"第{i+1}个数据'{val}'无法转换为数值")
-                # 确保R寄存器存在并写入状态码（数据格式错误）
-                __create_r_register(arm, R_ID_Error, 1)
-                arm.register.write_R(R_ID_Error, 1)
-                return {"success": False, "error": f"第{i+1}个数据'{val}'无法转换为数值"}
-        logger.info(f"转换完成，共{len(float_values)}个浮点数：{float_values}")
 
-        # ========== 步骤10：设置R_ID_Error=0（格式正确） ==========
-        logger.info(f"步骤10：数据格式正确，设置R_ID_Error寄存器[{R_ID_Error}]=0")
-        __create_r_register(arm, R_ID_Error, 0)
-        arm.register.write_R(R_ID_Error, 0)
+@__timed_instruction
+@__with_arm_session
+def RestoreSnapshot(Slot: int = 1) -> dict:
+    """
+    从本地快照文件恢复寄存器及坐标系
 
-        # ========== 步骤11：计算需要多少个PR寄存器 ==========
-        # 每组3个数据（X,Y,C）写入一个PR寄存器
-        # 计算公式：数据数量 / 3
-        num_pr_registers = len(float_values) // 3
-        logger.info(f"步骤11：计算需要{num_pr_registers}个PR寄存器（{len(float_values)}个数据，{num_pr_registers}组）")
+    读取快照中全部项在控制器上的当前值，只写入与快照不同的项（数值差超过_WRITE_TOLERANCE）。
+    寄存器并发读取、并发写入，坐标系通过列表接口一次读取；部分写入失败时报告每个失败的项。
 
-        # ========== 步骤12：将数据写入PR寄存器 ==========
-        # 按组处理数据，每组3个数据（X,Y,C）写入一个PR寄存器
-        # 数据映射关系：
-        #   - 第1组：数据[0] → PR[PR_ID].x, 数据[1] → PR[PR_ID].y, 数据[2] → PR[PR_ID].c
-        #   - 第2组：数据[3] → PR[PR_ID+1].x, 数据[4] → PR[PR_ID+1].y, 数据[5] → PR[PR_ID+1].c
-        #   - Z, A, B 保留PR寄存器原有的值，不修改
-        current_pr_id = PR_ID
-        pr_count = 0
+    参数：
+    - Slot (int): 快照编号（1-99），默认1
 
-        # 循环处理所有需要的PR寄存器
-        while pr_count < num_pr_registers:
-            logger.info(f"步骤12：处理PR寄存器[{current_pr_id}]（第{pr_count + 1}个PR寄存器，第{pr_count + 1}组数据）")
-            # 尝试读取当前PR寄存器
-            pr_register, ret = arm.register.read_PR(current_pr_id)
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    Slot, error = __validate_snapshot_slot(Slot)
+    if error:
+        return {"success": False, "error": error}
 
-            # 如果PR寄存器不存在，返回错误（需要手动创建）
+    path = _SNAPSHOT_FILE_FORMAT.format(Slot)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except FileNotFoundError:
+        return {"success": False, "error": f"快照[{Slot}]不存在：{path}"}
+    except (OSError, ValueError) as ex:
+        return {"success": False, "error": f"读取快照[{Slot}]失败：{ex}"}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    try:
+        start = time.monotonic()
+        writes = []
+        labels = []
+        failed = []
+
+        # 并发读取寄存器当前值，与快照比较
+        entries = [(kind, int(reg_id), value) for kind in ("R", "PR", "SR") for reg_id, value in snapshot.get(kind, {}).items()]
+        results = __run_sdk_batch(arm, [(f"register.read_{kind}", (reg_id,)) for kind, reg_id, _ in entries])
+        for (kind, reg_id, value), (result, read_ex) in zip(entries, results):
+            current, ret = result if read_ex is None else (None, None)
+            if kind == "PR":
+                pr_position = __pr_position(current) if ret == StatusCodeEnum.OK else None
+                if pr_position is None:
+                    # 当前值读取失败时基于模板创建
+                    current = __get_pr_template(arm)
+                    if current is None:
+                        failed.append(f"PR[{reg_id}]（无法读取）")
+                        continue
+                    current = copy.deepcopy(current)
+                    __set_pr_index(current, reg_id)
+                elif not __pose_differs(pr_position, value):
+                    continue
+                pr_position = __pr_position(current)
+                pr_position.x, pr_position.y, pr_position.z, pr_position.a, pr_position.b, pr_position.c = value
+                writes.append(("register.write_PR", (current,)))
+            elif kind == "R":
+                if ret == StatusCodeEnum.OK and abs(float(current) - float(value)) <= _WRITE_TOLERANCE:
+                    continue
+                writes.append(("register.write_R", (reg_id, float(value))))
+            else:
+                if ret == StatusCodeEnum.OK and current == value:
+                    continue
+                writes.append(("register.write_SR", (reg_id, value)))
+            labels.append(f"{kind}[{reg_id}]")
+
+        # 一次读取全部坐标系，与快照比较
+        for frame_type, frame_api in (("TF", arm.coordinate_system.TF), ("UF", arm.coordinate_system.UF)):
+            frames = snapshot.get(frame_type, {})
+            if not frames:
+                continue
+            frame_list, ret = frame_api.get_coordinate_list()
             if ret != StatusCodeEnum.OK:
                 error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-                logger.error(f"PR寄存器[{current_pr_id}]不存在（错误代码：{error_msg}）")
-                __create_r_register(arm, R_ID_Error, 1)
-                arm.register.write_R(R_ID_Error, 1)
-                return {
-                    "success": False,
-                    "error": f"PR寄存器[{current_pr_id}]不存在，请手动创建PR寄存器后再使用"
-                }
+                return {"success": False, "error": f"读取{frame_type}坐标系列表失败，错误代码：{error_msg}"}
+            current_frames = {coordinate.id: coordinate for coordinate in frame_list}
+            for frame_id, value in frames.items():
+                coordinate = current_frames.get(int(frame_id))
+                if coordinate is None:
+                    failed.append(f"{frame_type}[{frame_id}]（坐标系不存在）")
+                    continue
+                if not __pose_differs(coordinate.data, value):
+                    continue
+                data = coordinate.data
+                data.x, data.y, data.z, data.a, data.b, data.c = value
+                writes.append((f"coordinate_system.{frame_type}.update", (coordinate,)))
+                labels.append(f"{frame_type}[{frame_id}]")
+
+        # 并发写入有差异的项
+        unwritable = len(failed)
+        results = __run_sdk_batch(arm, writes)
+        for label, (ret, write_ex) in zip(labels, results):
+            if write_ex is not None:
+                failed.append(f"{label}（{write_ex}）")
+            elif ret != StatusCodeEnum.OK:
+                failed.append(f"{label}（{ret.errmsg if hasattr(ret, 'errmsg') else str(ret)}）")
+
+        total = len(entries) + sum(len(snapshot.get(frame_type, {})) for frame_type in ("TF", "UF"))
+        summary = f"共{total}项，写入{len(writes)}项，{total - len(writes) - unwritable}项未变化"
+        logger.info(f"快照[{Slot}]恢复完成：{summary}，耗时{time.monotonic() - start:.3f}秒")
+        if failed:
+            return {"success": False, "error": f"快照[{Slot}]部分恢复失败（{summary}），失败{len(failed)}项：{', '.join(failed)}"}
+        return {"success": True, "message": f"快照[{Slot}]已恢复：{summary}"}
 
-            # 检查PR寄存器数据类型
-            if not hasattr(pr_register, 'poseRegisterData') or \
-               not hasattr(pr_register.poseRegisterData, 'cartData') or \
-               not hasattr(pr_register.poseRegisterData.cartData, 'position'):
-                logger.error(f"PR寄存器[{current_pr_id}]数据格式不正确，必须包含位姿数据")
-                __create_r_register(arm, R_ID_Error, 1)
-                arm.register.write_R(R_ID_Error, 1)
-                return {"success": False, "error": f"PR寄存器[{current_pr_id}]数据格式不正确，必须包含位姿数据"}
+    except Exception as ex:
+        logger.error(f"RestoreSnapshot执行失败: {ex}", exc_info=True)
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
 
-            # 更新当前PR寄存器的X、Y、C分量，保留Z、A、B的原有值
-            pr_position = pr_register.poseRegisterData.cartData.position
 
-            # 保存原有的Z、A、B值
-            original_z = pr_position.z
-            original_a = pr_position.a
-            original_b = pr_position.b
+@__timed_instruction
+@__with_arm_session
+def ExportFrames(Table: int = 1) -> dict:
+    """
+    导出全部TF/UF坐标系到本地坐标系表文件
 
-            # 计算当前组的数据索引
-            group_start_idx = pr_count * 3  # 每组3个数据
-            x_value = round(float_values[group_start_idx], 3)      # X
-            y_value = round(float_values[group_start_idx + 1], 3)  # Y
-            c_value = round(float_values[group_start_idx + 2], 3)  # C
+    TF和UF坐标系列表并发读取，保存到插件目录下的CM_frames_<Table>.json，
+    每个坐标系保存名称、注释及位姿 [x, y, z, a, b, c]，可离线编辑后用ApplyFrames下发。
 
-            # 只更新X、Y、C三个分量，Z、A、B保留原值
-            pr_position.x = x_value
-            pr_position.y = y_value
-            pr_position.c = c_value
-            # Z、A、B保持原值不变
+    参数：
+    - Table (int): 坐标系表编号（1-99），默认1
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    Table, error = __validate_snapshot_slot(Table, "坐标系表编号")
+    if error:
+        return {"success": False, "error": error}
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
 
-            logger.info(f"  设置PR[{current_pr_id}]：X={x_value}, Y={y_value}, C={c_value}（Z={original_z}, A={original_a}, B={original_b}保持不变）")
+    try:
+        start = time.monotonic()
+        frame_types = ("TF", "UF")
+        results = __run_sdk_batch(arm, [(f"coordinate_system.{frame_type}.get_coordinate_list", ()) for frame_type in frame_types])
+        table = {"version": 1, "created": time.strftime("%Y-%m-%d %H:%M:%S")}
+        for frame_type, (result, read_ex) in zip(frame_types, results):
+            if read_ex is not None:
+                raise read_ex
+            frame_list, ret = result
+            if ret != StatusCodeEnum.OK:
+                error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+                return {"success": False, "error": f"读取{frame_type}坐标系列表失败，错误代码：{error_msg}"}
+            table[frame_type] = {
+                str(coordinate.id): __frame_table_entry(coordinate)
+                for coordinate in frame_list if 1 <= coordinate.id <= 30
+            }
 
-            # 写回PR寄存器
-            logger.info(f"准备写入PR寄存器[{current_pr_id}]")
+        # 先写临时文件再替换，避免写入中断时损坏已有坐标系表
+        path = _FRAME_TABLE_FILE_FORMAT.format(Table)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(table, f, ensure_ascii=False, indent=2)
+        os.replace(path + ".tmp", path)
 
-            # 确保PR寄存器对象包含正确的索引信息（如果需要）
-            if hasattr(pr_register, 'id'):
-                pr_register.id = current_pr_id
-            elif hasattr(pr_register, 'registerIndex'):
-                pr_register.registerIndex = current_pr_id
-            elif hasattr(pr_register, 'index'):
-                pr_register.index = current_pr_id
+        elapsed = time.monotonic() - start
+        summary = f"TF {len(table['TF'])}个，UF {len(table['UF'])}个"
+        logger.info(f"坐标系表[{Table}]已导出：{summary}，耗时{elapsed:.3f}秒")
+        return {"success": True, "message": f"坐标系表[{Table}]已导出：{summary}，耗时{elapsed:.3f}秒"}
+
+    except Exception as ex:
+        logger.error(f"ExportFrames执行失败: {ex}", exc_info=True)
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
+
+
+@__timed_instruction
+@__with_arm_session
+def ApplyFrames(Table: int = 1, DryRun: int = 0) -> dict:
+    """
+    将本地坐标系表下发到控制器（只写入有差异的坐标系）
+
+    TF和UF坐标系列表并发读取后与坐标系表比较，位姿差值超过_WRITE_TOLERANCE或名称、注释不同的坐标系
+    并发更新，控制器上不存在的坐标系新建；坐标系表中未列出的坐标系不修改。
+    坐标系表中的项可以是{"name", "comment", "pose"}，也可以直接是位姿列表 [x, y, z, a, b, c]
+    （SaveSnapshot快照文件中的坐标系部分可直接使用）。
+
+    参数：
+    - Table (int): 坐标系表编号（1-99），默认1
+    - DryRun (int): 1=只比较并报告差异，不写入；0=写入，默认0
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    Table, error = __validate_snapshot_slot(Table, "坐标系表编号")
+    if error:
+        return {"success": False, "error": error}
+
+    try:
+        DryRun = int(DryRun)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "DryRun必须是数值类型（0或1）"}
+    if DryRun not in (0, 1):
+        return {"success": False, "error": f"DryRun必须是0（写入）或1（只比较），当前值：{DryRun}"}
+
+    path = _FRAME_TABLE_FILE_FORMAT.format(Table)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            table = json.load(f)
+    except FileNotFoundError:
+        return {"success": False, "error": f"坐标系表[{Table}]不存在：{path}"}
+    except (OSError, ValueError) as ex:
+        return {"success": False, "error": f"读取坐标系表[{Table}]失败：{ex}"}
+
+    # 验证坐标系表内容
+    desired = []
+    for frame_type in ("TF", "UF"):
+        for frame_id, entry in table.get(frame_type, {}).items():
+            if isinstance(entry, dict):
+                name, comment, pose = entry.get("name"), entry.get("comment"), entry.get("pose")
+            else:
+                name, comment, pose = None, None, entry
+            try:
+                frame_id = int(frame_id)
+                pose = [float(value) for value in pose]
+            except (ValueError, TypeError):
+                return {"success": False, "error": f"坐标系表[{Table}]中{frame_type}[{frame_id}]的内容无效"}
+            if frame_id < 1 or frame_id > 30 or len(pose) != 6:
+                return {"success": False, "error": f"坐标系表[{Table}]中{frame_type}[{frame_id}]的内容无效（ID号1-30，位姿6个数值）"}
+            desired.append((frame_type, frame_id, name, comment, pose))
+
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
+
+    try:
+        start = time.monotonic()
+        frame_types = ("TF", "UF")
+        results = __run_sdk_batch(arm, [(f"coordinate_system.{frame_type}.get_coordinate_list", ()) for frame_type in frame_types])
+        current_frames = {}
+        for frame_type, (result, read_ex) in zip(frame_types, results):
+            if read_ex is not None:
+                raise read_ex
+            frame_list, ret = result
+            if ret != StatusCodeEnum.OK:
+                error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
+                return {"success": False, "error": f"读取{frame_type}坐标系列表失败，错误代码：{error_msg}"}
+            current_frames.update(((frame_type, coordinate.id), coordinate) for coordinate in frame_list)
+
+        # 比较并生成写入列表
+        writes = []
+        labels = []
+        for frame_type, frame_id, name, comment, pose in desired:
+            coordinate = current_frames.get((frame_type, frame_id))
+            if coordinate is None:
+                coordinate = Coordinate(frame_id, name or f"{frame_type}{frame_id}", comment or "", Position(*pose))
+                writes.append((f"coordinate_system.{frame_type}.add", (coordinate,)))
+                labels.append(f"{frame_type}[{frame_id}]（新建）")
+                continue
+            renamed = (name is not None and name != coordinate.name) or (comment is not None and comment != coordinate.comment)
+            if not renamed and not __pose_differs(coordinate.data, pose):
+                continue
+            if name is not None:
+                coordinate.name = name
+            if comment is not None:
+                coordinate.comment = comment
+            data = coordinate.data
+            data.x, data.y, data.z, data.a, data.b, data.c = pose
+            writes.append((f"coordinate_system.{frame_type}.update", (coordinate,)))
+            labels.append(f"{frame_type}[{frame_id}]")
+
+        summary = f"比较{len(desired)}个坐标系，{'需写入' if DryRun == 1 else '写入'}{len(writes)}个"
+        if labels:
+            summary += f"（{'、'.join(labels)}）"
+        if DryRun == 1:
+            elapsed = time.monotonic() - start
+            logger.info(f"坐标系表[{Table}]差异：{summary}，耗时{elapsed:.3f}秒")
+            return {"success": True, "message": f"坐标系表[{Table}]差异：{summary}，耗时{elapsed:.3f}秒"}
+
+        # 并发写入有差异的坐标系
+        failed = []
+        results = __run_sdk_batch(arm, writes)
+        for label, (ret, write_ex) in zip(labels, results):
+            if write_ex is not None:
+                failed.append(f"{label}（{write_ex}）")
+            elif ret != StatusCodeEnum.OK:
+                failed.append(f"{label}（{ret.errmsg if hasattr(ret, 'errmsg') else str(ret)}）")
+
+        elapsed = time.monotonic() - start
+        logger.info(f"坐标系表[{Table}]已应用：{summary}，耗时{elapsed:.3f}秒")
+        if failed:
+            return {"success": False, "error": f"坐标系表[{Table}]部分应用失败（{summary}），失败{len(failed)}个：{', '.join(failed)}"}
+        return {"success": True, "message": f"坐标系表[{Table}]已应用：{summary}，耗时{elapsed:.3f}秒"}
+
+    except Exception as ex:
+        logger.error(f"ApplyFrames执行失败: {ex}", exc_info=True)
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
 
-            # 写入PR寄存器
-            ret = arm.register.write_PR(pr_register)
 
-            if ret != StatusCodeEnum.OK:
-                error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-                logger.error(f"写入PR寄存器[{current_pr_id}]失败，错误代码：{error_msg}")
-                __create_r_register(arm, R_ID_Error, 1)
-                arm.register.write_R(R_ID_Error, 1)
-                return {
-                    "success": False,
-                    "error": f"写入PR寄存器[{current_pr_id}]失败，错误代码：{error_msg}。请检查：1) PR寄存器是否存在 2) PR寄存器是否被锁定 3) 数据格式是否正确"
-                }
-            logger.info(f"成功写入PR寄存器[{current_pr_id}]")
+@__timed_instruction
+def TxnBegin(Txn: int = 1) -> dict:
+    """
+    开始坐标系及R寄存器修改事务
 
-            current_pr_id += 1
-            pr_count += 1
+    之后用TxnSetFrame、TxnSetR暂存修改，TxnCommit一次提交，TxnRollback回滚。
+    同一编号已有事务时丢弃原事务（已提交的事务无法再回滚）。
 
-        # 构建成功消息
-        pr_list = []
-        for i in range(num_pr_registers):
-            pr_list.append(f"PR[{PR_ID + i}]")
-        pr_str = ", ".join(pr_list)
+    参数：
+    - Txn (int): 事务编号（1-99），默认1
 
-        logger.info(f"✅ 所有数据已成功写入PR寄存器：{pr_str}")
-        logger.info(f"成功拆解{len(float_values)}个数据（{num_pr_registers}组），共使用{num_pr_registers}个PR寄存器")
-        return {
-            "success": True,
-            "message": f"成功拆解{len(float_values)}个数据（{num_pr_registers}组）到{pr_str}，R_ID_Status={status_value}（物料状态），R_ID_Error=0（正确）"
-        }
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    Txn, error = __validate_txn_id(Txn)
+    if error:
+        return {"success": False, "error": error}
 
-    except Exception as ex:
-        logger.error(f"Strp执行失败，发生异常: {ex}", exc_info=True)
-        # 发生异常时，确保R寄存器存在并写入状态码
-        try:
-            arm, _ = __get_arm_connection()
-            if arm:
-                __create_r_register(arm, R_ID_Status, 0)
-                __create_r_register(arm, R_ID_Error, 1)
-                arm.register.write_R(R_ID_Status, 0)
-                arm.register.write_R(R_ID_Error, 1)
-        except:
-            pass
-        return {"success": False, "error": f"执行失败：{str(ex)}"}
+    with _transactions_lock:
+        previous = _transactions.get(Txn)
+        _transactions[Txn] = FrameTransaction(Txn)
+    if previous is not None and previous.state == "open" and previous.edit_count():
+        logger.warning(f"事务[{Txn}]重新开始，丢弃未提交的{previous.edit_count()}项修改")
+    return {"success": True, "message": f"事务[{Txn}]已开始"}
 
 
-def TFShift(InputTF_ID: int = 1, ResultTF_ID: int = 3, CamPose_ID: int = 60, RefVis_ID: int = 61, ActVis_ID: int = 62) -> dict:
+@__timed_instruction
+def TxnSetFrame(Txn: int = 1, FrameType: int = 1, ID: int = 1, Pos: int = 1, Value: float = 0.0, Source: int = 0) -> dict:
     """
-    工具坐标系补正（基于视觉反馈）
-
-    该指令通过读取不同的视觉目标点偏差与基准视觉位置的偏差，来计算工具坐标系的相对偏差，
-    从而将偏差输出在工具坐标系中。
+    在事务中暂存坐标系修改（不写入控制器）
 
     参数：
-    - InputTF_ID (int): 基准标定坐标系编号（1-30），默认1
-    - ResultTF_ID (int): 最终算法计算后写入的坐标系编号（1-30），默认3
-    - CamPose_ID (int): 拍照点PR寄存器编号，默认60
-    - RefVis_ID (int): 基准视觉模板数据PR寄存器编号，默认61（需要手动写入）
-    - ActVis_ID (int): 视觉输出的实际坐标数据PR寄存器编号，默认62（需要手动写入）
+    - Txn (int): 事务编号（1-99），默认1
+    - FrameType (int): 坐标系类型（1=TF工具坐标系，2=UF用户坐标系）
+    - ID (int): ID号（数值1-30，0是基础坐标系不可修改）
+    - Pos (int): 位置参数编号（1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C），Source=2时忽略
+    - Value (float): 参数值或寄存器编号（由Source决定）
+    - Source (int): 参数值来源，默认0
+      - 0: Value为参数值
+      - 1: Value为R寄存器编号，提交时读取R寄存器的值
+      - 2: Value为PR寄存器编号，提交时用PR寄存器的完整位姿替换坐标系
 
     返回：
     - dict: {"success": bool, "message": str, "error": str}
     """
     # 参数验证
+    Txn, error = __validate_txn_id(Txn)
+    if error:
+        return {"success": False, "error": error}
+
+    frame_types = {1: "TF", 2: "UF"}
     try:
-        InputTF_ID = int(InputTF_ID)
+        frame_type = frame_types.get(int(FrameType))
     except (ValueError, TypeError):
-        return {"success": False, "error": "InputTF_ID必须是数值类型"}
-    if InputTF_ID < 1 or InputTF_ID > 30:
-        return {"success": False, "error": f"InputTF_ID必须在1-30之间，当前值：{InputTF_ID}"}
+        frame_type = None
+    if frame_type is None:
+        return {"success": False, "error": f"坐标系类型必须是1（TF）或2（UF），当前值：{FrameType}"}
 
     try:
-        ResultTF_ID = int(ResultTF_ID)
+        ID = int(ID)
     except (ValueError, TypeError):
-        return {"success": False, "error": "ResultTF_ID必须是数值类型"}
-    if ResultTF_ID < 1 or ResultTF_ID > 30:
-        return {"success": False, "error": f"ResultTF_ID必须在1-30之间，当前值：{ResultTF_ID}"}
+        return {"success": False, "error": "ID号必须是数值类型"}
+    if ID < 1 or ID > 30:
+        return {"success": False, "error": f"ID号必须在1-30之间，当前值：{ID}"}
 
     try:
-        CamPose_ID = int(CamPose_ID)
+        Source = int(Source)
     except (ValueError, TypeError):
-        return {"success": False, "error": "CamPose_ID必须是数值类型"}
+        return {"success": False, "error": "来源必须是数值类型（0、1或2）"}
+    if Source not in (0, 1, 2):
+        return {"success": False, "error": f"来源必须是0（参数值）、1（R寄存器）或2（PR寄存器），当前值：{Source}"}
 
     try:
-        RefVis_ID = int(RefVis_ID)
+        Pos = int(Pos)
     except (ValueError, TypeError):
-        return {"success": False, "error": "RefVis_ID必须是数值类型"}
+        return {"success": False, "error": "位置参数必须是数值类型"}
+    if Source != 2 and __get_param_name(Pos) is None:
+        return {"success": False, "error": f"位置参数必须在1-6之间，当前值：{Pos}（1=X, 2=Y, 3=Z, 4=A, 5=B, 6=C）"}
 
     try:
-        ActVis_ID = int(ActVis_ID)
+        Value = float(Value) if Source == 0 else int(Value)
     except (ValueError, TypeError):
-        return {"success": False, "error": "ActVis_ID必须是数值类型"}
+        return {"success": False, "error": f"无效的参数值：{Value}，必须是数值类型"}
+
+    txn, error = __get_open_transaction(Txn)
+    if txn is None:
+        return {"success": False, "error": error}
+    with txn.lock:
+        if txn.state != "open":
+            return {"success": False, "error": f"事务[{Txn}]已提交或回滚"}
+        if txn.edit_count() >= _TXN_MAX_EDITS:
+            return {"success": False, "error": f"事务[{Txn}]最多暂存{_TXN_MAX_EDITS}项修改"}
+        txn.stage_frame(frame_type, ID, Pos, Source, Value)
+
+    param_names = {1: 'X', 2: 'Y', 3: 'Z', 4: 'A', 5: 'B', 6: 'C'}
+    if Source == 2:
+        change = f"位姿=PR[{Value}]"
+    elif Source == 1:
+        change = f"{param_names[Pos]}=R[{Value}]"
+    else:
+        change = f"{param_names[Pos]}={round(Value, 3)}"
+    return {"success": True, "message": f"事务[{Txn}]已暂存：{frame_type}坐标系[{ID}]的{change}"}
+
+
+@__timed_instruction
+def TxnSetR(Txn: int = 1, R_ID: int = 1, Value: float = 0.0) -> dict:
+    """
+    在事务中暂存R寄存器修改（不写入控制器）
+
+    参数：
+    - Txn (int): 事务编号（1-99），默认1
+    - R_ID (int): R寄存器编号（R寄存器需已存在）
+    - Value (float): 写入的值
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    # 参数验证
+    Txn, error = __validate_txn_id(Txn)
+    if error:
+        return {"success": False, "error": error}
+
+    try:
+        R_ID = int(R_ID)
+    except (ValueError, TypeError):
+        return {"success": False, "error": "R寄存器编号必须是数值类型"}
+
+    try:
+        Value = float(Value)
+    except (ValueError, TypeError):
+        return {"success": False, "error": f"无效的参数值：{Value}，必须是数值类型"}
+
+    txn, error = __get_open_transaction(Txn)
+    if txn is None:
+        return {"success": False, "error": error}
+    with txn.lock:
+        if txn.state != "open":
+            return {"success": False, "error": f"事务[{Txn}]已提交或回滚"}
+        if R_ID not in txn.register_edits and txn.edit_count() >= _TXN_MAX_EDITS:
+            return {"success": False, "error": f"事务[{Txn}]最多暂存{_TXN_MAX_EDITS}项修改"}
+        txn.stage_register(R_ID, Value)
+    return {"success": True, "message": f"事务[{Txn}]已暂存：R寄存器[{R_ID}]={Value}"}
+
+
+@__timed_instruction
+@__with_arm_session
+def TxnCommit(Txn: int = 1) -> dict:
+    """
+    提交事务
+
+    一批并发读取涉及的坐标系、R寄存器及数据来源寄存器，全部读取成功后一批并发写入；
+    读取失败时不写入任何项，写入部分失败时自动恢复已写入的项。
+
+    参数：
+    - Txn (int): 事务编号（1-99），默认1
+
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    Txn, error = __validate_txn_id(Txn)
+    if error:
+        return {"success": False, "error": error}
+
+    txn, error = __get_open_transaction(Txn)
+    if txn is None:
+        return {"success": False, "error": error}
+    if not txn.edit_count():
+        return {"success": False, "error": f"事务[{Txn}]没有暂存的修改"}
 
     # 获取Arm连接（长连接机制）
     arm, error = __get_arm_connection()
@@ -1436,262 +5382,258 @@ def TFShift(InputTF_ID: int = 1, ResultTF_ID: int = 3, CamPose_ID: int = 60, Ref
         return {"success": False, "error": error}
 
     try:
-        # 读取基准工具坐标系数据（SDK 2.0.0.0使用TF子类）
-        logger.info(f"读取基准工具坐标系[{InputTF_ID}]")
-        coordinate, ret = arm.coordinate_system.TF.get(InputTF_ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"读取基准工具坐标系[{InputTF_ID}]失败，错误代码：{error_msg}"}
-        # SDK 2.0.0.0中，坐标系数据存储在data属性中，直接包含x/y/z/a/b/c
-        # 转换为W/P/R格式（W绕X轴，P绕Y轴，R绕Z轴，对应a/b/c）
-        tool_data = [
-            coordinate.data.x,
-            coordinate.data.y,
-            coordinate.data.z,
-            coordinate.data.a,  # W (绕X轴) = a
-            coordinate.data.b,  # P (绕Y轴) = b
-            coordinate.data.c   # R (绕Z轴) = c
-        ]
-        ut1_ut0 = PrecisionPose(tool_data)
-
-        # 读取拍照点位姿（UT1在UF1中的位姿）
-        logger.info(f"读取拍照点PR寄存器[{CamPose_ID}]")
-        pr_register, ret = arm.register.read_PR(CamPose_ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"读取拍照点PR寄存器[{CamPose_ID}]失败，错误代码：{error_msg}"}
-        if not hasattr(pr_register, 'poseRegisterData') or \
-           not hasattr(pr_register.poseRegisterData, 'cartData') or \
-           not hasattr(pr_register.poseRegisterData.cartData, 'position'):
-            return {"success": False, "error": f"PR寄存器[{CamPose_ID}]数据格式不正确，必须包含位姿数据"}
-        pr_position = pr_register.poseRegisterData.cartData.position
-        pr_data = [
-            pr_position.x,
-            pr_position.y,
-            pr_position.z,
-            pr_position.a,  # W (绕X轴) = a
-            pr_position.b,  # P (绕Y轴) = b
-            pr_position.c   # R (绕Z轴) = c
-        ]
-        ut1_uf1_pr2 = PrecisionPose(pr_data)
-
-        # 读取基准视觉模板数据（工件C1在视觉坐标系中的位姿）
-        logger.info(f"读取基准视觉模板PR寄存器[{RefVis_ID}]")
-        pr_register, ret = arm.register.read_PR(RefVis_ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"读取基准视觉模板PR寄存器[{RefVis_ID}]失败，错误代码：{error_msg}"}
-        if not hasattr(pr_register, 'poseRegisterData') or \
-           not hasattr(pr_register.poseRegisterData, 'cartData') or \
-           not hasattr(pr_register.poseRegisterData.cartData, 'position'):
-            return {"success": False, "error": f"PR寄存器[{RefVis_ID}]数据格式不正确，必须包含位姿数据"}
-        pr_position = pr_register.poseRegisterData.cartData.position
-        pr_data = [
-            pr_position.x,
-            pr_position.y,
-            pr_position.z,
-            pr_position.a,  # W (绕X轴) = a
-            pr_position.b,  # P (绕Y轴) = b
-            pr_position.c   # R (绕Z轴) = c
-        ]
-        c1_uf1 = PrecisionPose(pr_data)
+        with txn.lock:
+            if txn.state != "open":
+                return {"success": False, "error": f"事务[{Txn}]已提交或回滚"}
+            return __commit_transaction(arm, txn)
 
-        # 读取实际视觉坐标数据（工件C2在视觉坐标系中的位姿）
-        logger.info(f"读取实际视觉坐标PR寄存器[{ActVis_ID}]")
-        pr_register, ret = arm.register.read_PR(ActVis_ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"读取实际视觉坐标PR寄存器[{ActVis_ID}]失败，错误代码：{error_msg}"}
-        if not hasattr(pr_register, 'poseRegisterData') or \
-           not hasattr(pr_register.poseRegisterData, 'cartData') or \
-           not hasattr(pr_register.poseRegisterData.cartData, 'position'):
-            return {"success": False, "error": f"PR寄存器[{ActVis_ID}]数据格式不正确，必须包含位姿数据"}
-        pr_position = pr_register.poseRegisterData.cartData.position
-        pr_data = [
-            pr_position.x,
-            pr_position.y,
-            pr_position.z,
-            pr_position.a,  # W (绕X轴) = a
-            pr_position.b,  # P (绕Y轴) = b
-            pr_position.c   # R (绕Z轴) = c
-        ]
-        c2_uf1 = PrecisionPose(pr_data)
+    except Exception as ex:
+        logger.error(f"TxnCommit执行失败: {ex}", exc_info=True)
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
 
-        # 构建变换矩阵
-        T_UT0_UT1 = PrecisionTransform.from_pose_zyx(ut1_ut0)
-        T_UF1_UT1_PR2 = PrecisionTransform.from_pose_zyx(ut1_uf1_pr2)
-        T_UF1_C1 = PrecisionTransform.from_pose_zyx(c1_uf1)
-        T_UF1_C2 = PrecisionTransform.from_pose_zyx(c2_uf1)
 
-        # 计算工件在工具坐标系中的位姿
-        T_UT1_C1 = T_UF1_UT1_PR2.inverse() * T_UF1_C1
-        T_UT1_C2 = T_UF1_UT1_PR2.inverse() * T_UF1_C2
+@__timed_instruction
+@__with_arm_session
+def TxnRollback(Txn: int = 1) -> dict:
+    """
+    回滚事务
 
-        poseC1_in_UT1 = T_UT1_C1.get_pose_zyx()
-        poseC2_in_UT1 = T_UT1_C2.get_pose_zyx()
+    未提交的事务直接丢弃暂存的修改；已提交的事务把提交时读取的修改前的值一批并发写回，不重新读取控制器。
 
-        # 计算新的工具坐标系TF2相对于TF0的位姿
-        T_UT0_C2 = T_UT0_UT1 * T_UT1_C2
-        T_UT0_UT2 = T_UT0_C2 * T_UT1_C1.inverse()
-        poseUT2_relative_to_UT0 = T_UT0_UT2.get_pose_zyx()
+    参数：
+    - Txn (int): 事务编号（1-99），默认1
 
-        # 验证计算（可选）
-        T_UF1_UT0 = T_UF1_UT1_PR2 * T_UT0_UT1.inverse()
-        T_UF1_UT2 = T_UF1_UT0 * T_UT0_UT2
-        T_UT2_C2_actual = T_UF1_UT2.inverse() * T_UF1_C2
-        poseC2_in_UT2_actual = T_UT2_C2_actual.get_pose_zyx()
-
-        errorX = abs(poseC1_in_UT1.X - poseC2_in_UT2_actual.X)
-        errorY = abs(poseC1_in_UT1.Y - poseC2_in_UT2_actual.Y)
-        errorR = abs(poseC1_in_UT1.R - poseC2_in_UT2_actual.R)
-        logger.info(f"误差分析: ΔX={errorX:.12e}, ΔY={errorY:.12e}, ΔR={errorR:.12e}")
-
-        # 构建结果位姿列表
-        ut2_pose_list = [
-            poseUT2_relative_to_UT0.X,
-            poseUT2_relative_to_UT0.Y,
-            poseUT2_relative_to_UT0.Z,
-            poseUT2_relative_to_UT0.W,
-            poseUT2_relative_to_UT0.P,
-            poseUT2_relative_to_UT0.R
-        ]
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}
+    """
+    Txn, error = __validate_txn_id(Txn)
+    if error:
+        return {"success": False, "error": error}
 
-        # 写入结果工具坐标系（SDK 2.0.0.0使用TF子类）
-        logger.info(f"写入计算结果到工具坐标系[{ResultTF_ID}]")
-        coordinate, ret = arm.coordinate_system.TF.get(ResultTF_ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"获取工具坐标系[{ResultTF_ID}]失败，错误代码：{error_msg}"}
+    with _transactions_lock:
+        txn = _transactions.get(Txn)
+    if txn is None:
+        return {"success": False, "error": f"事务[{Txn}]不存在"}
 
-        # SDK 2.0.0.0中，坐标系数据存储在data属性中，直接包含x/y/z/a/b/c
-        # W/P/R转换为a/b/c（W绕X轴=a, P绕Y轴=b, R绕Z轴=c）
-        coordinate.data.x = ut2_pose_list[0]
-        coordinate.data.y = ut2_pose_list[1]
-        coordinate.data.z = ut2_pose_list[2]
-        coordinate.data.a = ut2_pose_list[3]  # W (绕X轴) -> a
-        coordinate.data.b = ut2_pose_list[4]  # P (绕Y轴) -> b
-        coordinate.data.c = ut2_pose_list[5]  # R (绕Z轴) -> c
+    with txn.lock:
+        if txn.state == "rolled_back":
+            return {"success": False, "error": f"事务[{Txn}]已回滚"}
+        if txn.state == "open":
+            count = txn.edit_count()
+            txn.state = "rolled_back"
+            return {"success": True, "message": f"事务[{Txn}]未提交，已丢弃{count}项暂存的修改"}
 
-        ret = arm.coordinate_system.TF.update(coordinate)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            return {"success": False, "error": f"更新工具坐标系[{ResultTF_ID}]失败，错误代码：{error_msg}"}
+    # 获取Arm连接（长连接机制）
+    arm, error = __get_arm_connection()
+    if arm is None:
+        return {"success": False, "error": error}
 
-        return {
-            "success": True,
-            "message": f"工具坐标系补正完成，结果已写入TF[{ResultTF_ID}]：X={ut2_pose_list[0]:.6f}, Y={ut2_pose_list[1]:.6f}, Z={ut2_pose_list[2]:.6f}, A={ut2_pose_list[3]:.6f}, B={ut2_pose_list[4]:.6f}, C={ut2_pose_list[5]:.6f}"
-        }
+    try:
+        with txn.lock:
+            if txn.state != "committed":
+                return {"success": False, "error": f"事务[{Txn}]已回滚"}
+            return __rollback_transaction(arm, txn)
 
     except Exception as ex:
-        logger.error(f"TFShift执行失败: {ex}", exc_info=True)
+        logger.error(f"TxnRollback执行失败: {ex}", exc_info=True)
         return {"success": False, "error": f"执行失败：{str(ex)}"}
 
 
-def DecToHex(R_ID: int, SR_ID: int) -> dict:
+@__timed_instruction
+def WarmUpStatus() -> dict:
     """
-    从十进制转换为十六进制
+    查询连接预热状态
 
-    参数：
-    - R_ID (int): R寄存器编号，包含需要转换的十进制数（支持整数和浮点数）
-    - SR_ID (int): SR寄存器编号，用于保存转换后的十六进制字符串
+    预热需设置环境变量CM_WARMUP=1开启，插件加载时在后台建立连接；
+    同时启用坐标系缓存（CM_FRAME_CACHE=1）时还会整表预取TF/UF坐标系填充缓存。
 
-    转换规则：
-    1. 浮点数处理：截断（直接丢弃小数部分，不四舍五入）
-    2. 数值范围：32位整数（-2147483648 到 2147483647）
-    3. 负数处理：使用32位补码形式表示
-    4. 输出格式：固定8位十六进制字符串（大写，不足8位前面补零）
+    返回：
+    - dict: {"success": bool, "message": str, "error": str}，预热完成时success为True
+    """
+    status = _warmup_state["status"]
+    if status == "ready":
+        return {"success": True, "message": f"连接预热已完成，耗时{_warmup_state['elapsed']:.3f}秒"}
+    if status == "running":
+        return {"success": False, "error": "连接预热进行中"}
+    if status == "failed":
+        return {"success": False, "error": f"连接预热失败：{_warmup_state['error']}"}
+    return {"success": False, "error": "连接预热未启用（设置环境变量CM_WARMUP=1开启）"}
+
+
+@__timed_instruction
+def PerfStats(Dump: int = 0, Reset: int = 0) -> dict:
+    """
+    性能诊断：输出各指令及SDK调用的耗时统计
 
-    示例：
-    - R[1] = 255 → SR[1] = "000000FF"
-    - R[1] = 255.99 → SR[1] = "000000FF"（截断）
-    - R[1] = -1 → SR[1] = "FFFFFFFF"
-    - R[1] = -255 → SR[1] = "FFFFFF01"
-    - R[1] = 0 → SR[1] = "00000000"
+    统计每条指令的整体耗时，以及每个SDK调用（read_R、read_PR、write_PR、TF.get、TF.update等）的耗时，
+    按固定分桶的直方图估算p50/p95/p99，同时附带连接池、熔断器、IP缓存、寄存器缓存、坐标系缓存、变换缓存和跳过写入的统计信息。
+
+    参数：
+    - Dump (int): 是否将完整统计写入插件目录下的CM_perf_stats.json（1=写入，0=不写入），默认0
+    - Reset (int): 读取后是否清空耗时统计（1=清空，0=保留），默认0
 
     返回：
     - dict: {"success": bool, "message": str, "error": str}
     """
-    # 参数验证
-    # 验证R_ID为数值类型并转换为整数
     try:
-        R_ID = int(R_ID)
+        Dump = int(Dump)
     except (ValueError, TypeError):
-        return {"success": False, "error": "R寄存器编号必须是数值类型"}
+        return {"success": False, "error": "Dump必须是数值类型（0或1）"}
 
-    # 验证SR_ID为数值类型并转换为整数
     try:
-        SR_ID = int(SR_ID)
+        Reset = int(Reset)
     except (ValueError, TypeError):
-        return {"success": False, "error": "SR寄存器编号必须是数值类型"}
-
-    # 获取Arm连接（长连接机制）
-    arm, error = __get_arm_connection()
-    if arm is None:
-        return {"success": False, "error": error}
+        return {"success": False, "error": "Reset必须是数值类型（0或1）"}
 
     try:
-        # ========== 步骤1：读取R寄存器值 ==========
-        logger.info(f"步骤1：读取R寄存器[{R_ID}]")
-        r_value, ret = arm.register.read_R(R_ID)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            logger.error(f"读取R寄存器[{R_ID}]失败，错误代码：{error_msg}")
-            return {"success": False, "error": f"读取R寄存器[{R_ID}]失败，错误代码：{error_msg}"}
-        logger.info(f"R寄存器[{R_ID}]原始值：{r_value}（类型：{type(r_value).__name__}）")
+        latency = __get_latency_stats(reset=bool(Reset))
+        report = {
+            "latency": latency,
+            "arm_pool": __get_arm_pool_stats(),
+            "connect_breaker": __get_connect_breaker_stats(),
+            "robot_ip_cache": __get_robot_ip_cache_stats(),
+            "register_cache": _register_cache.stats(),
+            "frame_cache": _frame_cache.stats(),
+            "transform_cache": _transform_cache.stats(),
+            "elided_writes": __elided_write_stats_snapshot(),
+            "known_registers": {
+                kind: sum(1 for known_kind, _ in list(_known_registers) if known_kind == kind) for kind in ("R", "PR")
+            },
+        }
 
-        # ========== 步骤2：转换为浮点数（统一处理） ==========
-        try:
-            float_value = float(r_value)
-        except (ValueError, TypeError):
-            logger.error(f"R寄存器[{R_ID}]的值'{r_value}'无法转换为数值")
-            return {"success": False, "error": f"R寄存器[{R_ID}]的值'{r_value}'无法转换为数值"}
+        lines = []
+        for key, summary in latency.items():
+            line = (
+                f"{key}: n={summary['count']}, p50={summary['p50_ms']:.1f}ms, "
+                f"p95={summary['p95_ms']:.1f}ms, p99={summary['p99_ms']:.1f}ms, max={summary['max_ms']:.1f}ms"
+            )
+            if summary.get("rpc_max"):
+                line += f", 平均SDK调用{summary['rpc_avg']:.1f}次（最多{summary['rpc_max']}次）"
+            lines.append(line)
+        pool = report["arm_pool"]
+        lines.append(
+            f"连接池：{pool['in_use']}/{pool['size']}使用中，平均等待{pool['avg_wait_ms']:.1f}ms，"
+            f"利用率{pool['utilization'] * 100:.1f}%；熔断器：{report['connect_breaker']['state']}"
+        )
+        if _SKIP_UNCHANGED_WRITES:
+            elided = report["elided_writes"]
+            lines.append("跳过未变化写入：" + "，".join(
+                f"{kind} {stats['elided']}/{stats['writes']}次" for kind, stats in elided.items()
+            ))
+        if _REG_CACHE_ENABLED:
+            reg_cache = report["register_cache"]
+            lines.append(
+                f"寄存器缓存：{'订阅中' if reg_cache['live'] else '订阅失效'}，"
+                f"命中率{reg_cache['hit_rate'] * 100:.1f}%（{reg_cache['hits']}次命中），"
+                f"已缓存{reg_cache['cached']}/{reg_cache['watched']}个寄存器"
+            )
+            if _REG_MIRROR_RANGES and reg_cache['watermark'] is not None:
+                lines[-1] += f"，镜像预读{reg_cache['seeded']}个，最后一条订阅消息在{reg_cache['watermark']:.2f}秒前"
+
+        if _FRAME_CACHE_ENABLED:
+            frame_cache = report["frame_cache"]
+            lines.append(
+                f"坐标系缓存：命中率{frame_cache['hit_rate'] * 100:.1f}%（{frame_cache['hits']}次命中），"
+                f"已缓存{frame_cache['cached']}个坐标系，整表读取{frame_cache['list_fills']}次"
+            )
+
+        transform_cache = report["transform_cache"]
+        if transform_cache["hits"] or transform_cache["misses"]:
+            lines.append(
+                f"变换缓存：命中率{transform_cache['hit_rate'] * 100:.1f}%（{transform_cache['hits']}次命中），"
+                f"{transform_cache['size']}/{transform_cache['max_size']}条"
+            )
+
+        if Dump == 1:
+            with open(_PERF_STATS_FILE, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            lines.append(f"完整统计已写入：{_PERF_STATS_FILE}")
+
+        message = "\n".join(lines)
+        logger.info(f"性能统计：\n{message}")
+        return {"success": True, "message": message}
 
-        # ========== 步骤3：截断为整数（丢弃小数部分） ==========
-        logger.info(f"步骤3：截断浮点数{float_value}为整数")
-        int_value = int(float_value)  # 直接截断，不四舍五入
-        logger.info(f"截断后的整数值：{int_value}")
+    except Exception as ex:
+        logger.error(f"PerfStats执行失败: {ex}", exc_info=True)
+        return {"success": False, "error": f"执行失败：{str(ex)}"}
 
-        # ========== 步骤4：验证32位整数范围 ==========
-        logger.info(f"步骤4：验证32位整数范围")
-        INT32_MIN = -2147483648
-        INT32_MAX = 2147483647
-        if int_value < INT32_MIN or int_value > INT32_MAX:
-            logger.error(f"数值{int_value}超出32位整数范围（{INT32_MIN} 到 {INT32_MAX}）")
-            return {
-                "success": False,
-                "error": f"数值{int_value}超出32位整数范围（{INT32_MIN} 到 {INT32_MAX}）"
-            }
-        logger.info(f"数值范围验证通过：{int_value}在32位范围内")
 
-        # ========== 步骤5：转换为32位补码（处理负数） ==========
-        logger.info(f"步骤5：转换为32位补码")
-        # 使用位运算确保是32位无符号整数（负数自动转换为补码）
-        uint32_value = int_value & 0xFFFFFFFF
-        logger.info(f"32位补码值（无符号整数）：{uint32_value} (0x{uint32_value:08X})")
+def __get_async_executor():
+    """
+    获取异步版本指令使用的线程池（首次调用时创建）
 
-        # ========== 步骤6：格式化为8位大写十六进制字符串 ==========
-        logger.info(f"步骤6：格式化为8位大写十六进制字符串")
-        # format(value, '08X') 表示：8位，大写，不足8位前面补零
-        hex_string = format(uint32_value, '08X')
-        logger.info(f"十六进制字符串：'{hex_string}'")
+    返回：
+    - concurrent.futures.ThreadPoolExecutor: 线程池
+    """
+    global _async_executor
 
-        # ========== 步骤7：写入SR寄存器 ==========
-        logger.info(f"步骤7：写入SR寄存器[{SR_ID}]")
-        ret = arm.register.write_SR(SR_ID, hex_string)
-        if ret != StatusCodeEnum.OK:
-            error_msg = ret.errmsg if hasattr(ret, 'errmsg') else str(ret)
-            logger.error(f"写入SR寄存器[{SR_ID}]失败，错误代码：{error_msg}")
-            return {"success": False, "error": f"写入SR寄存器[{SR_ID}]失败，错误代码：{error_msg}"}
-        logger.info(f"成功写入SR寄存器[{SR_ID}]：'{hex_string}'")
+    if _async_executor is None:
+        with _async_executor_lock:
+            if _async_executor is None:
+                _async_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_ARM_POOL_SIZE, thread_name_prefix="CM-async"
+                )
+    return _async_executor
 
-        # ========== 步骤8：返回成功信息 ==========
-        # 构建消息：显示原始值、截断后的整数值和十六进制结果
-        original_display = f"{r_value}" if isinstance(r_value, int) or r_value == int_value else f"{r_value}（截断为{int_value}）"
-        return {
-            "success": True,
-            "message": f"R寄存器[{R_ID}]的值{original_display}已转换为十六进制'{hex_string}'并写入SR寄存器[{SR_ID}]"
-        }
 
-    except Exception as ex:
-        logger.error(f"DecToHex执行失败: {ex}", exc_info=True)
-        return {"success": False, "error": f"执行失败：{str(ex)}"}
+async def __run_in_thread(func, *args, **kwargs):
+    """
+    在线程池中执行同步函数（SDK调用或同步指令）并等待结果，不阻塞事件循环
+
+    参数：
+    - func: 同步函数
+    - args/kwargs: 调用参数
+
+    返回：
+    - 同步函数的返回值
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(__get_async_executor(), functools.partial(func, *args, **kwargs))
+
+
+def __async_instruction(func):
+    """
+    生成指令的异步版本：参数验证和执行逻辑与同步指令完全相同，在线程池中执行，
+    多个异步调用可同时等待，同时执行的调用数受连接池大小限制
+
+    参数：
+    - func: 同步指令函数
+
+    返回：
+    - 异步函数，名称为"指令名_async"
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await __run_in_thread(func, *args, **kwargs)
+    wrapper.__name__ = wrapper.__qualname__ = f"{func.__name__}_async"
+    return wrapper
+
+
+# 异步版本指令：供asyncio宿主程序await调用（不在__all__中，不注册为示教器指令）
+SetTF_async = __async_instruction(SetTF)
+SetUF_async = __async_instruction(SetUF)
+SetTF_R_async = __async_instruction(SetTF_R)
+SetUF_R_async = __async_instruction(SetUF_R)
+SetTF_PR_async = __async_instruction(SetTF_PR)
+SetUF_PR_async = __async_instruction(SetUF_PR)
+Incr_async = __async_instruction(Incr)
+Decr_async = __async_instruction(Decr)
+IncrBatch_async = __async_instruction(IncrBatch)
+Strp_async = __async_instruction(Strp)
+TFShift_async = __async_instruction(TFShift)
+DecToHex_async = __async_instruction(DecToHex)
+SaveSnapshot_async = __async_instruction(SaveSnapshot)
+RestoreSnapshot_async = __async_instruction(RestoreSnapshot)
+SetTFMulti_async = __async_instruction(SetTFMulti)
+SetUFMulti_async = __async_instruction(SetUFMulti)
+ExportFrames_async = __async_instruction(ExportFrames)
+ApplyFrames_async = __async_instruction(ApplyFrames)
+TxnCommit_async = __async_instruction(TxnCommit)
+TxnRollback_async = __async_instruction(TxnRollback)
+TFShiftArm_async = __async_instruction(TFShiftArm)
+TFShiftRun_async = __async_instruction(TFShiftRun)
+
+
+# 插件加载时按需启动连接预热
+if _WARMUP_ENABLED:
+    __start_warmup()
@@ -0,0 +1,84 @@
+"""
+SDK数据结构访问开销基准
+
+对比每次调用都用hasattr逐级判断（原实现）与插件中探测一次后直接访问的
+PR寄存器位姿/编号、坐标系姿态访问函数的单次调用耗时。
+
+用法：
+    python bench/bench_sdk_accessors.py [--number 200000]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests"))
+
+import fake_agilebot  # noqa: E402
+
+
+def ladder_pr_position(pr_register):
+    """原实现：逐级hasattr判断PR寄存器位姿"""
+    if hasattr(pr_register, 'poseRegisterData') and \
+       hasattr(pr_register.poseRegisterData, 'cartData') and \
+       hasattr(pr_register.poseRegisterData.cartData, 'position'):
+        return pr_register.poseRegisterData.cartData.position
+    return None
+
+
+def ladder_set_pr_index(pr_register, pr_id):
+    """原实现：逐个判断PR寄存器编号属性"""
+    if hasattr(pr_register, 'id'):
+        pr_register.id = pr_id
+    elif hasattr(pr_register, 'registerIndex'):
+        pr_register.registerIndex = pr_id
+    elif hasattr(pr_register, 'index'):
+        pr_register.index = pr_id
+
+
+def ladder_frame_pose(coordinate):
+    """原实现：每次判断坐标系姿态存储在orientation还是position上"""
+    if hasattr(coordinate, 'orientation'):
+        r_val = coordinate.orientation.r
+        p_val = coordinate.orientation.p
+        y_val = coordinate.orientation.y
+    else:
+        r_val = getattr(coordinate.position, 'r', 0.0)
+        p_val = getattr(coordinate.position, 'p', 0.0)
+        if hasattr(coordinate.position, 'yaw'):
+            y_val = coordinate.position.yaw
+        elif hasattr(coordinate.position, 'rotation_z'):
+            y_val = coordinate.position.rotation_z
+        else:
+            y_val = getattr(coordinate.position, 'c', 0.0)
+    return [coordinate.position.x, coordinate.position.y, coordinate.position.z, r_val, p_val, y_val]
+
+
+def run(number):
+    controller = fake_agilebot.Controller()
+    plugin_v2 = fake_agilebot.load_plugin(controller, "v2")
+    plugin_v1 = fake_agilebot.load_plugin(controller, "v1")
+    pr_register = fake_agilebot.PoseRegister(1)
+    coordinate = fake_agilebot.LegacyCoordinate(1)
+
+    cases = []
+    for label, plugin in (("CM.py", plugin_v2), ("CM_oldsdk.py", plugin_v1)):
+        pr_position = fake_agilebot.private(plugin, "__pr_position")
+        set_pr_index = fake_agilebot.private(plugin, "__set_pr_index")
+        cases.append((f"PR位姿 {label}", lambda: ladder_pr_position(pr_register), lambda f=pr_position: f(pr_register)))
+        cases.append((f"PR编号 {label}", lambda: ladder_set_pr_index(pr_register, 1), lambda f=set_pr_index: f(pr_register, 1)))
+    get_frame_pose = fake_agilebot.private(plugin_v1, "__get_frame_pose")
+    cases.append(("坐标系姿态 CM_oldsdk.py", lambda: ladder_frame_pose(coordinate), lambda: get_frame_pose(coordinate)))
+
+    print(f"{'项目':<24}{'原实现(us)':>12}{'探测后(us)':>12}")
+    for name, before, after in cases:
+        before_us = min(timeit.repeat(before, number=number, repeat=5)) / number * 1e6
+        after_us = min(timeit.repeat(after, number=number, repeat=5)) / number * 1e6
+        print(f"{name:<24}{before_us:>12.3f}{after_us:>12.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=200000, help="每轮调用次数")
+    run(parser.parse_args().number)
@@ -0,0 +1,371 @@
+"""
+TFShift变换计算基准与精度对比
+
+- 微基准：按TFShift的计算步骤比较插件中PrecisionTransform（原4x4矩阵）与RigidTransform（扁平刚体变换）
+  的单次耗时及结果差异（RigidTransform应与原实现逐位一致）；
+- 批量计算：PoseBatchEngine一次计算N组TFShift（NumPy可用时向量化，否则逐个用RigidTransform计算），
+  与逐个计算比较耗时及结果差异；
+- 四元数路径：QuaternionTransform（单位四元数 + 平移，只在输入输出时做欧拉角转换）与RigidTransform
+  分别计算TFShift，比较结果位姿，包括结果俯仰角P接近±90°（奇异）的情况。
+
+PoseBatchEngine与QuaternionTransform只用于本基准，插件本身不依赖它们：插件中的RigidTransform
+组合和求逆已不调用三角函数，欧拉角转换只在输入输出时进行。
+PoseBatchEngine经评估未纳入插件：插件中没有一次变换多个位姿的指令（TFShift/TFShiftRun每次只计算一组，
+Strp直接写入解析出的位姿），单组计算的耗时远小于一次SDK调用。
+QuaternionTransform经评估未纳入插件，TFShift继续使用矩阵路径：四元数路径每次计算并不更快，
+且P=±90°奇异附近的欧拉角提取误差大于矩阵路径。
+
+用法：
+    python bench/bench_transforms.py [--iterations 20000] [--samples 2000] [--seed 0]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests"))
+
+import fake_agilebot  # noqa: E402
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy不可用时批量计算回退为逐个使用RigidTransform计算
+    np = None
+
+CM = fake_agilebot.load_plugin(fake_agilebot.Controller(), "v2")
+PrecisionPose = CM.PrecisionPose
+PrecisionTransform = CM.PrecisionTransform
+RigidTransform = CM.RigidTransform
+
+
+class QuaternionTransform:
+    """
+    单位四元数 + 平移表示的刚体变换
+
+    只在位姿输入（from_pose_zyx）和输出（get_pose_zyx）时进行Z-Y-X欧拉角转换，
+    组合和求逆只做四元数乘法和向量旋转，不调用三角函数。接口与RigidTransform相同，可互相转换。
+    """
+    __slots__ = ("qw", "qx", "qy", "qz", "tx", "ty", "tz")
+
+    def __init__(self, qw=1.0, qx=0.0, qy=0.0, qz=0.0, tx=0.0, ty=0.0, tz=0.0):
+        self.qw, self.qx, self.qy, self.qz = qw, qx, qy, qz
+        self.tx, self.ty, self.tz = tx, ty, tz
+
+    @classmethod
+    def from_pose_zyx(cls, pose):
+        """从Z-Y-X欧拉角创建变换，旋转为 Rz(R) * Ry(P) * Rx(W)"""
+        half_w = math.radians(pose.W) * 0.5
+        half_p = math.radians(pose.P) * 0.5
+        half_r = math.radians(pose.R) * 0.5
+        cw, sw = math.cos(half_w), math.sin(half_w)
+        cp, sp = math.cos(half_p), math.sin(half_p)
+        cr, sr = math.cos(half_r), math.sin(half_r)
+        return cls(
+            cr * cp * cw + sr * sp * sw,
+            cr * cp * sw - sr * sp * cw,
+            cr * sp * cw + sr * cp * sw,
+            sr * cp * cw - cr * sp * sw,
+            pose.X, pose.Y, pose.Z,
+        )
+
+    def to_rigid(self):
+        """转换为RigidTransform"""
+        w, x, y, z = self.qw, self.qx, self.qy, self.qz
+        return RigidTransform([
+            1.0 - 2.0 * (y * y + z * z), 2.0 * (x * y - w * z), 2.0 * (x * z + w * y), self.tx,
+            2.0 * (x * y + w * z), 1.0 - 2.0 * (x * x + z * z), 2.0 * (y * z - w * x), self.ty,
+            2.0 * (x * z - w * y), 2.0 * (y * z + w * x), 1.0 - 2.0 * (x * x + y * y), self.tz,
+        ])
+
+    def get_pose_zyx(self):
+        """提取Z-Y-X欧拉角（只计算需要的旋转矩阵元素，奇异情况处理与PrecisionTransform相同）"""
+        w, x, y, z = self.qw, self.qx, self.qy, self.qz
+        r00 = 1.0 - 2.0 * (y * y + z * z)
+        r10 = 2.0 * (x * y + w * z)
+        r20 = 2.0 * (x * z - w * y)
+        pose = PrecisionPose()
+        pose.X, pose.Y, pose.Z = self.tx, self.ty, self.tz
+
+        sy = math.sqrt(r00 ** 2 + r10 ** 2)
+        if sy >= 1e-12:
+            pose.R = math.atan2(r10, r00)
+            pose.P = math.atan2(-r20, sy)
+            pose.W = math.atan2(2.0 * (y * z + w * x), 1.0 - 2.0 * (x * x + y * y))
+        else:
+            pose.R = math.atan2(-2.0 * (x * y - w * z), 1.0 - 2.0 * (x * x + z * z))
+            pose.P = math.atan2(-r20, sy)
+            pose.W = 0.0
+
+        pose.W = math.degrees(pose.W)
+        pose.P = math.degrees(pose.P)
+        pose.R = math.degrees(pose.R)
+        return pose
+
+    def _rotate(self, vx, vy, vz):
+        """用旋转部分旋转向量：v' = v + w*t + q×t，其中 t = 2*(q×v)"""
+        w, x, y, z = self.qw, self.qx, self.qy, self.qz
+        cx = 2.0 * (y * vz - z * vy)
+        cy = 2.0 * (z * vx - x * vz)
+        cz = 2.0 * (x * vy - y * vx)
+        return (
+            vx + w * cx + (y * cz - z * cy),
+            vy + w * cy + (z * cx - x * cz),
+            vz + w * cz + (x * cy - y * cx),
+        )
+
+    def __mul__(self, other):
+        """组合变换 self * other"""
+        aw, ax, ay, az = self.qw, self.qx, self.qy, self.qz
+        bw, bx, by, bz = other.qw, other.qx, other.qy, other.qz
+        vx, vy, vz = self._rotate(other.tx, other.ty, other.tz)
+        return QuaternionTransform(
+            aw * bw - ax * bx - ay * by - az * bz,
+            aw * bx + ax * bw + ay * bz - az * by,
+            aw * by - ax * bz + ay * bw + az * bx,
+            aw * bz + ax * by - ay * bx + az * bw,
+            self.tx + vx, self.ty + vy, self.tz + vz,
+        )
+
+    def inverse(self):
+        """求逆：共轭四元数，平移为 -R^T * t"""
+        conjugate = QuaternionTransform(self.qw, -self.qx, -self.qy, -self.qz)
+        vx, vy, vz = conjugate._rotate(self.tx, self.ty, self.tz)
+        conjugate.tx, conjugate.ty, conjugate.tz = -vx, -vy, -vz
+        return conjugate
+
+
+class PoseBatchEngine:
+    """
+    批量位姿变换引擎
+
+    一次处理N个XYZWPR位姿：位姿转换为变换、变换组合、求逆及Z-Y-X欧拉角提取。
+    NumPy可用时向量化计算，变换为(N,4,4)数组、位姿为(N,6)数组；
+    NumPy不可用时逐个使用RigidTransform计算，变换为RigidTransform列表、位姿为[X,Y,Z,W,P,R]列表的列表。
+    """
+
+    def __init__(self, use_numpy=True):
+        self.use_numpy = bool(use_numpy) and np is not None
+
+    def from_poses_zyx(self, poses):
+        """位姿批量转换为变换（对应PrecisionTransform.from_pose_zyx）"""
+        if not self.use_numpy:
+            return [RigidTransform.from_pose_zyx(PrecisionPose(pose)) for pose in poses]
+        poses = np.asarray(poses, dtype=float).reshape(-1, 6)
+        w, p, r = np.radians(poses[:, 3]), np.radians(poses[:, 4]), np.radians(poses[:, 5])
+        cosR, sinR = np.cos(r), np.sin(r)
+        cosP, sinP = np.cos(p), np.sin(p)
+        cosW, sinW = np.cos(w), np.sin(w)
+
+        transforms = np.zeros((len(poses), 4, 4))
+        transforms[:, 0, 0] = cosR * cosP
+        transforms[:, 0, 1] = cosR * sinP * sinW - sinR * cosW
+        transforms[:, 0, 2] = cosR * sinP * cosW + sinR * sinW
+        transforms[:, 1, 0] = sinR * cosP
+        transforms[:, 1, 1] = sinR * sinP * sinW + cosR * cosW
+        transforms[:, 1, 2] = sinR * sinP * cosW - cosR * sinW
+        transforms[:, 2, 0] = -sinP
+        transforms[:, 2, 1] = cosP * sinW
+        transforms[:, 2, 2] = cosP * cosW
+        transforms[:, :3, 3] = poses[:, :3]
+        transforms[:, 3, 3] = 1.0
+        return transforms
+
+    def to_poses_zyx(self, transforms):
+        """变换批量提取Z-Y-X欧拉角位姿（对应PrecisionTransform.get_pose_zyx，含奇异情况）"""
+        if not self.use_numpy:
+            return [transform.get_pose_zyx().to_list() for transform in transforms]
+        transforms = np.asarray(transforms, dtype=float).reshape(-1, 4, 4)
+        m00, m01, m10, m11 = transforms[:, 0, 0], transforms[:, 0, 1], transforms[:, 1, 0], transforms[:, 1, 1]
+        m20, m21, m22 = transforms[:, 2, 0], transforms[:, 2, 1], transforms[:, 2, 2]
+        sy = np.sqrt(m00 ** 2 + m10 ** 2)
+        regular = sy >= 1e-12
+
+        poses = np.empty((len(transforms), 6))
+        poses[:, :3] = transforms[:, :3, 3]
+        # 奇异情况（P=±90°）下W固定为0，R由第一、二行第二列计算
+        poses[:, 3] = np.degrees(np.where(regular, np.arctan2(m21, m22), 0.0))
+        poses[:, 4] = np.degrees(np.arctan2(-m20, sy))
+        poses[:, 5] = np.degrees(np.where(regular, np.arctan2(m10, m00), np.arctan2(-m01, m11)))
+        return poses
+
+    def compose(self, a, b):
+        """批量组合变换 a * b"""
+        if not self.use_numpy:
+            return [left * right for left, right in zip(a, b)]
+        return np.matmul(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+
+    def inverse(self, transforms):
+        """批量求逆（刚体变换：旋转部分转置，平移部分为 -R^T * t）"""
+        if not self.use_numpy:
+            return [transform.inverse() for transform in transforms]
+        transforms = np.asarray(transforms, dtype=float).reshape(-1, 4, 4)
+        rotation_t = np.transpose(transforms[:, :3, :3], (0, 2, 1))
+        inverses = np.zeros_like(transforms)
+        inverses[:, :3, :3] = rotation_t
+        inverses[:, :3, 3] = -np.einsum('nij,nj->ni', rotation_t, transforms[:, :3, 3])
+        inverses[:, 3, 3] = 1.0
+        return inverses
+
+
+def tfshift_chain(transform_cls, poses, as_transform=False):
+    """
+    按TFShift的计算步骤计算一次结果位姿
+
+    参数：
+    - transform_cls: PrecisionTransform、RigidTransform或QuaternionTransform
+    - poses: (基准工具坐标系, 示教位姿, 相机位姿, 实际视觉位姿) 四个PrecisionPose
+    - as_transform: 返回变换而不提取欧拉角
+
+    返回：
+    - PrecisionPose: 新工具坐标系相对于基准工具坐标系的位姿
+    """
+    T_UT0_UT1, T_UF1_UT1_PR2, T_UF1_C1, T_UF1_C2 = (transform_cls.from_pose_zyx(pose) for pose in poses)
+    T_UT1_C1 = T_UF1_UT1_PR2.inverse() * T_UF1_C1
+    T_UT1_C2 = T_UF1_UT1_PR2.inverse() * T_UF1_C2
+    T_UT0_UT2 = T_UT0_UT1 * T_UT1_C2 * T_UT1_C1.inverse()
+    return T_UT0_UT2 if as_transform else T_UT0_UT2.get_pose_zyx()
+
+
+def tfshift_chain_batch(engine, poses):
+    """
+    按TFShift的计算步骤批量计算结果位姿
+
+    参数：
+    - engine: PoseBatchEngine
+    - poses: 四组位姿（基准工具坐标系, 示教位姿, 相机位姿, 实际视觉位姿），每组为N个[X,Y,Z,W,P,R]
+
+    返回：
+    - N个结果位姿（(N,6)数组或列表的列表）
+    """
+    T_UT0_UT1, T_UF1_UT1_PR2, T_UF1_C1, T_UF1_C2 = (engine.from_poses_zyx(group) for group in poses)
+    T_UT1_UF1 = engine.inverse(T_UF1_UT1_PR2)
+    T_UT1_C1 = engine.compose(T_UT1_UF1, T_UF1_C1)
+    T_UT1_C2 = engine.compose(T_UT1_UF1, T_UF1_C2)
+    return engine.to_poses_zyx(engine.compose(engine.compose(T_UT0_UT1, T_UT1_C2), engine.inverse(T_UT1_C1)))
+
+
+def random_pose(rng, pitch=None):
+    """随机位姿，pitch不为None时固定俯仰角P"""
+    values = [rng.uniform(-500.0, 500.0) for _ in range(3)] + [rng.uniform(-180.0, 180.0) for _ in range(3)]
+    if pitch is not None:
+        values[4] = pitch
+    return PrecisionPose(values)
+
+
+def benchmark_transforms(iterations=20000, seed=0):
+    """
+    变换类微基准：比较PrecisionTransform、RigidTransform及PoseBatchEngine的TFShift计算耗时及结果差异
+
+    返回：
+    - dict: 每次计算的平均耗时（微秒）、加速比及与PrecisionTransform结果的最大差值
+      （RigidTransform应为0，批量引擎在浮点误差范围内）
+    """
+    rng = random.Random(seed)
+    inputs = [tuple(random_pose(rng) for _ in range(4)) for _ in range(min(iterations, 1000))]
+    report = {"iterations": iterations}
+    results = {}
+    for name, transform_cls in (("precision", PrecisionTransform), ("rigid", RigidTransform)):
+        start = time.perf_counter()
+        for index in range(iterations):
+            tfshift_chain(transform_cls, inputs[index % len(inputs)])
+        report[f"{name}_us"] = (time.perf_counter() - start) / iterations * 1e6
+        results[name] = [tfshift_chain(transform_cls, poses).to_list() for poses in inputs]
+    report["speedup"] = report["precision_us"] / report["rigid_us"] if report["rigid_us"] else 0.0
+    report["max_abs_diff"] = max(
+        abs(a - b) for old, new in zip(results["precision"], results["rigid"]) for a, b in zip(old, new)
+    )
+
+    # 批量引擎一次计算全部输入
+    engine = PoseBatchEngine()
+    groups = [[poses[index].to_list() for poses in inputs] for index in range(4)]
+    rounds = max(1, iterations // len(inputs))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        batch = tfshift_chain_batch(engine, groups)
+    report["batch_engine"] = "numpy" if engine.use_numpy else "python"
+    report["batch_us"] = (time.perf_counter() - start) / (rounds * len(inputs)) * 1e6
+    report["batch_max_abs_diff"] = float(max(
+        abs(a - b) for old, new in zip(results["precision"], batch) for a, b in zip(old, new)
+    ))
+    return report
+
+
+def compare_quaternion_path(samples=2000, seed=0):
+    """
+    四元数路径精度对比：用QuaternionTransform与RigidTransform（与原4x4矩阵计算逐位一致）分别计算TFShift，
+    比较结果位姿，并单独统计结果俯仰角P接近±90°（奇异）的情况
+
+    奇异附近W和R单独不唯一，旋转比较使用结果位姿重建的旋转矩阵元素差，欧拉角差只统计非奇异结果；
+    同时统计提取欧拉角前两种路径变换的差值，以及两种路径各自的欧拉角提取误差
+    （提取前的旋转矩阵与由提取结果重建的旋转矩阵之差），用于区分四元数计算误差与欧拉角提取本身的病态。
+
+    返回：
+    - dict: 变换、平移、旋转矩阵、欧拉角的最大差值，两种路径的欧拉角提取误差，奇异附近样本数及每次计算的平均耗时（微秒）
+    """
+    rng = random.Random(seed)
+    inputs = [tuple(random_pose(rng) for _ in range(4)) for _ in range(samples)]
+    # 结果位姿接近奇异：实际视觉位姿与基准视觉位姿相同（结果即基准工具坐标系），基准工具坐标系俯仰角接近±90°
+    for offset in (0.0, 1e-9, 1e-6, 1e-4, 1e-2):
+        for sign in (1.0, -1.0):
+            vision = random_pose(rng)
+            inputs.append((random_pose(rng, sign * (90.0 - offset)), random_pose(rng), vision, vision))
+
+    report = {"samples": len(inputs), "near_singular": 0,
+              "max_transform_diff": 0.0, "max_translation_diff": 0.0, "max_rotation_diff": 0.0, "max_euler_diff": 0.0,
+              "matrix_extraction_error": 0.0, "quaternion_extraction_error": 0.0}
+    rotation_index = (0, 1, 2, 4, 5, 6, 8, 9, 10)
+    for poses in inputs:
+        matrix_transform = tfshift_chain(RigidTransform, poses, as_transform=True)
+        matrix_pose = matrix_transform.get_pose_zyx()
+        quaternion_transform = tfshift_chain(QuaternionTransform, poses, as_transform=True)
+        quaternion_pose = quaternion_transform.get_pose_zyx()
+        quaternion_matrix = quaternion_transform.to_rigid().m
+        report["max_transform_diff"] = max(report["max_transform_diff"], *(
+            abs(a - b) for a, b in zip(matrix_transform.m, quaternion_matrix)
+        ))
+        old, new = matrix_pose.to_list(), quaternion_pose.to_list()
+        report["max_translation_diff"] = max(report["max_translation_diff"], *(abs(a - b) for a, b in zip(old[:3], new[:3])))
+        rotation_old = RigidTransform.from_pose_zyx(matrix_pose).m
+        rotation_new = RigidTransform.from_pose_zyx(quaternion_pose).m
+        report["max_rotation_diff"] = max(report["max_rotation_diff"], *(
+            abs(rotation_old[index] - rotation_new[index]) for index in rotation_index
+        ))
+        report["matrix_extraction_error"] = max(report["matrix_extraction_error"], *(
+            abs(rotation_old[index] - matrix_transform.m[index]) for index in rotation_index
+        ))
+        report["quaternion_extraction_error"] = max(report["quaternion_extraction_error"], *(
+            abs(rotation_new[index] - quaternion_matrix[index]) for index in rotation_index
+        ))
+        if abs(abs(old[4]) - 90.0) < 1e-3:
+            report["near_singular"] += 1
+        else:
+            report["max_euler_diff"] = max(report["max_euler_diff"], *(
+                min(abs(a - b), 360.0 - abs(a - b)) for a, b in zip(old[3:], new[3:])
+            ))
+
+    for name, transform_cls in (("matrix", RigidTransform), ("quaternion", QuaternionTransform)):
+        start = time.perf_counter()
+        for poses in inputs:
+            tfshift_chain(transform_cls, poses)
+        report[f"{name}_us"] = (time.perf_counter() - start) / len(inputs) * 1e6
+    return report
+
+
+def print_report(title, report):
+    print(title)
+    for key, value in report.items():
+        print(f"  {key:<28}{value:.6g}" if isinstance(value, float) else f"  {key:<28}{value}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TFShift变换计算基准与精度对比")
+    parser.add_argument("--iterations", type=int, default=20000, help="微基准计算次数")
+    parser.add_argument("--samples", type=int, default=2000, help="四元数精度对比随机样本数")
+    parser.add_argument("--seed", type=int, default=0, help="随机位姿种子")
+    args = parser.parse_args()
+    print_report("变换类微基准", benchmark_transforms(args.iterations, args.seed))
+    print_report("四元数路径精度对比", compare_quaternion_path(args.samples, args.seed))
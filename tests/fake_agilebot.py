@@ -0,0 +1,379 @@
+"""
+测试用Agilebot SDK替身
+
+在sys.modules中安装内存实现的Agilebot模块（SDK v2.0.0.0的Agilebot包，
+以及SDK v1.7.1.3的Agilebot.IR.A.*子模块），再按文件路径加载插件，
+无需连接真实控制器即可执行指令。所有SDK调用记录在Controller.calls中。
+"""
+
+import collections
+import copy
+import enum
+import importlib.util
+import itertools
+import os
+import sys
+import threading
+import time
+import types
+
+# 仓库根目录
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 插件文件路径
+PLUGIN_PATHS = {
+    "v2": os.path.join(REPO_ROOT, "CoordinateModifier（SDKV2.0.0.0）", "CM.py"),
+    "v1": os.path.join(REPO_ROOT, "CoordinateModifier（SDKV1.7.1.3）", "CM_oldsdk.py"),
+}
+
+_module_counter = itertools.count()
+
+# 当前控制器（新建Arm时绑定）
+_controller = None
+
+
+class StatusCodeEnum(enum.Enum):
+    OK = 0
+    CONTROLLER_ERROR = 1
+    INVALID_PARAMETER = 2
+    NOT_FOUND = 3
+
+    @property
+    def errmsg(self):
+        return self.name
+
+
+class RegTopicType(enum.Enum):
+    R = "R"
+    MR = "MR"
+    SR = "SR"
+    PR = "PR"
+
+
+class CoordinateSystemType(enum.Enum):
+    ToolFrame = 1
+    UserFrame = 2
+
+
+class _Data:
+    """无固定结构的数据对象"""
+
+
+class Position:
+    def __init__(self, x=0.0, y=0.0, z=0.0, a=0.0, b=0.0, c=0.0):
+        self.x, self.y, self.z, self.a, self.b, self.c = x, y, z, a, b, c
+
+
+class PoseRegister:
+    def __init__(self, id=0):
+        self.id = id
+        self.poseRegisterData = _Data()
+        self.poseRegisterData.cartData = _Data()
+        self.poseRegisterData.cartData.position = Position()
+
+
+class Coordinate:
+    def __init__(self, id=0, name="", comment="", data=None):
+        self.id = id
+        self.name = name
+        self.comment = comment
+        self.data = data or Position()
+
+
+class LegacyCoordinate:
+    """SDK v1.7.1.3的坐标系对象（位置在position，姿态在orientation.r/p/y）"""
+
+    def __init__(self, frame_id):
+        self.coordinate_info = _Data()
+        self.coordinate_info.coordinate_id = frame_id
+        self.position = _Data()
+        self.position.x = self.position.y = self.position.z = 0.0
+        self.orientation = _Data()
+        self.orientation.r = self.orientation.p = self.orientation.y = 0.0
+
+
+class Controller:
+    """
+    内存中的控制器状态
+
+    参数：
+    - race_delay: R寄存器读取返回前、写入生效前的延迟（秒），用于放大读改写竞争
+    - fail: {调用名或(调用名, 编号): StatusCodeEnum}，命中的调用直接返回该错误码
+    """
+
+    def __init__(self, race_delay=0.0, fail=None):
+        self.race_delay = race_delay
+        self.fail = dict(fail or {})
+        self.R = {}
+        self.SR = {}
+        self.PR = {}
+        self.TF = {i: Coordinate(i, f"tf{i}") for i in range(1, 31)}
+        self.UF = {i: Coordinate(i, f"uf{i}") for i in range(1, 31)}
+        self.legacy_frames = {
+            frame_type: {i: LegacyCoordinate(i) for i in range(1, 31)}
+            for frame_type in CoordinateSystemType
+        }
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def record(self, name, reg_id=None):
+        """记录一次SDK调用，返回配置的错误码（没有时返回None）"""
+        with self._lock:
+            self.calls.append(name)
+        return self.fail.get((name, reg_id), self.fail.get(name))
+
+    def counts(self):
+        """
+        各SDK调用的次数
+
+        返回：
+        - collections.Counter: {调用名: 次数}
+        """
+        with self._lock:
+            return collections.Counter(self.calls)
+
+    def reset_calls(self):
+        """清空调用记录"""
+        with self._lock:
+            self.calls.clear()
+
+
+class _Register:
+    def __init__(self, controller):
+        self._controller = controller
+
+    def read_R(self, reg_id):
+        error = self._controller.record("read_R", reg_id)
+        if error is not None:
+            return None, error
+        if reg_id not in self._controller.R:
+            return None, StatusCodeEnum.NOT_FOUND
+        value = self._controller.R[reg_id]
+        # 读到的值返回前让出执行，模拟读取与写入之间的网络往返
+        time.sleep(self._controller.race_delay)
+        return value, StatusCodeEnum.OK
+
+    def write_R(self, reg_id, value):
+        error = self._controller.record("write_R", reg_id)
+        if error is not None:
+            return error
+        time.sleep(self._controller.race_delay)
+        self._controller.R[reg_id] = value
+        return StatusCodeEnum.OK
+
+    def read_SR(self, reg_id):
+        error = self._controller.record("read_SR", reg_id)
+        if error is not None:
+            return None, error
+        if reg_id not in self._controller.SR:
+            return None, StatusCodeEnum.NOT_FOUND
+        return self._controller.SR[reg_id], StatusCodeEnum.OK
+
+    def write_SR(self, reg_id, value):
+        error = self._controller.record("write_SR", reg_id)
+        if error is not None:
+            return error
+        self._controller.SR[reg_id] = value
+        return StatusCodeEnum.OK
+
+    def read_PR(self, reg_id):
+        error = self._controller.record("read_PR", reg_id)
+        if error is not None:
+            return None, error
+        if reg_id not in self._controller.PR:
+            return None, StatusCodeEnum.NOT_FOUND
+        return copy.deepcopy(self._controller.PR[reg_id]), StatusCodeEnum.OK
+
+    def write_PR(self, pose_register):
+        error = self._controller.record("write_PR", pose_register.id)
+        if error is not None:
+            return error
+        self._controller.PR[pose_register.id] = copy.deepcopy(pose_register)
+        return StatusCodeEnum.OK
+
+
+class _Frames:
+    def __init__(self, controller, kind):
+        self._controller = controller
+        self._kind = kind
+
+    def _table(self):
+        return getattr(self._controller, self._kind)
+
+    def get(self, frame_id):
+        error = self._controller.record(f"{self._kind}.get", frame_id)
+        if error is not None:
+            return None, error
+        if frame_id not in self._table():
+            return None, StatusCodeEnum.NOT_FOUND
+        return copy.deepcopy(self._table()[frame_id]), StatusCodeEnum.OK
+
+    def update(self, coordinate):
+        error = self._controller.record(f"{self._kind}.update", coordinate.id)
+        if error is not None:
+            return error
+        self._table()[coordinate.id] = copy.deepcopy(coordinate)
+        return StatusCodeEnum.OK
+
+    def add(self, coordinate):
+        error = self._controller.record(f"{self._kind}.add")
+        if error is not None:
+            return error
+        self._table()[coordinate.id] = copy.deepcopy(coordinate)
+        return StatusCodeEnum.OK
+
+    def get_coordinate_list(self):
+        error = self._controller.record(f"{self._kind}.get_coordinate_list")
+        if error is not None:
+            return None, error
+        return [copy.deepcopy(frame) for _, frame in sorted(self._table().items())], StatusCodeEnum.OK
+
+
+class _CoordinateSystem:
+    def __init__(self, controller):
+        self.TF = _Frames(controller, "TF")
+        self.UF = _Frames(controller, "UF")
+
+
+class _LegacyCoordinateSystem:
+    def __init__(self, controller):
+        self._controller = controller
+
+    def get(self, frame_type, frame_id):
+        error = self._controller.record("coordinate_system.get")
+        if error is not None:
+            return None, error
+        frames = self._controller.legacy_frames[frame_type]
+        if frame_id not in frames:
+            return None, StatusCodeEnum.NOT_FOUND
+        return copy.deepcopy(frames[frame_id]), StatusCodeEnum.OK
+
+    def update(self, frame_type, coordinate):
+        error = self._controller.record("coordinate_system.update")
+        if error is not None:
+            return error
+        frames = self._controller.legacy_frames[frame_type]
+        frames[coordinate.coordinate_info.coordinate_id] = copy.deepcopy(coordinate)
+        return StatusCodeEnum.OK
+
+    def get_coordinate_list(self, frame_type):
+        error = self._controller.record("coordinate_system.get_coordinate_list")
+        if error is not None:
+            return None, error
+        frames = self._controller.legacy_frames[frame_type]
+        return [copy.deepcopy(frame) for _, frame in sorted(frames.items())], StatusCodeEnum.OK
+
+
+class _SubPub:
+    async def connect(self):
+        return StatusCodeEnum.NOT_FOUND
+
+
+class Arm:
+    def __init__(self):
+        self._controller = _controller
+        self.register = _Register(self._controller)
+        self.coordinate_system = _CoordinateSystem(self._controller)
+        self.sub_pub = _SubPub()
+        self._connected = False
+
+    def connect(self, ip):
+        error = self._controller.record("connect")
+        if error is not None:
+            return error
+        self._connected = True
+        return StatusCodeEnum.OK
+
+    def is_connected(self):
+        return self._connected
+
+    def disconnect(self):
+        self._connected = False
+
+
+class LegacyArm:
+    def __init__(self):
+        self._controller = _controller
+        self.register = _Register(self._controller)
+        self.coordinate_system = _LegacyCoordinateSystem(self._controller)
+        self._connected = False
+
+    def connect(self, ip):
+        error = self._controller.record("connect")
+        if error is not None:
+            return error
+        self._connected = True
+        return StatusCodeEnum.OK
+
+    def is_connect(self):
+        return self._connected
+
+    def disconnect(self):
+        self._connected = False
+
+
+class Extension:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def get_robot_ip(self):
+        return "127.0.0.1"
+
+
+def __module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    return module
+
+
+def install(controller):
+    """
+    安装Agilebot模块替身，之后新建的Arm都连接到controller
+
+    参数：
+    - controller: Controller对象
+    """
+    global _controller
+    _controller = controller
+    package = __module(
+        "Agilebot",
+        Arm=Arm, Coordinate=Coordinate, Extension=Extension, Position=Position,
+        PoseRegister=PoseRegister, RegTopicType=RegTopicType, StatusCodeEnum=StatusCodeEnum,
+    )
+    package.__path__ = []
+    modules = {
+        "Agilebot": package,
+        "Agilebot.IR": __module("Agilebot.IR", __path__=[]),
+        "Agilebot.IR.A": __module("Agilebot.IR.A", __path__=[]),
+        "Agilebot.IR.A.arm": __module("Agilebot.IR.A.arm", Arm=LegacyArm),
+        "Agilebot.IR.A.extension": __module("Agilebot.IR.A.extension", Extension=Extension),
+        "Agilebot.IR.A.status_code": __module("Agilebot.IR.A.status_code", StatusCodeEnum=StatusCodeEnum),
+        "Agilebot.IR.A.sdk_types": __module("Agilebot.IR.A.sdk_types", CoordinateSystemType=CoordinateSystemType),
+        "Agilebot.IR.A.sdk_classes": __module("Agilebot.IR.A.sdk_classes", PoseRegister=PoseRegister),
+    }
+    sys.modules.update(modules)
+
+
+def load_plugin(controller, version="v2"):
+    """
+    安装SDK替身并重新加载插件模块（每次返回独立的模块实例，连接与缓存互不影响）
+
+    参数：
+    - controller: Controller对象
+    - version: "v2"（CM.py）或"v1"（CM_oldsdk.py）
+
+    返回：
+    - module: 插件模块
+    """
+    install(controller)
+    path = PLUGIN_PATHS[version]
+    name = f"cm_plugin_{version}_{next(_module_counter)}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def private(module, name):
+    """获取插件模块的私有辅助函数（如"__pr_position"）"""
+    return module.__dict__[name]
@@ -0,0 +1,51 @@
+"""
+心跳日志：控制器不可达期间只在连接断开及恢复时记录，不随每次心跳重复记录
+（熔断器状态变化单独记录，频率受熔断时长的指数退避限制）
+"""
+
+import logging
+import time
+import unittest
+
+import fake_agilebot
+
+
+class HeartbeatLogTest(unittest.TestCase):
+
+    def test_unreachable_controller_logged_once(self):
+        controller = fake_agilebot.Controller()
+        plugin = fake_agilebot.load_plugin(controller, "v2")
+        plugin._HEARTBEAT_INTERVAL = 0.01
+        plugin._connect_breaker.base_delay = 0.02
+        plugin._connect_breaker.max_delay = 0.05
+        controller.R[1] = 0.0
+        self.assertTrue(plugin.Incr(1, 1.0)["success"])
+        session = plugin._arm_pool.sessions[0]
+        self.assertIsNotNone(session.arm)
+
+        with self.assertLogs(plugin.logger, logging.DEBUG) as logs:
+            controller.fail["connect"] = fake_agilebot.StatusCodeEnum.CONTROLLER_ERROR
+            session.arm.disconnect()
+            deadline = time.monotonic() + 2.0
+            while session.reconnect_failures < 20 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertGreaterEqual(session.reconnect_failures, 20)
+
+            del controller.fail["connect"]
+            while session.reconnect_failures and time.monotonic() < deadline + 2.0:
+                time.sleep(0.01)
+            self.assertEqual(session.reconnect_failures, 0)
+
+        messages = [
+            record.getMessage() for record in logs.records
+            if record.levelno >= logging.WARNING and "熔断器" not in record.getMessage()
+        ]
+        self.assertEqual(len(messages), 2, messages)
+        self.assertIn("断开", messages[0])
+        self.assertIn("重连失败", messages[1])
+        recovered = [record.getMessage() for record in logs.records if "重连成功" in record.getMessage()]
+        self.assertEqual(len(recovered), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Incr/Decr/IncrBatch并发负载测试
+
+替身SDK的read_R/write_R在读取与写入之间故意让出执行，不加锁的读改写会丢失更新；
+多线程并发调用插件指令后，R寄存器的最终值必须与调用次数精确一致。
+"""
+
+import concurrent.futures
+import threading
+import unittest
+
+import fake_agilebot
+
+# 读取返回前与写入生效前的延迟（秒）
+RACE_DELAY = 0.001
+
+THREADS = 8
+CALLS_PER_THREAD = 20
+
+
+def run_concurrently(*workers):
+    """同时启动全部worker，返回各worker的返回值列表"""
+    barrier = threading.Barrier(len(workers))
+
+    def start(worker):
+        barrier.wait()
+        return worker()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(workers)) as executor:
+        return [future.result() for future in [executor.submit(start, worker) for worker in workers]]
+
+
+class IncrConcurrencyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.controller = fake_agilebot.Controller(race_delay=RACE_DELAY)
+        self.plugin = fake_agilebot.load_plugin(self.controller, "v2")
+
+    def repeat(self, instruction, *args):
+        """连续调用指令CALLS_PER_THREAD次，返回失败的结果"""
+        def worker():
+            results = [instruction(*args) for _ in range(CALLS_PER_THREAD)]
+            return [result for result in results if not result["success"]]
+        return worker
+
+    def test_fake_register_loses_unlocked_updates(self):
+        """替身本身确实存在竞争：不加锁的读改写会丢失更新"""
+        self.controller.R[1] = 0.0
+        arm = fake_agilebot.Arm()
+
+        def unlocked_incr():
+            for _ in range(CALLS_PER_THREAD):
+                value, _ = arm.register.read_R(1)
+                arm.register.write_R(1, value + 1.0)
+
+        run_concurrently(*[unlocked_incr] * THREADS)
+        self.assertLess(self.controller.R[1], THREADS * CALLS_PER_THREAD)
+
+    def test_concurrent_incr_loses_nothing(self):
+        self.controller.R[1] = 0.0
+        failures = run_concurrently(*[self.repeat(self.plugin.Incr, 1, 1.0)] * THREADS)
+        self.assertEqual(sum(failures, []), [])
+        self.assertEqual(self.controller.R[1], THREADS * CALLS_PER_THREAD)
+
+    def test_concurrent_incr_and_decr(self):
+        self.controller.R[1] = 0.0
+        workers = [self.repeat(self.plugin.Incr, 1, 2.0)] * (THREADS // 2)
+        workers += [self.repeat(self.plugin.Decr, 1, 1.0)] * (THREADS // 2)
+        failures = run_concurrently(*workers)
+        self.assertEqual(sum(failures, []), [])
+        self.assertEqual(self.controller.R[1], (THREADS // 2) * CALLS_PER_THREAD * (2.0 - 1.0))
+
+    def test_incr_batch_with_single_incr(self):
+        """IncrBatch与Incr/Decr对重叠的R寄存器并发调用，互不丢失更新"""
+        for r_id in range(1, 6):
+            self.controller.R[r_id] = 0.0
+        workers = [self.repeat(self.plugin.IncrBatch, 1, 5, 1.0)] * 3
+        workers += [self.repeat(self.plugin.IncrBatch, 3, 3, 1.0)] * 2
+        workers += [self.repeat(self.plugin.Incr, 3, 1.0)] * 2
+        workers += [self.repeat(self.plugin.Decr, 5, 1.0)]
+        failures = run_concurrently(*workers)
+        self.assertEqual(sum(failures, []), [])
+        expected = {
+            1: 3 * CALLS_PER_THREAD,
+            2: 3 * CALLS_PER_THREAD,
+            3: 3 * CALLS_PER_THREAD + 2 * CALLS_PER_THREAD + 2 * CALLS_PER_THREAD,
+            4: 3 * CALLS_PER_THREAD + 2 * CALLS_PER_THREAD,
+            5: 3 * CALLS_PER_THREAD + 2 * CALLS_PER_THREAD - CALLS_PER_THREAD,
+        }
+        self.assertEqual({r_id: self.controller.R[r_id] for r_id in expected}, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
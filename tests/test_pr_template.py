@@ -0,0 +1,58 @@
+"""
+PR寄存器自动创建的RPC次数
+
+模板按连接缓存：首次创建读取模板，之后每次创建只需存在性读取、一次写入及一次可选的验证读取。
+"""
+
+import unittest
+
+import fake_agilebot
+
+COUNTED_CALLS = ("read_PR", "write_PR")
+
+
+class CreatePrRegisterTest(unittest.TestCase):
+
+    def load(self, version):
+        self.controller = fake_agilebot.Controller()
+        self.plugin = fake_agilebot.load_plugin(self.controller, version)
+        template = fake_agilebot.PoseRegister(3)
+        template.poseRegisterData.cartData.position.x = 12.5
+        self.controller.PR[3] = template
+        self.arm = fake_agilebot.LegacyArm() if version == "v1" else fake_agilebot.Arm()
+        self.create = fake_agilebot.private(self.plugin, "__create_pr_register")
+
+    def create_counted(self, pr_id, **kwargs):
+        self.controller.reset_calls()
+        pr_register, ret = self.create(self.arm, pr_id, **kwargs)
+        self.assertEqual(ret, fake_agilebot.StatusCodeEnum.OK)
+        counts = self.controller.counts()
+        return pr_register, {name: counts[name] for name in COUNTED_CALLS}
+
+    def check_round_trips(self, version):
+        self.load(version)
+        # 首次创建：存在性读取、PR[1]..PR[3]查找模板、写入、验证
+        pr_register, counts = self.create_counted(20)
+        self.assertEqual(counts, {"read_PR": 5, "write_PR": 1})
+        self.assertEqual(pr_register.id, 20)
+        self.assertEqual(self.controller.PR[20].poseRegisterData.cartData.position.x, 0.0)
+
+        _, counts = self.create_counted(21)
+        self.assertEqual(counts, {"read_PR": 2, "write_PR": 1})
+        _, counts = self.create_counted(22, verify=False)
+        self.assertEqual(counts, {"read_PR": 1, "write_PR": 1})
+        # 已存在时只读取
+        _, counts = self.create_counted(22)
+        self.assertEqual(counts, {"read_PR": 1, "write_PR": 0})
+        # 模板本身未被修改
+        self.assertEqual(self.controller.PR[3].poseRegisterData.cartData.position.x, 12.5)
+
+    def test_cm(self):
+        self.check_round_trips("v2")
+
+    def test_cm_oldsdk(self):
+        self.check_round_trips("v1")
+
+
+if __name__ == "__main__":
+    unittest.main()
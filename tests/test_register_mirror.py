@@ -0,0 +1,83 @@
+"""
+寄存器订阅消息解析及镜像预读
+
+订阅消息只按{"type", "id", "value"}一种格式解析，其他键名的消息不使镜像生效；
+预读借用连接池连接批量读取，不使用订阅线程的连接。
+"""
+
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+import fake_agilebot
+
+
+class RegisterMirrorMessageTest(unittest.TestCase):
+
+    def setUp(self):
+        with mock.patch.dict(os.environ, {"CM_REG_CACHE": "1"}):
+            self.controller = fake_agilebot.Controller()
+            self.plugin = fake_agilebot.load_plugin(self.controller, "v2")
+        self.cache = self.plugin._register_cache
+        self.cache.mark_watched([("R", 5), ("PR", 7)])
+
+    def test_payload_updates_watched_register(self):
+        self.assertFalse(self.cache.is_live())
+        self.assertTrue(self.cache.apply_message({"type": "R", "id": 5, "value": 1.5}))
+        self.assertTrue(self.cache.is_live())
+        self.assertEqual(self.cache.get("R", 5), (True, 1.5))
+
+    def test_payload_with_enum_type(self):
+        message = {"type": fake_agilebot.RegTopicType.R, "id": 5, "value": 2.5}
+        self.assertTrue(self.cache.apply_message(message))
+        self.assertEqual(self.cache.get("R", 5), (True, 2.5))
+
+    def test_other_keys_ignored(self):
+        for message in (
+            {"topic": "R", "index": 5, "value": 1.0},
+            {"type": "R", "index": 5, "value": 1.0},
+            {"type": "MR", "id": 5, "value": 1.0},
+            {"type": "R", "id": "5", "value": 1.0},
+            [("type", "R"), ("id", 5)],
+        ):
+            self.assertFalse(self.cache.apply_message(message), message)
+        self.assertFalse(self.cache.is_live())
+        self.assertEqual(self.cache.stats()["ignored"], 5)
+
+    def test_pose_register_message_invalidates(self):
+        self.cache.store("PR", 7, fake_agilebot.PoseRegister(7))
+        self.assertTrue(self.cache.apply_message({"type": "PR", "id": 7, "value": None}))
+        self.assertEqual(self.cache.get("PR", 7), (False, None))
+
+
+class RegisterMirrorSeedTest(unittest.TestCase):
+
+    def test_seed_reads_through_pool_session(self):
+        with mock.patch.dict(os.environ, {"CM_REG_MIRROR": "R:1-3"}):
+            controller = fake_agilebot.Controller()
+            plugin = fake_agilebot.load_plugin(controller, "v2")
+        controller.R.update({1: 1.0, 2: 2.0, 3: 3.0})
+        subscribed = []
+
+        async def subscribe_register(reg_type, reg_ids, frequency):
+            subscribed.append((reg_type, reg_ids, frequency))
+            return fake_agilebot.StatusCodeEnum.OK
+
+        seed = fake_agilebot.private(plugin, "__seed_register_mirror")
+        # 替身的订阅通道不可用：不启动订阅线程，直接执行一次预读
+        with mock.patch.dict(plugin.__dict__, {"__start_register_cache": lambda: None}):
+            asyncio.run(seed(subscribe_register))
+
+        self.assertEqual(subscribed, [(fake_agilebot.RegTopicType.R, [1, 2, 3], plugin._REG_CACHE_FREQUENCY)])
+        self.assertEqual(controller.counts()["read_R"], 3)
+        pool_stats = plugin._arm_pool.stats()
+        self.assertGreaterEqual(pool_stats["checkouts"], 1)
+        self.assertEqual(pool_stats["in_use"], 0)
+        with mock.patch.object(plugin._register_cache, "is_live", return_value=True):
+            self.assertEqual([plugin._register_cache.get("R", i) for i in (1, 2, 3)],
+                             [(True, 1.0), (True, 2.0), (True, 3.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
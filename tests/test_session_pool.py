@@ -0,0 +1,49 @@
+"""
+连接池借出：心跳持有会话锁（检查或重连中）时，try_checkout不等待，checkout不超过超时时间
+"""
+
+import time
+import unittest
+
+import fake_agilebot
+
+
+class SessionPoolCheckoutTest(unittest.TestCase):
+
+    def setUp(self):
+        self.plugin = fake_agilebot.load_plugin(fake_agilebot.Controller(), "v2")
+        self.pool = self.plugin.ArmSessionPool(2)
+
+    def test_try_checkout_skips_locked_session(self):
+        first, second = self.pool.sessions
+        first.lock.acquire()
+        try:
+            start = time.monotonic()
+            session = self.pool.try_checkout()
+            self.assertIs(session, second)
+            self.assertIsNone(self.pool.try_checkout())
+            self.assertLess(time.monotonic() - start, 0.1)
+            self.pool.release(session)
+        finally:
+            first.lock.release()
+        # 跳过的会话已放回空闲队列
+        sessions = [self.pool.try_checkout(), self.pool.try_checkout()]
+        self.assertEqual({session.index for session in sessions}, {0, 1})
+
+    def test_checkout_honours_timeout_on_locked_session(self):
+        pool = self.plugin.ArmSessionPool(1)
+        pool.sessions[0].lock.acquire()
+        try:
+            start = time.monotonic()
+            self.assertIsNone(pool.checkout(0.05))
+            self.assertLess(time.monotonic() - start, 0.5)
+            self.assertEqual(pool.stats()["timeouts"], 1)
+        finally:
+            pool.sessions[0].lock.release()
+        session = pool.checkout(0.05)
+        self.assertIs(session, pool.sessions[0])
+        pool.release(session)
+
+
+if __name__ == "__main__":
+    unittest.main()
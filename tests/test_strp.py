@@ -0,0 +1,110 @@
+"""
+Strp各结果的RPC次数
+
+每种结果分别统计首次调用（R寄存器是否存在未知，需要读取确认）与再次调用
+（已确认存在，跳过确认读取）的read_SR/read_R/write_R/read_PR/write_PR次数。
+R寄存器初值与写入值都不相同、两次调用的数据也不同，写入不会被跳过。
+"""
+
+import unittest
+
+import fake_agilebot
+
+SR_ID = 1
+R_ID_STATUS = 1
+R_ID_ERROR = 2
+PR_ID = 10
+
+COUNTED_CALLS = ("read_SR", "read_R", "write_R", "read_PR", "write_PR")
+
+
+class StrpRpcCountTest(unittest.TestCase):
+
+    def load(self, fail=None, pr_ids=(10, 11)):
+        self.controller = fake_agilebot.Controller(fail=fail)
+        self.plugin = fake_agilebot.load_plugin(self.controller, "v2")
+        self.controller.R[R_ID_STATUS] = 5.0
+        self.controller.R[R_ID_ERROR] = 5.0
+        for pr_id in pr_ids:
+            self.controller.PR[pr_id] = fake_agilebot.PoseRegister(pr_id)
+
+    def strp(self, sr_value):
+        """执行一次Strp，返回结果及各SDK调用次数"""
+        self.controller.SR[SR_ID] = sr_value
+        self.controller.reset_calls()
+        result = self.plugin.Strp(SR_ID, R_ID_STATUS, PR_ID, R_ID_ERROR)
+        counts = self.controller.counts()
+        return result, {name: counts[name] for name in COUNTED_CALLS}
+
+    def assertCalls(self, counts, read_SR=0, read_R=0, write_R=0, read_PR=0, write_PR=0):
+        self.assertEqual(counts, {
+            "read_SR": read_SR, "read_R": read_R, "write_R": write_R,
+            "read_PR": read_PR, "write_PR": write_PR,
+        })
+
+    def test_success(self):
+        self.load()
+        result, counts = self.strp("1,1,2,3,4,5,6")
+        self.assertTrue(result["success"], result)
+        self.assertCalls(counts, read_SR=1, read_R=2, write_R=2, read_PR=2, write_PR=2)
+
+        result, counts = self.strp("1,7,8,9,10,11,12")
+        self.assertTrue(result["success"], result)
+        self.assertCalls(counts, read_SR=1, write_R=2, read_PR=2, write_PR=2)
+        self.assertEqual(self.controller.R[R_ID_ERROR], 0)
+
+    def test_no_material(self):
+        self.load()
+        result, counts = self.strp("0")
+        self.assertFalse(result["success"])
+        self.assertCalls(counts, read_SR=1, read_R=2, write_R=2)
+
+        self.controller.R[R_ID_STATUS] = 5.0
+        self.controller.R[R_ID_ERROR] = 5.0
+        result, counts = self.strp("0")
+        self.assertFalse(result["success"])
+        self.assertCalls(counts, read_SR=1, write_R=2)
+
+    def test_parse_error(self):
+        self.load()
+        result, counts = self.strp("1,1,2")
+        self.assertFalse(result["success"])
+        self.assertCalls(counts, read_SR=1, read_R=2, write_R=2)
+        self.assertEqual(self.controller.R[R_ID_ERROR], 1)
+
+        self.controller.R[R_ID_STATUS] = 5.0
+        self.controller.R[R_ID_ERROR] = 5.0
+        result, counts = self.strp("1,a,2,3")
+        self.assertFalse(result["success"])
+        self.assertCalls(counts, read_SR=1, write_R=2)
+        self.assertEqual(self.controller.R[R_ID_ERROR], 1)
+
+    def test_missing_pr(self):
+        # 3组数据需要PR[10]-PR[12]，PR[12]不存在：读取全部PR后不写入任何PR
+        self.load()
+        result, counts = self.strp("1,1,2,3,4,5,6,7,8,9")
+        self.assertFalse(result["success"])
+        self.assertCalls(counts, read_SR=1, read_R=2, write_R=3, read_PR=3)
+        self.assertEqual(self.controller.R[R_ID_ERROR], 1)
+
+        result, counts = self.strp("1,9,8,7,6,5,4,3,2,1")
+        self.assertFalse(result["success"])
+        self.assertCalls(counts, read_SR=1, write_R=3, read_PR=3)
+
+    def test_partial_write(self):
+        # PR[11]写入失败：两个PR都尝试写入，报告失败并置R_ID_Error=1
+        self.load(fail={("write_PR", 11): fake_agilebot.StatusCodeEnum.CONTROLLER_ERROR})
+        result, counts = self.strp("1,1,2,3,4,5,6")
+        self.assertFalse(result["success"])
+        self.assertIn("PR[11]", result["error"])
+        self.assertCalls(counts, read_SR=1, read_R=2, write_R=3, read_PR=2, write_PR=2)
+        self.assertEqual(self.controller.R[R_ID_ERROR], 1)
+        self.assertEqual(self.controller.PR[10].poseRegisterData.cartData.position.x, 1.0)
+
+        result, counts = self.strp("1,7,8,9,10,11,12")
+        self.assertFalse(result["success"])
+        self.assertCalls(counts, read_SR=1, write_R=3, read_PR=2, write_PR=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+TFShiftRun基准上下文及坐标系缓存版本号
+
+缓存未开启时TFShiftRun沿用TFShiftArm保存的基准位姿，每次只读取实际视觉坐标及结果工具坐标系，
+重新执行TFShiftArm后才使用新的基准数据；寄存器镜像订阅通道失效时每次重新读取基准数据，
+补正结果必须与TFShift一致；坐标系缓存整表刷新时，只有值实际变化的坐标系版本号才增加。
+"""
+
+import collections
+import copy
+import os
+import unittest
+from unittest import mock
+
+import fake_agilebot
+
+INPUT_TF = 1
+RESULT_TF = 3
+EXPECTED_TF = 4
+CAM_POSE = 60
+REF_VIS = 61
+ACT_VIS = 62
+
+
+def set_pose(controller, pr_id, *values):
+    pr_register = fake_agilebot.PoseRegister(pr_id)
+    position = pr_register.poseRegisterData.cartData.position
+    position.x, position.y, position.z, position.a, position.b, position.c = values
+    controller.PR[pr_id] = pr_register
+
+
+def frame_pose(controller, frame_id):
+    data = controller.TF[frame_id].data
+    return [data.x, data.y, data.z, data.a, data.b, data.c]
+
+
+class TFShiftRunContextTest(unittest.TestCase):
+
+    def load(self, **env):
+        env = dict({"CM_REG_CACHE": "0", "CM_FRAME_CACHE": "0"}, **env)
+        with mock.patch.dict(os.environ, env):
+            self.controller = fake_agilebot.Controller()
+            self.plugin = fake_agilebot.load_plugin(self.controller, "v2")
+        set_pose(self.controller, CAM_POSE, 400.0, 0.0, 300.0, 180.0, 0.0, 0.0)
+        set_pose(self.controller, REF_VIS, 10.0, 20.0, 0.0, 0.0, 0.0, 15.0)
+        set_pose(self.controller, ACT_VIS, 12.0, 18.0, 0.0, 0.0, 0.0, 20.0)
+
+    def expected(self):
+        """TFShift每次读取全部基准数据，作为对照结果"""
+        result = self.plugin.TFShift(INPUT_TF, EXPECTED_TF, CAM_POSE, REF_VIS, ACT_VIS)
+        self.assertTrue(result["success"], result)
+        return frame_pose(self.controller, EXPECTED_TF)
+
+    def arm(self):
+        self.assertTrue(self.plugin.TFShiftArm(INPUT_TF, CAM_POSE, REF_VIS, 1)["success"])
+
+    def run_context(self):
+        self.controller.reset_calls()
+        result = self.plugin.TFShiftRun(RESULT_TF, ACT_VIS, 1)
+        self.assertTrue(result["success"], result)
+        return frame_pose(self.controller, RESULT_TF)
+
+    def run_calls(self):
+        counts = self.controller.counts()
+        return +collections.Counter({name: counts[name] for name in ("read_PR", "TF.get", "TF.get_coordinate_list")})
+
+    def check_context_reused(self, calls):
+        # 先执行TFShift：开启坐标系缓存时基准工具坐标系已在缓存中，TFShiftArm记录的版本号不再变化
+        armed = self.expected()
+        self.arm()
+        self.assertEqual(self.run_context(), armed)
+        self.assertEqual(self.run_calls(), calls)
+
+        # 基准数据修改后，未重新执行TFShiftArm时沿用上下文中的基准位姿
+        set_pose(self.controller, REF_VIS, 30.0, -5.0, 0.0, 0.0, 0.0, 40.0)
+        set_pose(self.controller, CAM_POSE, 420.0, 10.0, 300.0, 180.0, 0.0, 5.0)
+        self.assertEqual(self.run_context(), armed)
+        self.assertEqual(self.run_calls(), calls)
+
+        self.arm()
+        changed = self.expected()
+        self.assertNotEqual(changed, armed)
+        self.assertEqual(self.run_context(), changed)
+
+    def test_caches_off(self):
+        self.load()
+        self.check_context_reused(collections.Counter({"read_PR": 1, "TF.get": 1}))
+
+    def test_frame_cache_on(self):
+        self.load(CM_FRAME_CACHE="1")
+        # 结果工具坐标系由坐标系缓存命中
+        self.check_context_reused(collections.Counter({"read_PR": 1}))
+
+    def test_register_mirror_down_rereads_references(self):
+        self.load(CM_REG_CACHE="1")
+        # 替身的订阅通道不可用：不启动订阅线程，镜像始终处于失效状态
+        with mock.patch.dict(self.plugin.__dict__, {"__start_register_cache": lambda: None}):
+            self.arm()
+            self.assertEqual(self.run_context(), self.expected())
+
+            set_pose(self.controller, REF_VIS, 30.0, -5.0, 0.0, 0.0, 0.0, 40.0)
+            result = self.run_context()
+            self.assertEqual(self.run_calls()["read_PR"], 3)
+            self.assertEqual(result, self.expected())
+
+            set_pose(self.controller, CAM_POSE, 420.0, 10.0, 300.0, 180.0, 0.0, 5.0)
+            self.assertEqual(self.run_context(), self.expected())
+
+
+class FrameCacheVersionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.controller = fake_agilebot.Controller()
+        self.plugin = fake_agilebot.load_plugin(self.controller, "v2")
+        self.cache = self.plugin.FrameCache(5.0, fake_agilebot.private(self.plugin, "__object_signature"))
+
+    def frames(self):
+        return [copy.deepcopy(frame) for _, frame in sorted(self.controller.TF.items())]
+
+    def test_unchanged_list_refresh_keeps_versions(self):
+        self.cache.store_all("TF", self.frames())
+        versions = {i: self.cache.version("TF", i) for i in self.controller.TF}
+        self.assertEqual(set(versions.values()), {1})
+
+        self.cache.store_all("TF", self.frames())
+        self.cache.store("TF", self.frames()[0])
+        self.assertEqual({i: self.cache.version("TF", i) for i in self.controller.TF}, versions)
+
+    def test_changed_values_bump_version(self):
+        self.cache.store_all("TF", self.frames())
+        self.controller.TF[2].data.x = 1.5
+        self.controller.TF[3].comment = "changed"
+        self.cache.store_all("TF", self.frames())
+        self.assertEqual(self.cache.version("TF", 1), 1)
+        self.assertEqual(self.cache.version("TF", 2), 2)
+        self.assertEqual(self.cache.version("TF", 3), 2)
+
+        self.cache.invalidate("TF", 1)
+        self.cache.store_all("TF", self.frames())
+        self.assertEqual(self.cache.version("TF", 1), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
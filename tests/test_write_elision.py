@@ -0,0 +1,70 @@
+"""
+未变化写入跳过：默认关闭；开启后只与同一次指令调用中从控制器读取到的值比较，
+寄存器缓存中的旧值不会导致需要的写入被跳过；容差可通过CM_WRITE_TOLERANCE配置
+"""
+
+import os
+import unittest
+from unittest import mock
+
+import fake_agilebot
+
+
+class WriteElisionTest(unittest.TestCase):
+
+    def load(self, **env):
+        with mock.patch.dict(os.environ, env):
+            self.controller = fake_agilebot.Controller()
+            self.plugin = fake_agilebot.load_plugin(self.controller, "v2")
+        self.controller.R[1] = 2.0
+        self.controller.R[2] = 7.0
+        self.controller.SR[1] = "0"
+
+    def writes(self, instruction, *args):
+        self.controller.reset_calls()
+        result = instruction(*args)
+        self.assertTrue(result["success"], result)
+        return self.controller.counts()["write_R"]
+
+    def test_disabled_by_default(self):
+        self.load()
+        self.assertFalse(self.plugin._SKIP_UNCHANGED_WRITES)
+        self.assertEqual(self.writes(self.plugin.Incr, 1, 0.0), 1)
+
+    def test_enabled_elides_unchanged_write(self):
+        self.load(CM_SKIP_UNCHANGED="1")
+        self.assertEqual(self.writes(self.plugin.Incr, 1, 0.0), 0)
+        self.assertEqual(self.writes(self.plugin.Incr, 1, 1.0), 1)
+        self.assertEqual(self.controller.R[1], 3.0)
+
+    def test_tolerance_from_environment(self):
+        self.load(CM_SKIP_UNCHANGED="1", CM_WRITE_TOLERANCE="0.5")
+        self.assertEqual(self.plugin._WRITE_TOLERANCE, 0.5)
+        self.assertEqual(self.writes(self.plugin.Incr, 1, 0.25), 0)
+        self.assertEqual(self.writes(self.plugin.Incr, 1, 1.0), 1)
+
+    def test_invalid_tolerance_uses_default(self):
+        self.load(CM_WRITE_TOLERANCE="-1")
+        self.assertEqual(self.plugin._WRITE_TOLERANCE, 0.0005)
+
+    def test_cached_read_does_not_elide(self):
+        """寄存器缓存命中的读取不记录比较值：控制器上的值已被修改时仍然写入"""
+        self.load(CM_SKIP_UNCHANGED="1", CM_REG_CACHE="1")
+        register_cache = self.plugin._register_cache
+        # 替身的订阅通道不可用：不启动订阅线程，直接登记R[1]已订阅、通道有效
+        register_cache.begin_seed([("R", 1)])
+        register_cache.end_seed()
+        with mock.patch.dict(self.plugin.__dict__, {"__start_register_cache": lambda: None}), \
+                mock.patch.object(register_cache, "is_live", return_value=True):
+            self.assertEqual(self.writes(self.plugin.Incr, 1, 1.0), 1)
+            # 示教器把R[1]改为0，缓存仍是3.0（订阅消息尚未到达）
+            self.controller.R[1] = 0.0
+            hit, value = register_cache.get("R", 1)
+            self.assertTrue(hit)
+            self.assertEqual(value, 3.0)
+            self.assertEqual(self.writes(self.plugin.Incr, 1, 0.0), 1)
+        self.assertEqual(self.controller.R[1], 3.0)
+
+
+if __name__ == "__main__":
+    unittest.main()